@@ -14,8 +14,11 @@ from .execution import (
     StateVector,
     adjust_measure,
     get_remote_result,
+    get_remote_result_async,
     run,
+    run_async,
     submit,
+    submit_async,
 )
 from .execution.devices import (
     ATOSDevice,
@@ -23,6 +26,7 @@ from .execution.devices import (
     GOOGLEDevice,
     IBMDevice,
     AZUREDevice,
+    MPQPDevice,
 )
 from .execution.simulated_devices import IBMSimulatedDevice
 from .execution.remote_handler import get_all_job_ids
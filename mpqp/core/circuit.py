@@ -33,10 +33,9 @@ could be used to add CNOT gates to your circuit, using the two registers
 
 from __future__ import annotations
 
-from copy import deepcopy
+from copy import copy, deepcopy
 from numbers import Complex
-from pickle import dumps
-from typing import TYPE_CHECKING, Iterable, Optional, Sequence, Type
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Sequence, Type
 from warnings import warn
 
 import numpy as np
@@ -49,14 +48,15 @@ from mpqp.core.instruction.breakpoint import Breakpoint
 from mpqp.core.instruction.gates import ControlledGate, CRk, Gate, Id
 from mpqp.core.instruction.gates.custom_gate import CustomGate
 from mpqp.core.instruction.gates.gate_definition import UnitaryMatrix
+from mpqp.core.instruction.gates.native_gates import NativeGate
 from mpqp.core.instruction.gates.parametrized_gate import ParametrizedGate
 from mpqp.core.instruction.measurement import BasisMeasure, Measure
 from mpqp.core.instruction.measurement.expectation_value import ExpectationMeasure
 from mpqp.core.languages import Language
 from mpqp.noise.noise_model import DimensionalNoiseModel, NoiseModel
 from mpqp.tools.errors import NonReversibleWarning, NumberQubitsError
-from mpqp.tools.generics import OneOrMany
-from mpqp.tools.maths import matrix_eq
+from mpqp.tools.generics import OneOrMany, structural_key
+from mpqp.tools.maths import apply_matrix, fuse_gates, matrix_eq
 
 if TYPE_CHECKING:
     from braket.circuits import Circuit as braket_Circuit
@@ -133,8 +133,8 @@ class QCircuit:
         """See parameter description."""
         self.label = label
         """See parameter description."""
-        self.instructions: list[Instruction] = []
-        """List of instructions of the circuit."""
+        self._depth_tracker: Optional[_DepthTracker] = None
+        self.instructions = []
         self.noises: list[NoiseModel] = []
         """List of noise models attached to the circuit."""
         self._nb_qubits: int
@@ -164,8 +164,57 @@ class QCircuit:
                 self._nb_qubits = nb_qubits
             self.add(deepcopy(data))
 
+    def _fingerprint(self) -> tuple[Any, ...]:
+        """Structural key of the circuit (see
+        :func:`~mpqp.tools.generics.structural_key`), backing :meth:`__eq__`
+        and :meth:`__hash__`. The global phase, a by-product of the
+        conversions of the circuit, is not part of it, so that the conversions
+        cached under this key are found again once it is updated.
+
+        The key is recomputed at each call, since the instructions of the
+        circuit can be modified in place."""
+        return (
+            type(self),
+            self.nb_qubits,
+            self.nb_cbits,
+            self.label,
+            tuple(structural_key(instruction) for instruction in self.instructions),
+            tuple(structural_key(noise) for noise in self.noises),
+        )
+
     def __eq__(self, value: object) -> bool:
-        return dumps(self) == dumps(value)
+        """Two circuits are equal if they have the same size, label and global
+        phase, and the same instructions and noise models, in the same order.
+
+        Examples:
+            >>> QCircuit([H(0), CNOT(0, 1)]) == QCircuit([H(0), CNOT(0, 1)])
+            True
+            >>> QCircuit([H(0), CNOT(0, 1)]) == QCircuit([H(0), CNOT(1, 0)])
+            False
+            >>> shifted = QCircuit([H(0), CNOT(0, 1)])
+            >>> shifted.gphase = np.pi
+            >>> QCircuit([H(0), CNOT(0, 1)]) == shifted
+            False
+
+        """
+        if not isinstance(value, QCircuit):
+            return False
+        return self is value or (
+            self.gphase == value.gphase and self._fingerprint() == value._fingerprint()
+        )
+
+    def __hash__(self) -> int:
+        """The hash of a circuit is computed from its content, like
+        :meth:`__eq__`. Since a circuit is mutable, a circuit used as a
+        dictionary key or in a set must not be modified afterwards: its hash
+        would change and it would not be found anymore.
+
+        Example:
+            >>> len({QCircuit([X(0)]), QCircuit([X(0)]), QCircuit([Y(0)])})
+            2
+
+        """
+        return hash(self._fingerprint())
 
     def add(self, components: OneOrMany[Instruction | NoiseModel]):
         """Adds a ``component`` or a list of ``component`` at the end of the
@@ -210,6 +259,10 @@ class QCircuit:
                 self.add(comp)
             return
 
+        tracker_up_to_date = self._depth_tracker is not None and (
+            self._depth_tracker.is_synchronized_with(self._instructions)
+        )
+
         if any(conn >= self.nb_qubits for conn in components.connections()):
             component_type = (
                 "Instruction" if isinstance(components, Instruction) else "Noise model"
@@ -237,6 +290,12 @@ class QCircuit:
             self.noises.append(components)
         else:
             self.instructions.append(components)
+            if tracker_up_to_date:
+                assert self._depth_tracker is not None
+                self._depth_tracker.update([components])
+                self._depth_tracker.synchronize_with(self._instructions)
+            else:
+                self._depth_tracker = None
 
     def _check_components_targets(self, components: Instruction | NoiseModel):
         if isinstance(components, BasisMeasure):
@@ -341,6 +400,16 @@ class QCircuit:
 
         return component
 
+    @property
+    def instructions(self) -> list[Instruction]:
+        """List of instructions of the circuit."""
+        return self._instructions
+
+    @instructions.setter
+    def instructions(self, instructions: list[Instruction]):
+        self._instructions = _InstructionList(instructions)
+        self._depth_tracker = None
+
     @property
     def nb_qubits(self) -> int:
         """Number of qubits of the circuit."""
@@ -349,6 +418,7 @@ class QCircuit:
     @nb_qubits.setter
     def nb_qubits(self, nb_qubits: int):
         self._nb_qubits = nb_qubits
+        self._depth_tracker = None
 
         for noise in self.noises:
             if noise._dynamic:  # pyright: ignore[reportPrivateUsage]
@@ -574,8 +644,29 @@ class QCircuit:
         """
         return self.nb_qubits, (self.nb_cbits or 0)
 
+    def _tracker(self) -> _DepthTracker:
+        """Returns the depth tracker of this circuit, kept up to date by
+        :meth:`add` and rebuilt when the instructions were modified otherwise."""
+        tracker = self._depth_tracker
+        if tracker is None or not tracker.is_synchronized_with(self._instructions):
+            tracker = _DepthTracker(self.nb_qubits)
+            tracker.update(self._instructions)
+            tracker.synchronize_with(self._instructions)
+            self._depth_tracker = tracker
+        return tracker
+
     def depth(self) -> int:
-        """Computes the depth of the circuit.
+        """Computes the depth of the circuit, *i.e.* the number of layers of
+        gates, the gates of a layer acting on disjoint qubits. Measurements are
+        not taken into account, and a barrier forces all the gates after it to
+        be placed after the gates before it.
+
+        The depth is computed in a single pass over the instructions, keeping
+        only the current depth of each qubit. It is then cached and updated by
+        :meth:`add`, any other modification of the instructions (replacing,
+        inserting or retargeting one, resizing the circuit, ...) triggering a
+        new pass. Modifying in place the ``targets`` list of an instruction
+        is not detected, reassign it instead.
 
         Returns:
             Depth of the circuit.
@@ -587,31 +678,40 @@ class QCircuit:
             4
 
         """
-        if len(self) == 0:
-            return 0
+        return self._tracker().depth
 
-        nb_qubits = self.nb_qubits
-        instructions = self.without_measurements().instructions
-        layers = np.zeros((nb_qubits, self.count_gates()), dtype=bool)
-
-        current_layer = 0
-        last_barrier = 0
-        for instr in instructions:
-            if isinstance(instr, Barrier):
-                last_barrier = current_layer
-                current_layer += 1
-                continue
-            conns = list(instr.connections())
-            if any(layers[conns, current_layer]):
-                current_layer += 1
-            fitting_layer_index = current_layer
-            for index in range(current_layer, last_barrier - 1, -1):
-                if any(layers[conns, index]):
-                    fitting_layer_index = index + 1
-                    break
-            layers[conns, fitting_layer_index] = [True] * len(conns)
-
-        return current_layer + 1
+    def two_qubit_depth(self) -> int:
+        """Computes the depth of the circuit when only the gates acting on
+        several qubits are counted, these gates being usually the most costly
+        and noisy ones on hardware.
+
+        Returns:
+            Depth of the circuit restricted to its multi-qubit gates.
+
+        Examples:
+            >>> circuit = QCircuit([H(0), CNOT(0, 1), H(1), H(1), CNOT(1, 2), X(0)])
+            >>> circuit.depth(), circuit.two_qubit_depth()
+            (5, 2)
+
+        """
+        return self._tracker().two_qubit_depth
+
+    def critical_path(self) -> list[Gate]:
+        """Returns a longest chain of dependent gates of the circuit, of length
+        :meth:`depth`. Optimizing the gates of this chain is needed to reduce the
+        depth of the circuit.
+
+        Returns:
+            The gates of the critical path, in order of application.
+
+        Examples:
+            >>> QCircuit([H(0), CNOT(0, 1), X(2), CNOT(1, 2), Y(0), Y(2)]).critical_path()
+            [H(0), CNOT(0, 1), CNOT(1, 2), Y(2)]
+            >>> QCircuit(2).critical_path()
+            []
+
+        """
+        return self._tracker().critical_path()
 
     def __len__(self) -> int:
         """Returns the number of instructions added to this circuit.
@@ -653,32 +753,85 @@ class QCircuit:
         return matrix_eq(self.to_matrix(), circuit.to_matrix())
 
     def optimize(self, criteria: Optional[OneOrMany[str]] = None) -> QCircuit:
-        """Optimize the circuit to satisfy some criteria (depth, number of
-        qubits, gate restriction) in parameter.
+        """Optimize the circuit by applying peephole passes on its gates.
+
+        The available passes (see
+        :data:`~mpqp.tools.optimization.OPTIMIZATION_PASSES`) are:
+
+        - ``"identities"``: removes the ``Id`` gates;
+        - ``"involutions"``: cancels pairs of consecutive identical
+          involutions (``H H``, ``CNOT CNOT``, ...);
+        - ``"rotations"``: merges consecutive ``Rx``, ``Ry``, ``Rz``, ``P``
+          and ``CP`` of the same kind on the same qubits;
+        - ``"single_qubit_fusion"``: fuses each run of single-qubit gates in
+          a single ``U`` gate, the global phase being kept in the first fused
+          gate. Not applied by default;
+        - ``"block_fusion"``: fuses neighbouring gates in dense
+          :class:`~mpqp.core.instruction.gates.custom_gate.CustomGate` blocks
+          of at most 3 qubits, to speed up local simulations. Not applied by
+          default.
+
+        The selected passes are repeated until the number of instructions
+        stops decreasing. Measurements and barriers are kept as is, and block
+        the rewriting of the gates around them.
+
+        Since removing or fusing gates changes the gates the noise models of
+        the circuit apply to, noisy circuits are not optimized (a warning is
+        raised and an unchanged copy is returned).
 
         Args:
-            criteria: String, or list of strings, regrouping the criteria of optimization of the circuit.
+            criteria: Name, or list of names, of the passes to apply. The exact
+                passes (``"identities"``, ``"involutions"`` and
+                ``"rotations"``) are applied by default.
 
         Returns:
-            the optimized QCircuit
+            The optimized circuit, the current one is left untouched.
+
+        Raises:
+            ValueError: If one of the criteria is not a known pass.
 
         Examples:
-            >>>
-            >>>
-            >>>
+            >>> circuit = QCircuit([H(0), H(0), Rz(0.5, 1), Rz(0.25, 1), CNOT(0, 1), Id(1)])
+            >>> print(circuit.optimize(["identities", "involutions", "rotations"]))  # doctest: +NORMALIZE_WHITESPACE
+            q_0: ──────────────■──
+                 ┌──────────┐┌─┴─┐
+            q_1: ┤ Rz(0.75) ├┤ X ├
+                 └──────────┘└───┘
+            >>> circuit = QCircuit([H(0), X(0), H(0), CNOT(0, 1), X(1), Y(1)])
+            >>> fused = circuit.optimize("single_qubit_fusion")
+            >>> len(fused.gates), fused.is_equivalent(circuit)
+            (4, True)
+            >>> len(QCircuit([P(0.5, 0), Barrier(), P(0.5, 0)]).optimize().gates)
+            2
 
-        # 6M-TODO implement, example and test
         """
-        # ideas: a circuit can be optimized
-        # - to reduce the depth of the circuit (combine gates, simplify some sequences)
-        # - according to a given topology or qubits connectivity map
-        # - to avoid the use of some gates (imperfect or more noisy)
-        # - to avoid multi-qubit gates
-        ...
+        from mpqp.tools.optimization import optimize_instructions
 
-    def to_matrix(self) -> npt.NDArray[np.complex64]:
+        optimized = deepcopy(self)
+        if len(self.noises) != 0:
+            warn(
+                "The circuit contains noise models, optimizing its gates would "
+                "change the gates the noise applies to. It was left unchanged."
+            )
+            return optimized
+        optimized.instructions = optimize_instructions(optimized.instructions, criteria)
+        return optimized
+
+    def to_matrix(self, fusion_size: int = 2) -> npt.NDArray[np.complex64]:
         """Compute the unitary matrix associated to this circuit.
 
+        The matrix is computed without relying on any provider: the operator
+        of the circuit is stored as a tensor of shape ``(2,)*2n`` and the
+        canonical matrix of each gate is contracted on the axes of the qubits
+        it acts on. Beforehand, consecutive gates acting together on at most
+        ``fusion_size`` qubits are fused in a single small block, so that the
+        (expensive) contraction with the full operator is done once per block
+        instead of once per gate.
+
+        Args:
+            fusion_size: Maximal number of qubits spanned by a block of fused
+                gates. Set it to ``0`` to disable the fusion.
+
         Returns:
             a unitary matrix representing this circuit
 
@@ -691,17 +844,11 @@ class QCircuit:
              [0.70711, 0      , -0.70711, 0       ]]
 
         """
-        from qiskit import QuantumCircuit
-        from qiskit.quantum_info.operators import Operator
-
-        qiskit_circuit = self.to_other_language(Language.QISKIT)
-        if TYPE_CHECKING:
-            assert isinstance(qiskit_circuit, QuantumCircuit)
-        matrix = Operator.from_circuit(qiskit_circuit).reverse_qargs().to_matrix()
-        if TYPE_CHECKING:
-            assert isinstance(matrix, np.ndarray)
-
-        return matrix
+        nb_qubits = self.nb_qubits
+        operator = np.eye(2**nb_qubits, dtype=complex).reshape((2,) * 2 * nb_qubits)
+        for matrix, qubits in fuse_gates(self.gates, fusion_size):
+            operator = apply_matrix(operator, matrix, qubits)
+        return operator.reshape(2**nb_qubits, 2**nb_qubits)
 
     def inverse(self) -> QCircuit:
         """Generate the inverse (dagger) of this circuit.
@@ -937,6 +1084,58 @@ class QCircuit:
         new_circuit.noises = []
         return new_circuit
 
+    def light_cone(self, qubits: Sequence[int]) -> tuple[QCircuit, list[int]]:
+        """Restricts the circuit to the backward light cone of some qubits:
+        the gates that can influence the state of these qubits at the end of
+        the circuit. The other gates only act on qubits disconnected from the
+        ``qubits`` in parameter, so they cannot change the measurements done on
+        these qubits.
+
+        The qubits of the light cone are relabelled in increasing order, so
+        the reduced circuit can be much narrower than this one. Only the gates
+        are kept: the measurements, barriers, breakpoints and noise models are
+        not part of the reduced circuit.
+
+        Args:
+            qubits: The qubits from which the light cone is computed.
+
+        Returns:
+            The reduced circuit, and the qubit of this circuit corresponding to
+            each qubit of the reduced one.
+
+        Example:
+            >>> circuit = QCircuit([H(0), CNOT(0, 2), H(1), CNOT(1, 3), X(3), Z(2)])
+            >>> reduced, qubits = circuit.light_cone([2])
+            >>> print(reduced)  # doctest: +NORMALIZE_WHITESPACE
+                 ┌───┐
+            q_0: ┤ H ├──■───────
+                 └───┘┌─┴─┐┌───┐
+            q_1: ─────┤ X ├┤ Z ├
+                      └───┘└───┘
+            >>> qubits
+            [0, 2]
+
+        """
+        cone = set(qubits)
+        gates = []
+        for gate in reversed(self.gates):
+            connections = gate.connections()
+            if not cone.isdisjoint(connections):
+                cone |= connections
+                gates.append(gate)
+        cone_qubits = sorted(cone)
+        relabelling = {qubit: index for index, qubit in enumerate(cone_qubits)}
+
+        reduced = QCircuit(len(cone_qubits), label=self.label)
+        reduced.gphase = self.gphase
+        for gate in reversed(gates):
+            gate = deepcopy(gate)
+            gate.targets = [relabelling[qubit] for qubit in gate.targets]
+            if isinstance(gate, ControlledGate):
+                gate.controls = [relabelling[qubit] for qubit in gate.controls]
+            reduced.add(gate)
+        return reduced, cone_qubits
+
     def to_other_language(
         self,
         language: Language = Language.QISKIT,
@@ -1001,8 +1200,44 @@ class QCircuit:
             object. For this reason, you will find the noise included in the Braket
             circuits.
 
+        Note:
+            The conversions are cached in
+            :data:`~mpqp.core.conversion_cache.CONVERSION_CACHE`, keyed by the
+            structure of the circuit: converting again an identical circuit
+            returns a copy of the previous conversion (circuits other than
+            OpenQASM codes are only stored once they have been converted
+            twice). The translation warnings
+            raised by the conversion are raised again each time it is retrieved
+            from the cache.
+
         """
+        from mpqp.core.conversion_cache import CONVERSION_CACHE
 
+        if not CONVERSION_CACHE.enabled:
+            return self._to_other_language(language, cirq_proc_id, translation_warning)
+
+        def convert():
+            converted = self._to_other_language(
+                language, cirq_proc_id, translation_warning
+            )
+            return converted, self.gphase
+
+        converted, gphase = CONVERSION_CACHE.get_or_convert(
+            (self._fingerprint(), language, cirq_proc_id, translation_warning),
+            convert,
+        )
+        if language != Language.QISKIT:
+            # all the other conversions go through OpenQASM and set the phase
+            self.gphase = gphase
+        return converted
+
+    def _to_other_language(
+        self,
+        language: Language = Language.QISKIT,
+        cirq_proc_id: Optional[str] = None,
+        translation_warning: bool = True,
+    ) -> QuantumCircuit | myQLM_Circuit | braket_Circuit | cirq_Circuit | str:
+        """Uncached version of :meth:`to_other_language`."""
         if language == Language.QISKIT:
             from qiskit.circuit import Operation, QuantumCircuit
             from qiskit.circuit.quantumcircuit import CircuitInstruction
@@ -1083,6 +1318,13 @@ class QCircuit:
             return new_circ
 
         elif language == Language.MY_QLM:
+            if self._only_numeric_native_gates():
+                from mpqp.execution.providers.atos import mpqp_to_myqlm_Circuit
+
+                self.gphase = 0
+                return mpqp_to_myqlm_Circuit(self)
+
+            # custom gates go through OpenQASM 2
             cleaned_circuit = self.without_measurements()
             qasm2_code = cleaned_circuit.to_other_language(Language.QASM2)
             self.gphase = cleaned_circuit.gphase
@@ -1094,7 +1336,28 @@ class QCircuit:
             return myqlm_circuit
 
         elif language == Language.BRAKET:
-            # filling the circuit with identity gates when some qubits don't have any instruction
+            from mpqp.execution.providers.aws import (
+                apply_noise_to_braket_circuit,
+                mpqp_to_braket_Circuit,
+            )
+
+            if len(self.noises) != 0:
+                if any(isinstance(instr, CRk) for instr in self.instructions):
+                    raise NotImplementedError(
+                        "Cannot simulate noisy circuit with CRk gate due to "
+                        "an error on AWS Braket side."
+                    )
+
+            if self._only_numeric_native_gates():
+                braket_circuit = mpqp_to_braket_Circuit(self)
+                self.gphase = 0
+                return apply_noise_to_braket_circuit(
+                    braket_circuit, self.noises, self.nb_qubits
+                )
+
+            # otherwise (custom gates, symbolic parameters), the circuit goes
+            # through OpenQASM 3, filling the circuit with identity gates when
+            # some qubits don't have any instruction
             used_qubits = set().union(
                 *(
                     inst.connections()
@@ -1111,15 +1374,6 @@ class QCircuit:
                 nb_qubits=self.nb_qubits,
             ) + deepcopy(self)
 
-            from mpqp.execution.providers.aws import apply_noise_to_braket_circuit
-
-            if len(self.noises) != 0:
-                if any(isinstance(instr, CRk) for instr in self.instructions):
-                    raise NotImplementedError(
-                        "Cannot simulate noisy circuit with CRk gate due to "
-                        "an error on AWS Braket side."
-                    )
-
             qasm3_code = circuit.to_other_language(
                 Language.QASM3, translation_warning=False
             )
@@ -1134,12 +1388,19 @@ class QCircuit:
                 self.nb_qubits,
             )
         elif language == Language.CIRQ:
-            qasm2_code = self.to_other_language(Language.QASM2)
-            if TYPE_CHECKING:
-                assert isinstance(qasm2_code, str)
-            from mpqp.qasm.qasm_to_cirq import qasm2_to_cirq_Circuit
+            if self._only_numeric_native_gates():
+                from mpqp.execution.providers.google import mpqp_to_cirq_Circuit
 
-            cirq_circuit = qasm2_to_cirq_Circuit(qasm2_code)
+                self.gphase = 0
+                cirq_circuit = mpqp_to_cirq_Circuit(self)
+            else:
+                # custom gates go through OpenQASM 2
+                qasm2_code = self.to_other_language(Language.QASM2)
+                if TYPE_CHECKING:
+                    assert isinstance(qasm2_code, str)
+                from mpqp.qasm.qasm_to_cirq import qasm2_to_cirq_Circuit
+
+                cirq_circuit = qasm2_to_cirq_Circuit(qasm2_code)
             if cirq_proc_id:
                 from cirq.transformers.optimize_for_target_gateset import (
                     optimize_for_target_gateset,
@@ -1175,18 +1436,28 @@ class QCircuit:
             self.gphase = gphase
             return qasm_str
         elif language == Language.QASM3:
-            qasm2_code = self.to_other_language(Language.QASM2)
-            if TYPE_CHECKING:
-                assert isinstance(qasm2_code, str)
-            from mpqp.qasm.open_qasm_2_and_3 import open_qasm_2_to_3
+            from mpqp.qasm.mpqp_to_qasm import mpqp_to_qasm3
 
-            qasm3_code = open_qasm_2_to_3(
-                qasm2_code, translation_warning=translation_warning
-            )
+            qasm3_code, gphase = mpqp_to_qasm3(self, translation_warning)
+            self.gphase = gphase
             return qasm3_code
         else:
             raise NotImplementedError(f"Error: {language} is not supported")
 
+    def _only_numeric_native_gates(self) -> bool:
+        """Whether the circuit can be converted gate by gate by the direct
+        builders of the providers, i.e. if all its gates are native, with
+        numeric parameters."""
+        from sympy import Expr
+
+        return all(
+            isinstance(gate, NativeGate)
+            and not any(
+                isinstance(param, Expr) for param in getattr(gate, "parameters", [])
+            )
+            for gate in self.gates
+        )
+
     def subs(
         self, values: dict[Expr | str, Complex], remove_symbolic: bool = False
     ) -> QCircuit:
@@ -1312,7 +1583,280 @@ class QCircuit:
                         params.update(param.free_symbols)
         return params
 
+    def compile_parameters(
+        self, variables: Optional[Sequence[Basic]] = None
+    ) -> CompiledParameters:
+        """Analyses once and for all where the symbolic variables of this
+        circuit appear, in order to be able to substitute them repeatedly at a
+        low cost.
+
+        This is the recommended way of evaluating the same parametrized circuit
+        for many values (in a variational algorithm for instance): the
+        resulting :class:`CompiledParameters` binds a flat vector of values
+        without relying on ``sympy`` or on deep copies of the circuit.
+
+        Args:
+            variables: The variables of the circuit, in the order in which
+                their values will be given. Defaults to the variables of the
+                circuit sorted by name.
+
+        Returns:
+            The object allowing to bind values to the variables of the circuit.
+
+        Raises:
+            ValueError: If a variable of the circuit is missing from
+                ``variables``.
+
+        Example:
+            >>> theta, k = symbols("θ k")
+            >>> c = QCircuit([Rx(theta, 0), CNOT(1, 0), CRk(k, 0, 1), Ry(2 * theta, 1)])
+            >>> compiled = c.compile_parameters()
+            >>> compiled.variables
+            [k, θ]
+            >>> print(compiled.bind([1, np.pi]))  # doctest: +NORMALIZE_WHITESPACE
+                 ┌───────┐┌───┐
+            q_0: ┤ Rx(π) ├┤ X ├─■───────────────
+                 └───────┘└─┬─┘ │P(π) ┌────────┐
+            q_1: ───────────■───■─────┤ Ry(2π) ├
+                                      └────────┘
+
+        """
+        if variables is None:
+            variables = sorted(self.variables(), key=str)
+        return CompiledParameters(self, list(variables))
+
     @property
     def breakpoints(self) -> list[Breakpoint]:
         """Returns the breakpoints of the circuit in order."""
         return [inst for inst in self.instructions if isinstance(inst, Breakpoint)]
+
+
+@typechecked
+class CompiledParameters:
+    """Result of :meth:`QCircuit.compile_parameters`: keeps track of the
+    parameters of a circuit depending on symbolic variables, each of them
+    being compiled once in a numeric function of these variables.
+
+    Args:
+        circuit: The parametrized circuit.
+        variables: The variables of the circuit, in the order in which their
+            values will be given.
+
+    Raises:
+        ValueError: If a variable of the circuit is missing from ``variables``.
+    """
+
+    def __init__(self, circuit: QCircuit, variables: list[Basic]):
+        from sympy import Expr, lambdify
+
+        missing = circuit.variables().difference(variables)
+        if len(missing) != 0:
+            raise ValueError(f"Variables {missing} are missing from {variables}.")
+
+        self.circuit = circuit
+        """See parameter description."""
+        self.variables = variables
+        """See parameter description."""
+        self._bindings: list[tuple[int, list[Callable[..., Complex] | float]]] = []
+        for index, inst in enumerate(circuit.instructions):
+            if not isinstance(inst, ParametrizedGate):
+                continue
+            if not any(isinstance(param, Expr) for param in inst.parameters):
+                continue
+            self._bindings.append(
+                (
+                    index,
+                    [
+                        (
+                            (
+                                lambdify(variables, param, "numpy")
+                                if len(param.free_symbols) != 0
+                                else float(param)
+                            )
+                            if isinstance(param, Expr)
+                            else param
+                        )
+                        for param in inst.parameters
+                    ],
+                )
+            )
+
+    def bind(self, values: Sequence[float] | npt.NDArray[np.float64]) -> QCircuit:
+        """Substitutes the variables of the circuit by the values in parameter.
+
+        The resulting circuit shares all its non parametrized instructions with
+        the original circuit, they should thus not be modified in place.
+
+        Args:
+            values: The values of the variables, in the order of
+                :attr:`variables`.
+
+        Returns:
+            The circuit with the variables replaced by their values.
+
+        Raises:
+            ValueError: If the number of values does not match the number of
+                variables.
+        """
+        if len(values) != len(self.variables):
+            raise ValueError(
+                f"Expected {len(self.variables)} values but got {len(values)}."
+            )
+        bound = copy(self.circuit)
+        bound.instructions = list(self.circuit.instructions)
+        for index, parameters in self._bindings:
+            gate = copy(bound.instructions[index])
+            if TYPE_CHECKING:
+                assert isinstance(gate, ParametrizedGate)
+            gate.parameters = [
+                float(param(*values)) if callable(param) else param
+                for param in parameters
+            ]
+            bound.instructions[index] = gate
+        return bound
+
+    def __call__(self, values: Sequence[float] | npt.NDArray[np.float64]) -> QCircuit:
+        return self.bind(values)
+
+
+class _InstructionList(list[Instruction]):
+    """List of the instructions of a circuit, counting its modifications so
+    that the depth cached in the circuit can be invalidated."""
+
+    revision = 0
+
+    def _modified(self):
+        self.revision += 1
+
+    def __setitem__(self, index: Any, value: Any):
+        super().__setitem__(index, value)
+        self._modified()
+
+    def __delitem__(self, index: Any):
+        super().__delitem__(index)
+        self._modified()
+
+    def __iadd__(self, other: Any):
+        self._modified()
+        return super().__iadd__(other)
+
+    def __imul__(self, other: Any):
+        self._modified()
+        return super().__imul__(other)
+
+    def append(self, instruction: Instruction):
+        super().append(instruction)
+        self._modified()
+
+    def extend(self, instructions: Any):
+        super().extend(instructions)
+        self._modified()
+
+    def insert(self, index: Any, instruction: Instruction):
+        super().insert(index, instruction)
+        self._modified()
+
+    def pop(self, index: Any = -1) -> Instruction:
+        self._modified()
+        return super().pop(index)
+
+    def remove(self, instruction: Instruction):
+        super().remove(instruction)
+        self._modified()
+
+    def clear(self):
+        super().clear()
+        self._modified()
+
+    def sort(self, *args: Any, **kwargs: Any):
+        super().sort(*args, **kwargs)
+        self._modified()
+
+    def reverse(self):
+        super().reverse()
+        self._modified()
+
+
+class _DepthTracker:
+    """Per-qubit frontier used to compute the depth of a circuit in a single
+    pass, with a memory proportional to the number of qubits (plus one parent
+    pointer per gate for the critical path).
+
+    Args:
+        nb_qubits: Number of qubits of the tracked circuit.
+    """
+
+    def __init__(self, nb_qubits: int):
+        self.nb_qubits = nb_qubits
+        self.levels = [0] * nb_qubits
+        """For each qubit, depth of the last gate acting on it."""
+        self.two_qubit_levels = [0] * nb_qubits
+        """Same as ``levels``, only counting multi-qubit gates."""
+        self.last_gates = [-1] * nb_qubits
+        """For each qubit, index in ``gates`` of the gate defining its level."""
+        self.gates: list[Gate] = []
+        self.parents: list[int] = []
+        self.depth = 0
+        self.two_qubit_depth = 0
+        self.revision = (-1, -1)
+        """Revisions of the instruction list and of the instructions' qubits
+        this tracker is up to date with."""
+
+    def is_synchronized_with(self, instructions: _InstructionList) -> bool:
+        qubits_revision = (
+            Instruction._qubits_revision  # pyright: ignore[reportPrivateUsage]
+        )
+        return self.revision == (instructions.revision, qubits_revision)
+
+    def synchronize_with(self, instructions: _InstructionList):
+        qubits_revision = (
+            Instruction._qubits_revision  # pyright: ignore[reportPrivateUsage]
+        )
+        self.revision = (instructions.revision, qubits_revision)
+
+    def update(self, instructions: list[Instruction]):
+        """Processes the instructions, in the order of application."""
+        for instruction in instructions:
+            if isinstance(instruction, Barrier):
+                self._synchronize(instruction.targets)
+            elif isinstance(instruction, Gate):
+                self._add_gate(instruction)
+
+    def _synchronize(self, qubits: list[int]):
+        if len(qubits) == 0:
+            return
+        deepest = max(qubits, key=lambda qubit: self.levels[qubit])
+        two_qubit_level = max(self.two_qubit_levels[qubit] for qubit in qubits)
+        for qubit in qubits:
+            self.levels[qubit] = self.levels[deepest]
+            self.last_gates[qubit] = self.last_gates[deepest]
+            self.two_qubit_levels[qubit] = two_qubit_level
+
+    def _add_gate(self, gate: Gate):
+        qubits = list(gate.connections())
+        deepest = max(qubits, key=lambda qubit: self.levels[qubit])
+        level = self.levels[deepest] + 1
+        self.gates.append(gate)
+        self.parents.append(self.last_gates[deepest])
+        for qubit in qubits:
+            self.levels[qubit] = level
+            self.last_gates[qubit] = len(self.gates) - 1
+        self.depth = max(self.depth, level)
+
+        if len(qubits) > 1:
+            two_qubit_level = max(self.two_qubit_levels[q] for q in qubits) + 1
+            for qubit in qubits:
+                self.two_qubit_levels[qubit] = two_qubit_level
+            self.two_qubit_depth = max(self.two_qubit_depth, two_qubit_level)
+
+    def critical_path(self) -> list[Gate]:
+        """Follows the parents from the deepest gate back to the first layer."""
+        if self.depth == 0:
+            return []
+        deepest = max(range(self.nb_qubits), key=lambda qubit: self.levels[qubit])
+        index = self.last_gates[deepest]
+        path: list[Gate] = []
+        while index != -1:
+            path.append(self.gates[index])
+            index = self.parents[index]
+        return path[::-1]
@@ -0,0 +1,316 @@
+"""Converting a :class:`~mpqp.core.circuit.QCircuit` to the language of a
+provider (most of the time through OpenQASM) is costly, and the same circuit is
+often converted again and again, for instance when it is run with several
+shots settings, or on several devices. To avoid this, the results of
+:meth:`QCircuit.to_other_language<mpqp.core.circuit.QCircuit.to_other_language>`
+are kept in a :class:`ConversionCache`, keyed by the structure of the circuit
+(see :func:`~mpqp.tools.generics.structural_key`) and the target language.
+
+The cache used by the library is :data:`CONVERSION_CACHE`. It keeps the most
+recently used conversions in memory, within a number of entries and a memory
+bound, and can optionally persist them on disk, which is useful for
+long-lived worker processes converting the same circuits.
+
+Example:
+    >>> CONVERSION_CACHE.clear()
+    >>> circuit = QCircuit([H(0), CNOT(0, 1)])
+    >>> qasm = circuit.to_other_language(Language.QASM2)
+    >>> qasm = QCircuit([H(0), CNOT(0, 1)]).to_other_language(Language.QASM2)
+    >>> CONVERSION_CACHE.hits, CONVERSION_CACHE.misses
+    (1, 1)
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+import pickle
+import warnings
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Callable, Hashable, Optional
+
+from typeguard import typechecked
+
+
+@typechecked
+class ConversionCache:
+    """Least recently used cache of circuit conversions.
+
+    The converted circuits are stored serialized (with :mod:`pickle`), so that
+    each hit returns a fresh object the caller is free to modify, and so that
+    the memory used by the cache can be measured. Strings (OpenQASM codes) are
+    stored as is. Since serializing a circuit has a cost, a converted circuit
+    is only stored the second time its key is requested (or right away if the
+    disk tier is used): circuits converted only once do not pay for the
+    cache. Conversions that cannot be serialized are not cached. The
+    warnings emitted during a conversion (*i.e.* not silenced by the warning
+    filters in place) are stored with it, and raised again, at their original
+    location, each time the conversion is retrieved from the cache.
+
+    Args:
+        max_entries: Maximal number of conversions kept in memory.
+        max_bytes: Maximal size (in bytes) of the conversions kept in memory.
+        directory: If given, the conversions are also saved in this directory,
+            and looked for there when missing from memory. The disk tier is not
+            bounded, clear it with :meth:`clear`.
+        enabled: If ``False``, the cache is bypassed.
+        secret: Key used to sign the conversions saved on disk (with HMAC).
+            The files with a wrong signature are ignored.
+
+    Warning:
+        The conversions saved on disk are loaded with :mod:`pickle`, so anyone
+        able to write in ``directory`` can run arbitrary code in the processes
+        using it. Without ``secret``, the files only carry a checksum, which
+        detects corrupted files but not forged ones: either use a directory
+        only writable by trusted users, or share a ``secret`` between the
+        processes using the directory.
+
+    Example:
+        >>> cache = ConversionCache(max_entries=2)
+        >>> cache.get_or_convert(("a",), lambda: ("qasm", 0.0))
+        ('qasm', 0.0)
+        >>> cache.get_or_convert(("a",), lambda: ("other", 0.0))
+        ('qasm', 0.0)
+        >>> cache
+        ConversionCache(entries=1, bytes=4, hits=1, misses=1)
+
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 2**20,
+        directory: Optional[str] = None,
+        enabled: bool = True,
+        secret: Optional[bytes] = None,
+    ):
+        self.max_entries = max_entries
+        """See parameter description."""
+        self.max_bytes = max_bytes
+        """See parameter description."""
+        self.directory = directory
+        """See parameter description."""
+        self.enabled = enabled
+        """See parameter description."""
+        self.secret = secret
+        """See parameter description."""
+        self.hits = 0
+        """Number of conversions found in the cache (in memory or on disk)."""
+        self.disk_hits = 0
+        """Number of conversions found on disk (included in :attr:`hits`)."""
+        self.misses = 0
+        """Number of conversions that had to be computed."""
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._seen: OrderedDict[int, None] = OrderedDict()
+        """Hashes of the keys converted once but not stored, bounded to
+        ``max_entries``."""
+        self._bytes = 0
+        self._lock = RLock()
+
+    @property
+    def nb_bytes(self) -> int:
+        """Size of the conversions currently held in memory."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(entries={len(self)}, bytes={self._bytes}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def get_or_convert(
+        self, key: Hashable, convert: Callable[[], tuple[Any, float]]
+    ) -> tuple[Any, float]:
+        """Returns the conversion cached for ``key``, or computes it with
+        ``convert`` and caches it.
+
+        Args:
+            key: Structural key of the conversion.
+            convert: Computes the conversion, returns the converted circuit and
+                the global phase of the conversion.
+
+        Returns:
+            The converted circuit and the global phase of the conversion.
+        """
+        if not self.enabled:
+            return convert()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                entry = self._read(key)
+                if entry is not None:
+                    self.hits += 1
+                    self.disk_hits += 1
+                    self._store(key, entry)
+                else:
+                    self.misses += 1
+        if entry is not None:
+            for message, category, filename, lineno in entry.warnings:
+                warnings.warn_explicit(message, category, filename, lineno)
+            return _load(entry.payload), entry.gphase
+
+        # the filters of the user are kept: only the warnings they let through
+        # are recorded, and then shown as they would have been without the cache
+        with warnings.catch_warnings(record=True) as caught:
+            converted, gphase = convert()
+        for warning in caught:
+            warnings.showwarning(
+                warning.message,
+                warning.category,
+                warning.filename,
+                warning.lineno,
+                warning.file,
+                warning.line,
+            )
+        raised = [
+            (str(warning.message), warning.category, warning.filename, warning.lineno)
+            for warning in caught
+        ]
+
+        if not self._admit(key, converted):
+            return converted, gphase
+        payload = _dump(converted)
+        if payload is not None:
+            entry = _Entry(payload, gphase, raised)
+            with self._lock:
+                self._store(key, entry)
+                self._write(key, entry)
+        return converted, gphase
+
+    def clear(self, disk: bool = True):
+        """Empties the cache and resets its counters.
+
+        Args:
+            disk: Whether the conversions saved on disk should be removed as
+                well.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._seen.clear()
+            self._bytes = 0
+            self.hits = self.disk_hits = self.misses = 0
+            if disk and self.directory is not None and os.path.isdir(self.directory):
+                for name in os.listdir(self.directory):
+                    if name.endswith(".conversion"):
+                        os.remove(os.path.join(self.directory, name))
+
+    def _admit(self, key: Hashable, converted: Any) -> bool:
+        """Decides whether a conversion is worth serializing and storing."""
+        if isinstance(converted, str) or self.directory is not None:
+            return True
+        with self._lock:
+            seen = hash(key)
+            if seen in self._seen:
+                del self._seen[seen]
+                return True
+            self._seen[seen] = None
+            if len(self._seen) > self.max_entries:
+                self._seen.popitem(last=False)
+            return False
+
+    def _store(self, key: Hashable, entry: _Entry):
+        if entry.size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+
+    def _signature(self, data: bytes) -> bytes:
+        if self.secret is None:
+            return hashlib.sha256(data).digest()
+        return hmac.new(self.secret, data, hashlib.sha256).digest()
+
+    def _read(self, key: Hashable) -> Optional[_Entry]:
+        path = self._path(key)
+        if path is None or not os.path.isfile(path):
+            return None
+        with open(path, "rb") as file:
+            signature, data = file.read(_SIGNATURE_SIZE), file.read()
+        # the signature is checked before unpickling anything
+        if not hmac.compare_digest(signature, self._signature(data)):
+            return None
+        return _Entry(*pickle.loads(data))
+
+    def _write(self, key: Hashable, entry: _Entry):
+        path = self._path(key)
+        if path is None:
+            return
+        data = pickle.dumps((entry.payload, entry.gphase, entry.warnings))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(self._signature(data) + data)
+
+    def _path(self, key: Hashable) -> Optional[str]:
+        if self.directory is None:
+            return None
+        try:
+            digest = hashlib.sha256(pickle.dumps(_canonical(key))).hexdigest()
+        except Exception:
+            return None
+        return os.path.join(self.directory, digest + ".conversion")
+
+
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
+
+
+class _Entry:
+    """A cached conversion: the serialized converted circuit, the global phase
+    and the warnings of the conversion."""
+
+    def __init__(
+        self,
+        payload: str | bytes,
+        gphase: float,
+        warnings: list[tuple[str, type[Warning], str, int]],
+    ):
+        self.payload = payload
+        self.gphase = gphase
+        self.warnings = warnings
+        self.size = len(payload)
+
+
+def _canonical(key: Any) -> Any:
+    """Replaces the (frozen)sets of ``key`` by sorted tuples, since the pickled
+    form of a set depends on the hash seed of the process."""
+    if isinstance(key, (set, frozenset)):
+        items = [_canonical(item) for item in key]
+        return ("frozenset", tuple(sorted(items, key=pickle.dumps)))
+    if isinstance(key, tuple):
+        return tuple(_canonical(item) for item in key)
+    return key
+
+
+def _dump(converted: Any) -> Optional[str | bytes]:
+    if isinstance(converted, str):
+        return converted
+    try:
+        return pickle.dumps(converted)
+    except Exception:
+        return None
+
+
+def _load(payload: str | bytes) -> Any:
+    return payload if isinstance(payload, str) else pickle.loads(payload)
+
+
+CONVERSION_CACHE = ConversionCache()
+"""The cache used by :meth:`QCircuit.to_other_language
+<mpqp.core.circuit.QCircuit.to_other_language>`. Its bounds and disk tier can
+be set through its attributes, and it can be turned off by setting
+``CONVERSION_CACHE.enabled = False``. Before setting
+``CONVERSION_CACHE.directory``, read the warning of :class:`ConversionCache`
+about the files of the disk tier."""
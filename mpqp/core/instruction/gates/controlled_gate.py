@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from abc import ABC
-from functools import reduce
 from typing import Optional
 
+import numpy as np
 from typeguard import typechecked
 
 from mpqp.tools.generics import Matrix
+from mpqp.tools.maths import embed_matrix
 
 from .gate import Gate
 
@@ -43,75 +44,61 @@ class ControlledGate(Gate, ABC):
 
         Gate.__init__(self, targets, label)
 
-    def to_matrix(self, desired_gate_size: int = 0) -> Matrix:
-        import numpy as np
-
-        if len(self.controls) != 1 or len(self.targets) != 1:
-            from mpqp.core.instruction.gates.native_gates import SWAP
-
-            controls, targets = self.controls, self.targets
-            min_qubit, max_qubit = min(self.connections()), max(self.connections())
+    def canonical_qubits(self) -> list[int]:
+        return self.controls + self.targets
 
-            # If nb_qubits is not provided, calculate the necessary number of minimal qubits
-            if desired_gate_size == 0:
-                desired_gate_size = max_qubit - min_qubit + 1
-                controls = [x - min_qubit for x in controls]
-                targets = [x - min_qubit for x in targets]
-            elif desired_gate_size < max_qubit + 1:
-                raise ValueError(f"nb_qubits must be at least {max_qubit + 1}")
-
-            canonical_matrix = np.kron(
-                self.to_canonical_matrix(),
-                np.eye(2 ** (desired_gate_size - self.nb_qubits)),
-            )
-
-            permutations = set(
-                tuple(sorted(idx))
-                for idx in enumerate(controls + targets)
-                if idx[0] != idx[1] and not set(idx).issubset(controls)
-            )
-
-            swaps = [
-                SWAP(canonical_index, actual_index).to_matrix(desired_gate_size)
-                for canonical_index, actual_index in permutations
-            ]
-
-            return reduce(np.dot, swaps[::-1] + [canonical_matrix] + swaps)
-
-        control, target = self.controls[0], self.targets[0]
-
-        if desired_gate_size != 0:
-            max_qubit = max(control, target) + 1
-            if desired_gate_size < max_qubit:
-                raise ValueError(f"nb_qubits must be at least {max_qubit}")
-        else:
-            min_qubit = min(control, target)
-            control -= min_qubit
-            target -= min_qubit
-            desired_gate_size = abs(control - target) + 1
-
-        zero = np.diag([1, 0]).astype(np.complex64)
-        one = np.diag([0, 1]).astype(np.complex64)
-        non_controlled_gate = self.non_controlled_gate.to_matrix()
-        I2 = np.eye(2, dtype=np.complex64)
-
-        control_matrix = zero if control == 0 else I2
-        target_matrix = (
-            one if control == 0 else (non_controlled_gate if target == 0 else I2)
-        )
-
-        for i in range(1, desired_gate_size):
-            if i == control:
-                target_matrix = np.kron(target_matrix, one)
-                control_matrix = np.kron(control_matrix, zero)
-            elif i == target:
-                target_matrix = np.kron(target_matrix, non_controlled_gate)
-                control_matrix = np.kron(control_matrix, I2)
-            else:
-                target_matrix = np.kron(target_matrix, I2)
-                control_matrix = np.kron(control_matrix, I2)
-
-        return control_matrix + target_matrix
+    def to_matrix(self, desired_gate_size: int = 0) -> Matrix:
+        r"""Return the matricial semantics to this gate. Considering connections'
+        order and position, in contrast with
+        :meth:`~mpqp.core.instruction.gates.gate.Gate.to_canonical_matrix`.
+
+        The matrix is directly built by blocks: it is the identity everywhere,
+        except on the block where all the controls are in state `|1\rangle`,
+        where the (non controlled) unitary is applied on the targets.
+
+        Args:
+            desired_gate_size: The total number for qubits needed for the gate
+                representation. If not provided, the minimum number of qubits
+                required to generate the matrix will be used.
+
+        Returns:
+            A numpy array representing the unitary matrix of the gate.
+
+        Example:
+            >>> pprint(CNOT(1, 0).to_matrix())
+            [[1, 0, 0, 0],
+             [0, 0, 0, 1],
+             [0, 0, 1, 0],
+             [0, 1, 0, 0]]
+
+        """
+        controls, targets = self.controls, self.targets
+        max_qubit = max(self.connections())
+        if desired_gate_size == 0:
+            min_qubit = min(self.connections())
+            desired_gate_size = max_qubit - min_qubit + 1
+            controls = [qubit - min_qubit for qubit in controls]
+            targets = [qubit - min_qubit for qubit in targets]
+        elif desired_gate_size < max_qubit + 1:
+            raise ValueError(f"nb_qubits must be at least {max_qubit + 1}")
+
+        canonical_matrix = np.asarray(self.to_canonical_matrix())
+        target_size = 2 ** len(targets)
+        target_matrix = canonical_matrix[-target_size:, -target_size:]
+
+        free_qubits = [q for q in range(desired_gate_size) if q not in controls]
+        matrix = np.eye(2**desired_gate_size, dtype=canonical_matrix.dtype)
+        tensor = matrix.reshape((2,) * 2 * desired_gate_size)
+        block_index = [slice(None)] * 2 * desired_gate_size
+        for control in controls:
+            block_index[control] = 1
+            block_index[desired_gate_size + control] = 1
+        tensor[tuple(block_index)] = embed_matrix(
+            target_matrix,
+            [free_qubits.index(target) for target in targets],
+            len(free_qubits),
+        ).reshape((2,) * 2 * len(free_qubits))
+        return matrix
 
     def __repr__(self) -> str:
         c = self.controls if len(self.controls) > 1 else self.controls[0]
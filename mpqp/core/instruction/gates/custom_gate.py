@@ -72,9 +72,6 @@ class CustomGate(Gate):
         # TODO: move this to `to_canonical_matrix` and check for the usages
         return self.definition.matrix
 
-    def to_matrix(self, desired_gate_size: int = 0):
-        return self.matrix
-
     def to_canonical_matrix(self):
         return self.matrix
 
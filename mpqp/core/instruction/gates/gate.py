@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from copy import deepcopy
-from functools import reduce
 from typing import Optional
 from warnings import warn
 
@@ -15,7 +14,7 @@ from mpqp.core.instruction.gates.gate_definition import UnitaryMatrix
 from mpqp.core.instruction.instruction import Instruction
 from mpqp.tools.errors import NumberQubitsWarning
 from mpqp.tools.generics import Matrix
-from mpqp.tools.maths import matrix_eq
+from mpqp.tools.maths import embed_matrix, matrix_eq
 
 
 @typechecked
@@ -79,46 +78,15 @@ class Gate(Instruction, ABC):
              [0, 0, 0, 0, 0, 1, 0, 0]]
 
         """
-        from .native_gates import SWAP
-
-        first_connection = min(self.connections())
-        last_connection = max(self.connections())
-        connections_offset = 0
-
+        qubits = self.canonical_qubits()
         if desired_gate_size == 0:
-            desired_gate_size = last_connection - first_connection + 1
-            connections_offset = first_connection
-
-        if connections_offset + desired_gate_size < last_connection:
-            raise ValueError(f"`desired_gate_size` must be at least {last_connection}")
-
-        preceding_eyes = np.eye(2 ** (first_connection - connections_offset))
-        following_eyes = np.eye(
-            2
-            ** (
-                desired_gate_size
-                - len(self.targets)
-                - (first_connection - connections_offset)
-            )
-        )
-        result = np.kron(
-            preceding_eyes, np.kron(self.to_canonical_matrix(), following_eyes)
-        )
-
-        permutations = set(
-            tuple(sorted((origin + first_connection, destination)))
-            for (origin, destination) in enumerate(self.targets)
-            if origin + first_connection != destination
-        )
-
-        swaps = [
-            SWAP(o_index - connections_offset, d_index - connections_offset).to_matrix(
-                desired_gate_size
-            )
-            for o_index, d_index in permutations
-        ]
+            offset = min(qubits)
+            desired_gate_size = max(qubits) - offset + 1
+            qubits = [qubit - offset for qubit in qubits]
+        elif desired_gate_size < max(qubits) + 1:
+            raise ValueError(f"`desired_gate_size` must be at least {max(qubits) + 1}")
 
-        return reduce(np.dot, swaps[::-1] + [result] + swaps)
+        return embed_matrix(self.to_canonical_matrix(), qubits, desired_gate_size)
 
     @abstractmethod
     def to_canonical_matrix(self) -> Matrix:
@@ -147,6 +115,22 @@ class Gate(Instruction, ABC):
         """
         pass
 
+    def canonical_qubits(self) -> list[int]:
+        """Return the qubits on which the canonical matrix of this gate (see
+        :meth:`to_canonical_matrix`) acts, in the order of its tensor factors.
+
+        Returns:
+            The ordered list of qubits of the canonical matrix.
+
+        Example:
+            >>> SWAP(3, 1).canonical_qubits()
+            [3, 1]
+            >>> TOF([3, 1], 2).canonical_qubits()
+            [3, 1, 2]
+
+        """
+        return self.targets
+
     def inverse(self) -> Gate:
         """Computing the inverse of this gate.
 
@@ -17,7 +17,7 @@ import inspect
 import sys
 from abc import abstractmethod
 from numbers import Integral
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Hashable, Optional
 
 if TYPE_CHECKING:
     from sympy import Expr
@@ -35,7 +35,12 @@ from mpqp.core.instruction.gates.gate import Gate, InvolutionGate, SingleQubitGa
 from mpqp.core.instruction.gates.gate_definition import UnitaryMatrix
 from mpqp.core.instruction.gates.parametrized_gate import ParametrizedGate
 from mpqp.core.languages import Language
-from mpqp.tools.generics import Matrix, SimpleClassReprABC, classproperty
+from mpqp.tools.generics import (
+    Matrix,
+    SimpleClassReprABC,
+    classproperty,
+    structural_key,
+)
 from mpqp.tools.maths import cos, exp, sin
 
 # from sympy import Expr, pi
@@ -113,6 +118,18 @@ class NativeGate(Gate, SimpleClassReprABC):
 
     native_gate_options = {"disable_symbol_warn": True}
 
+    def _fingerprint(self) -> Hashable:
+        # the matrix, definition and non controlled gate of a native gate are
+        # fully determined by its type, qubits and parameters
+        return (
+            type(self),
+            tuple(self.targets),
+            tuple(getattr(self, "controls", ())),
+            tuple(structural_key(param) for param in getattr(self, "parameters", ())),
+            self.label,
+            self._dynamic,
+        )
+
     if TYPE_CHECKING:
         from braket.circuits import gates
         from qiskit.circuit.library import (
@@ -791,52 +808,6 @@ class SWAP(InvolutionGate, NoParameterGate):
     )
     """Size of the gate."""
 
-    def to_matrix(self, desired_gate_size: int = 0) -> npt.NDArray[np.complex64]:
-        """Constructs the matrix representation of a SWAP gate for two qubits.
-
-        Args:
-            nb_qubits: The total number for qubits gate representation. If not
-                provided, the minimum number of qubits required to generate the
-                matrix will be used.
-
-        Returns:
-            The matrix representation of the SWAP gate.
-        """
-        control, target = self.targets[0], self.targets[1]
-
-        max_qubits = max(control, target) + 1
-        if desired_gate_size != 0 and desired_gate_size < max_qubits:
-            raise ValueError(
-                f"The number of qubits in the system must be at least {max_qubits}."
-            )
-
-        nb_qubits_swap = abs(control - target) + 1
-        min_nb_qubits = min(control, target)
-        swap_matrix = np.eye(2**nb_qubits_swap, dtype=np.complex64)
-
-        for i in range(2**nb_qubits_swap):
-            binary_state = list(format(i, f"0{nb_qubits_swap}b"))
-
-            (
-                binary_state[nb_qubits_swap - control + min_nb_qubits - 1],
-                binary_state[nb_qubits_swap - target + min_nb_qubits - 1],
-            ) = (
-                binary_state[nb_qubits_swap - target + min_nb_qubits - 1],
-                binary_state[nb_qubits_swap - control + min_nb_qubits - 1],
-            )
-
-            swapped_index = int("".join(binary_state), 2)
-
-            swap_matrix[i, i] = 0
-            swap_matrix[swapped_index, i] = 1
-
-        if desired_gate_size != 0:
-            swap_matrix = np.kron(np.eye(2**min_nb_qubits), swap_matrix)
-            swap_matrix = np.kron(
-                swap_matrix, np.eye(2 ** (desired_gate_size - max_qubits))
-            )
-        return swap_matrix
-
 
 class U(NativeGate, ParametrizedGate, SingleQubitGate):
     r"""Generic one qubit unitary gate. It is parametrized by 3 Euler angles.
@@ -5,8 +5,7 @@ from __future__ import annotations
 from abc import abstractmethod
 from copy import deepcopy
 from numbers import Complex
-from pickle import dumps
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Hashable, Optional
 
 from typeguard import typechecked
 
@@ -15,7 +14,7 @@ if TYPE_CHECKING:
     from qiskit.circuit import Parameter
 
 from mpqp.core.languages import Language
-from mpqp.tools.generics import SimpleClassReprABC, flatten
+from mpqp.tools.generics import SimpleClassReprABC, flatten, structural_key
 
 
 @typechecked
@@ -54,6 +53,15 @@ class Instruction(SimpleClassReprABC):
         """See parameter description."""
         self._dynamic = False
 
+    _qubits_revision = 0
+    """Incremented each time the qubits of an existing instruction are
+    reassigned, so that the circuits caching their depth can detect it."""
+
+    def __setattr__(self, name: str, value: Any):
+        if name in ("targets", "controls") and name in self.__dict__:
+            Instruction._qubits_revision += 1
+        super().__setattr__(name, value)
+
     @property
     def nb_qubits(self) -> int:
         """Number of qubits of this instruction."""
@@ -97,8 +105,20 @@ class Instruction(SimpleClassReprABC):
         """
         pass
 
+    def _fingerprint(self) -> Hashable:
+        """Structural key of the instruction (see
+        :func:`~mpqp.tools.generics.structural_key`), backing :meth:`__eq__`
+        and :meth:`__hash__`. Unlike the one of a circuit, it is not cached,
+        instructions being small and often updated in place."""
+        return (type(self), structural_key(vars(self)))
+
     def __eq__(self, value: object) -> bool:
-        return dumps(self) == dumps(value)
+        if not isinstance(value, Instruction):
+            return False
+        return self is value or self._fingerprint() == value._fingerprint()
+
+    def __hash__(self) -> int:
+        return hash(self._fingerprint())
 
     def __str__(self) -> str:
         from mpqp.core.circuit import QCircuit
@@ -4,3 +4,4 @@ from .basis_measure import BasisMeasure
 from .expectation_value import ExpectationMeasure, Observable
 from .measure import Measure
 from .pauli_string import I, X, Y, Z, PauliString
+from .pauli_string_array import PauliStringArray
@@ -41,6 +41,11 @@ class BasisMeasure(Measure):
         basis: Basis in which the measure is performed. Defaults to
             :class:`~mpqp.core.instruction.measurement.basis.ComputationalBasis`
         label: Label used to identify the measure.
+        prune: If ``True``, the gates that cannot influence the measured qubits
+            (and the qubits only touched by these gates) are removed from the
+            circuit before its execution, the result being reported on the
+            original circuit. This has no effect on circuits with noise models,
+            or when the ``c_targets`` are given.
 
     Examples:
         >>> c1 = QCircuit([H(0), H(1), CNOT(0,1), BasisMeasure()])
@@ -60,6 +65,7 @@ class BasisMeasure(Measure):
         shots: int = 1024,
         basis: Optional[Basis] = None,
         label: Optional[str] = None,
+        prune: bool = False,
     ):
 
         if c_targets is not None:
@@ -80,6 +86,8 @@ class BasisMeasure(Measure):
         """See parameter description."""
         self.basis = basis
         """See parameter description."""
+        self.prune = prune
+        """See parameter description."""
 
     def to_other_language(
         self,
@@ -130,5 +138,11 @@ class BasisMeasure(Measure):
                 if len(options) != 0 or len(targets) != 0
                 else f"label={self.label}"
             )
+        if self.prune:
+            options += (
+                ", prune=True"
+                if len(options) != 0 or len(targets) != 0
+                else "prune=True"
+            )
         separator = ", " if len(options) != 0 and len(targets) != 0 else ""
         return f"BasisMeasure({targets}{separator}{options})"
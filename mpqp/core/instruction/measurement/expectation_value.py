@@ -7,10 +7,11 @@ from __future__ import annotations
 
 import copy
 from numbers import Complex
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Any, Hashable, Optional, Union
 from warnings import warn
 
 import numpy as np
+import numpy.typing as npt
 from typeguard import typechecked
 
 if TYPE_CHECKING:
@@ -23,9 +24,13 @@ if TYPE_CHECKING:
     from cirq.ops.pauli_string import PauliString as CirqPauliString
     from cirq.ops.linear_combinations import PauliSum as CirqPauliSum
 
-from mpqp.core.instruction.gates.native_gates import SWAP
+from mpqp.core.instruction.gates.gate import Gate
+from mpqp.core.instruction.gates.native_gates import SWAP, H, Rx
 from mpqp.core.instruction.measurement.measure import Measure
-from mpqp.core.instruction.measurement.pauli_string import PauliString
+from mpqp.core.instruction.measurement.pauli_string import (
+    PauliString,
+    PauliStringMonomial,
+)
 from mpqp.core.languages import Language
 from mpqp.tools.display import one_lined_repr
 from mpqp.tools.errors import NumberQubitsError
@@ -56,10 +61,10 @@ class Observable:
 
         >>> from mpqp.measures import I, X, Y, Z
         >>> Observable(3 * I @ Z + 4 * X @ Y)  # doctest: +NORMALIZE_WHITESPACE
-        Observable(array([[ 3.+0.j,  0.+0.j, 0.+0.j,  0.+4.j],
-                [ 0.+0.j, -3.+0.j, 0.-4.j,  0.+0.j],
-                [ 0.+0.j,  0.+4.j, 3.+0.j,  0.+0.j],
-                [ 0.-4.j,  0.+0.j, 0.+0.j, -3.+0.j]],
+        Observable(array([[ 3.+0.j,  0.+0.j, 0.+0.j,  0.-4.j],
+                [ 0.+0.j, -3.+0.j, 0.+4.j,  0.+0.j],
+                [ 0.+0.j,  0.-4.j, 3.+0.j,  0.+0.j],
+                [ 0.+4.j,  0.+0.j, 0.+0.j, -3.+0.j]],
             dtype=complex64))
         >>> Observable(3 * I @ Z + 4 * X @ Y).pauli_string.sort_monomials()
         3*I@Z + 4*X@Y
@@ -69,14 +74,16 @@ class Observable:
     def __init__(self, observable: Matrix | PauliString):
         self._matrix = None
         self._pauli_string = None
+        self._conversions: dict[Any, Any] = {}
 
         if isinstance(observable, PauliString):
             self.nb_qubits = observable.nb_qubits
-            self._pauli_string = observable.simplify()
+            # monomials and atoms are wrapped in a PauliString to be frozen
+            self._pauli_string = PauliString(observable.simplify().monomials).freeze()
         else:
             self.nb_qubits = int(np.log2(len(observable)))
             """Number of qubits of this observable."""
-            self._matrix = np.array(observable)
+            self._matrix = _read_only(observable)
 
             basis_states = 2**self.nb_qubits
             if self.matrix.shape != (basis_states, basis_states):
@@ -93,33 +100,127 @@ class Observable:
 
     @property
     def matrix(self) -> Matrix:
-        """The matrix representation of the observable."""
+        """The matrix representation of the observable. The matrix is shared
+        by all the reads, and is thus not writeable (use the setter to modify
+        the observable)."""
         if self._matrix is None:
-            self._matrix = self.pauli_string.to_matrix()
-        matrix = copy.deepcopy(self._matrix).astype(np.complex64)
-        return matrix
+            self._matrix = _read_only(self.pauli_string.to_matrix())
+        return self._matrix
 
     @property
     def pauli_string(self) -> PauliString:
-        """The PauliString representation of the observable."""
+        """The PauliString representation of the observable. The PauliString is
+        shared by all the reads, and is thus frozen (see
+        :meth:`~mpqp.core.instruction.measurement.pauli_string.PauliString.freeze`)."""
         if self._pauli_string is None:
-            self._pauli_string = PauliString.from_matrix(self.matrix)
-        pauli_string = copy.deepcopy(self._pauli_string)
-        return pauli_string
+            self._pauli_string = PauliString.from_matrix(self.matrix).freeze()
+        return self._pauli_string
 
     @matrix.setter
     def matrix(self, matrix: Matrix):
-        self._matrix = matrix
+        self._matrix = _read_only(matrix)
         self._pauli_string = None
+        self._conversions = {}
 
     @pauli_string.setter
     def pauli_string(self, pauli_string: PauliString):
-        self._pauli_string = pauli_string
+        self._pauli_string = PauliString(copy.deepcopy(pauli_string.monomials)).freeze()
         self._matrix = None
+        self._conversions = {}
+
+    def _fingerprint(self) -> Hashable:
+        """Structural key of the observable, based on its Pauli decomposition
+        so that it does not depend on the cached representations."""
+        return (Observable, self.nb_qubits, tuple(self.pauli_string.to_dict().items()))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Observable):
+            return False
+        return self is other or self._fingerprint() == other._fingerprint()
+
+    def __hash__(self) -> int:
+        return hash(self._fingerprint())
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({one_lined_repr(self.matrix)})"
 
+    def restricted_to_support(self) -> tuple[Observable, list[int]]:
+        """Restricts the observable to the qubits on which it acts
+        non-trivially. Only observables defined by a PauliString are
+        restricted, the support of an observable defined by a matrix being
+        considered to be all its qubits.
+
+        Returns:
+            The restricted observable and the indices of the qubits it acts on.
+
+        Note:
+            As for :meth:`to_other_language`, the restricted observable is
+            cached until the observable is modified through one of its setters.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> obs = Observable(I @ X @ I @ Z + 2 * I @ Z @ I @ I)
+            >>> observable, support = obs.restricted_to_support()
+            >>> observable.pauli_string, support
+            (1*X@Z + 2*Z@I, [1, 3])
+            >>> obs.restricted_to_support()[0] is observable
+            True
+
+        """
+        if self._pauli_string is None:
+            return self, list(range(self.nb_qubits))
+        if "support" not in self._conversions:
+            self._conversions["support"] = self._restricted_to_support()
+        observable, support = self._conversions["support"]
+        return observable, list(support)
+
+    def _restricted_to_support(self) -> tuple[Observable, list[int]]:
+        """Uncached version of :meth:`restricted_to_support`."""
+        assert self._pauli_string is not None
+        monomials = self._pauli_string.monomials
+        support = [
+            qubit
+            for qubit in range(self.nb_qubits)
+            if any(mono.atoms[qubit].label != "I" for mono in monomials)
+        ]
+        if len(support) in {0, self.nb_qubits}:
+            return self, list(range(self.nb_qubits))
+        return (
+            Observable(
+                PauliString(
+                    [
+                        PauliStringMonomial(
+                            mono.coef, [mono.atoms[qubit] for qubit in support]
+                        )
+                        for mono in monomials
+                    ]
+                )
+            ),
+            support,
+        )
+
+    def expectation(self, state: npt.NDArray[np.complexfloating]) -> float:
+        """Computes the expectation value of the observable for a given state
+        vector. If the observable was defined as a PauliString, the value is
+        computed without building its matrix (see
+        :meth:`~mpqp.core.instruction.measurement.pauli_string.PauliString.expectation`).
+
+        Args:
+            state: The state vector, of size ``2**nb_qubits``.
+
+        Returns:
+            The expectation value of the observable in the state.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> Observable(X @ X + 2 * Z @ I).expectation(np.array([0, 0, 1, 0]))
+            -2.0
+
+        """
+        if self._pauli_string is not None:
+            return self._pauli_string.expectation(state)
+        return float(np.vdot(state, self.matrix @ state).real)
+
     def __mult__(self, other: Expr | Complex) -> Observable:
         """3M-TODO"""
         ...
@@ -144,22 +245,70 @@ class Observable:
         Returns:
             Depends on the target language.
 
+        Note:
+            The conversions are cached (until the observable is modified
+            through one of its setters), so the returned object is shared by
+            all the conversions to the same language, and should not be
+            modified.
+
         Example:
             >>> obs = Observable(np.diag([0.7, -1, 1, 1]))
             >>> obs_qiskit = obs.to_other_language(Language.QISKIT)
             >>> obs_qiskit.to_list()  # doctest: +NORMALIZE_WHITESPACE
             [('II', (0.42499999701976776+0j)), ('IZ', (0.42499999701976776+0j)),
              ('ZI', (-0.5750000029802322+0j)), ('ZZ', (0.42499999701976776+0j))]
+            >>> obs.to_other_language(Language.QISKIT) is obs_qiskit
+            True
 
         """
+        # the cirq conversion depends on the qubits of the circuit
+        key = (
+            language,
+            None if circuit is None else tuple(sorted(circuit.all_qubits())),
+        )
+        if key not in self._conversions:
+            self._conversions[key] = self._to_other_language(language, circuit)
+        return self._conversions[key]
+
+    def _to_other_language(
+        self, language: Language, circuit: Optional[CirqCircuit] = None
+    ) -> Union[SparsePauliOp, QLMObservable, Hermitian, CirqPauliSum, CirqPauliString]:
+        """Uncached version of :meth:`to_other_language`."""
+        # when the observable is defined by a PauliString (padded observables
+        # for instance), the conversion is done term by term to avoid building
+        # the matrix of the observable
         if language == Language.QISKIT:
             from qiskit.quantum_info import Operator, SparsePauliOp
 
-            return SparsePauliOp.from_operator(Operator(self.matrix))
+            if self._pauli_string is None:
+                return SparsePauliOp.from_operator(Operator(self.matrix))
+            # qiskit's qubits are in the reversed order, as the circuits
+            return SparsePauliOp(
+                [
+                    "".join(atom.label for atom in mono.atoms)
+                    for mono in self._pauli_string.monomials
+                ],
+                np.array(
+                    [mono.coef for mono in self._pauli_string.monomials], dtype=complex
+                ),
+            )
         elif language == Language.MY_QLM:
             from qat.core.wrappers.observable import Observable as QLMObservable
-
-            return QLMObservable(self.nb_qubits, matrix=self.matrix)
+            from qat.core.wrappers.observable import Term
+
+            if self._pauli_string is None:
+                return QLMObservable(self.nb_qubits, matrix=self.matrix)
+            constant, terms = 0.0, []
+            for mono in self._pauli_string.monomials:
+                support = [q for q, atom in enumerate(mono.atoms) if atom.label != "I"]
+                if len(support) == 0:
+                    constant += mono.coef
+                else:
+                    label = "".join(mono.atoms[q].label for q in support)
+                    terms.append(Term(mono.coef, label, support))
+            return QLMObservable(
+                self.nb_qubits, pauli_terms=terms, constant_coeff=constant
+            )
         elif language == Language.BRAKET:
             from braket.circuits.observables import Hermitian
 
@@ -170,6 +319,13 @@ class Observable:
             raise ValueError(f"Unsupported language: {language}")
 
 
+def _read_only(matrix: Matrix) -> npt.NDArray[np.complex64]:
+    """Copy of the matrix, as a non writeable ``complex64`` array."""
+    matrix = np.array(matrix, dtype=np.complex64)
+    matrix.setflags(write=False)
+    return matrix
+
+
 @typechecked
 class ExpectationMeasure(Measure):
     """This measure evaluates the expectation value of the output of the circuit
@@ -183,9 +339,30 @@ class ExpectationMeasure(Measure):
     Args:
         targets: List of indices referring to the qubits on which the measure
             will be applied.
-        observable: Observable used for the measure.
+        observable: Observable used for the measure. Several observables (of
+            the same size) can be given, they are then all evaluated from the
+            same execution of the circuit.
         shots: Number of shots to be performed.
         label: Label used to identify the measure.
+        grouping: If ``"qubitwise"``, the expectation value is estimated (when
+            ``shots`` is not ``0``) by splitting the observable in groups of
+            qubitwise commuting Pauli monomials (see
+            :meth:`~mpqp.core.instruction.measurement.pauli_string.PauliString.group_commuting`).
+            Each group is then measured by a single circuit, the basis of each
+            qubit being rotated, and the expectation values of all the
+            monomials of the group are computed from the same counts. By
+            default, the provider specific method is used.
+        optimize_shots: If ``True``, ``shots`` is the total budget of shots,
+            split across the groups (see :meth:`allocate_shots`) instead of
+            being used for each group. Implies the ``"qubitwise"`` grouping.
+        allocation_rounds: If larger than ``1``, the budget is spent in this
+            many rounds, the allocation of each round being refined using the
+            standard deviations estimated from the counts of the previous ones.
+
+    Raises:
+        ValueError: If the grouping strategy is not supported, if the number of
+            allocation rounds is not positive, or if no observable is given.
+        NumberQubitsError: If the observables do not have the same size.
 
     Warns:
         UserWarning: If the ``targets`` are not sorted and contiguous, some
@@ -197,6 +374,10 @@ class ExpectationMeasure(Measure):
         >>> c = QCircuit([H(0), CNOT(0,1), ExpectationMeasure(obs, shots=10000)])
         >>> run(c, ATOSDevice.MYQLM_PYLINALG).expectation_value # doctest: +SKIP
         0.85918
+        >>> obs_2 = Observable(np.diag([1, 0, 0, 1]))
+        >>> c = QCircuit([H(0), CNOT(0,1), ExpectationMeasure([obs, obs_2])])
+        >>> run(c, MPQPDevice.STATEVECTOR).expectation_values.round(5)
+        array([0.85, 1.  ])
 
     """
 
@@ -204,17 +385,206 @@ class ExpectationMeasure(Measure):
 
     def __init__(
         self,
-        observable: Observable,
+        observable: Observable | list[Observable],
         targets: Optional[list[int]] = None,
         shots: int = 0,
         label: Optional[str] = None,
+        grouping: Optional[str] = None,
+        optimize_shots: bool = False,
+        allocation_rounds: int = 1,
     ):
 
         super().__init__(targets, shots, label)
-        self.observable = observable
+        if isinstance(observable, Observable):
+            observable = [observable]
+        if len(observable) == 0:
+            raise ValueError("An expectation measure needs at least one observable.")
+        if len({obs.nb_qubits for obs in observable}) != 1:
+            raise NumberQubitsError(
+                "The observables of an expectation measure must have the same size."
+            )
+        self.observables = observable
+        """See parameter description."""
+        if optimize_shots and grouping is None:
+            grouping = "qubitwise"
+        if grouping not in {None, "qubitwise"}:
+            raise ValueError(
+                f"Unsupported grouping {grouping}, only qubitwise commuting groups "
+                "can be measured by rotating the basis of the qubits."
+            )
+        if allocation_rounds < 1:
+            raise ValueError("The number of allocation rounds must be positive.")
+        self.grouping = grouping
+        """See parameter description."""
+        self.optimize_shots = optimize_shots
+        """See parameter description."""
+        self.allocation_rounds = allocation_rounds
         """See parameter description."""
         self._check_targets_order()
 
+    @property
+    def observable(self) -> Observable:
+        """The observable of the measure, when it has a single one (see
+        :attr:`observables` otherwise)."""
+        if len(self.observables) != 1:
+            raise ValueError(
+                "This measure has several observables, use `observables` instead."
+            )
+        return self.observables[0]
+
+    @observable.setter
+    def observable(self, observable: Observable):
+        self.observables = [observable]
+
+    @staticmethod
+    def std_dev_bound(group: PauliString) -> float:
+        r"""Estimates the standard deviation of a group of commuting Pauli
+        monomials when no measurement is available, by
+        `\sqrt{\sum_i c_i^2}`, the `c_i` being the coefficients of the non
+        identity monomials of the group (each Pauli monomial having a standard
+        deviation at most `1`).
+
+        Args:
+            group: The group of commuting monomials.
+
+        Returns:
+            The estimation of the standard deviation of the group.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> ExpectationMeasure.std_dev_bound(4 * Z @ Z - 3 * Z @ I + 2 * I @ I)
+            5.0
+
+        """
+        return float(
+            np.sqrt(
+                sum(
+                    abs(mono.coef) ** 2
+                    for mono in group.monomials
+                    if any(atom.label != "I" for atom in mono.atoms)
+                )
+            )
+        )
+
+    @staticmethod
+    def basis_rotation(group: PauliString) -> list[Gate]:
+        """Gates rotating the basis of each qubit so that the monomials of a
+        group of qubitwise commuting monomials become diagonal (``X`` and ``Y``
+        are mapped on ``Z``).
+
+        Args:
+            group: The group of qubitwise commuting monomials.
+
+        Returns:
+            The gates to apply before measuring the group in the computational
+            basis.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> ExpectationMeasure.basis_rotation(X @ Z @ Y + 2 * X @ I @ I)
+            [H(0), Rx(1.5707963267948966, 2)]
+
+        """
+        gates: list[Gate] = []
+        for qubit in range(group.nb_qubits):
+            labels = {mono.atoms[qubit].label for mono in group.monomials} - {"I"}
+            if labels == {"X"}:
+                gates.append(H(qubit))
+            elif labels == {"Y"}:
+                gates.append(Rx(np.pi / 2, qubit))
+        return gates
+
+    @staticmethod
+    def diagonal_values(group: PauliString) -> npt.NDArray[np.float64]:
+        """Values taken by a group of qubitwise commuting monomials on each
+        basis state, once the basis rotated by :meth:`basis_rotation`. Only the
+        diagonal is computed, the matrix of the group is never built.
+
+        Args:
+            group: The group of qubitwise commuting monomials.
+
+        Returns:
+            The value of the group for each basis state.
+
+        Example:
+            >>> from mpqp.measures import I, X, Z
+            >>> ExpectationMeasure.diagonal_values(X @ Z + 2 * X @ I)
+            array([ 3.,  1., -3., -1.])
+
+        """
+        from mpqp.core.instruction.measurement.pauli_string import I, Z
+
+        diagonalized = PauliString(
+            [
+                PauliStringMonomial(
+                    mono.coef, [I if atom.label == "I" else Z for atom in mono.atoms]
+                )
+                for mono in group.monomials
+            ]
+        )
+        return diagonalized.to_sparse_matrix().diagonal().real
+
+    def allocate_shots(
+        self,
+        groups: list[PauliString],
+        std_devs: Optional[list[float]] = None,
+        budget: Optional[int] = None,
+    ) -> list[int]:
+        r"""Splits a budget of shots across groups of commuting Pauli monomials.
+
+        The variance of the estimation of the expectation value is
+        `\sum_g \sigma_g^2/n_g`, with `\sigma_g` the standard deviation of
+        the group `g` and `n_g` its number of shots. For a fixed total number
+        of shots, it is minimal when `n_g` is proportional to `\sigma_g`. When
+        the standard deviations are not known, they are estimated by
+        :meth:`std_dev_bound`.
+
+        Each group with a non null standard deviation gets at least one shot,
+        and groups with a null one (the identity for instance) none.
+
+        Args:
+            groups: The groups of commuting monomials.
+            std_devs: The (estimated) standard deviations of each group. If not
+                given, :meth:`std_dev_bound` is used.
+            budget: The number of shots to split. Defaults to :attr:`shots`.
+
+        Returns:
+            The number of shots of each group, summing to ``budget``.
+
+        Raises:
+            ValueError: If the budget is smaller than the number of groups to
+                measure.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> groups = [3 * X @ I + 2 * I @ I, 4 * Z @ Z - 3 * Z @ I, 1 * I @ I]
+            >>> measure = ExpectationMeasure(Observable(X @ X), shots=1000)
+            >>> measure.allocate_shots(groups)
+            [375, 625, 0]
+
+        """
+        budget = self.shots if budget is None else budget
+        if std_devs is None:
+            std_devs = [self.std_dev_bound(group) for group in groups]
+        weights = np.array(std_devs, dtype=float)
+        measured = weights > 0
+        if budget < measured.sum():
+            raise ValueError(
+                f"A budget of {budget} shots is too small to measure "
+                f"{measured.sum()} groups."
+            )
+        if not measured.any():
+            return [0] * len(groups)
+
+        # one shot per measured group, the rest split proportionally to the
+        # weights (the rounding errors are distributed to the largest remainders)
+        remaining = budget - int(measured.sum())
+        ideal = remaining * weights / weights.sum()
+        allocation = np.floor(ideal).astype(int)
+        leftovers = remaining - int(allocation.sum())
+        allocation[np.argsort(allocation - ideal, kind="stable")[:leftovers]] += 1
+        return (allocation + measured).tolist()
+
     def _check_targets_order(self):
         """Ensures target qubits are ordered and contiguous, rearranging them if necessary (private)."""
         from mpqp.core.circuit import QCircuit
@@ -223,10 +593,10 @@ class ExpectationMeasure(Measure):
             self.pre_measure = QCircuit(0)
             return
 
-        if self.nb_qubits != self.observable.nb_qubits:
+        if self.nb_qubits != self.observables[0].nb_qubits:
             raise NumberQubitsError(
                 f"Target size {self.nb_qubits} doesn't match observable size "
-                f"{self.observable.nb_qubits}."
+                f"{self.observables[0].nb_qubits}."
             )
 
         self.pre_measure = QCircuit(max(self.targets) + 1)
@@ -269,7 +639,20 @@ class ExpectationMeasure(Measure):
         )
         shots = "" if self.shots == 0 else f", shots={self.shots}"
         label = "" if self.label is None else f", label={self.label}"
-        return f"ExpectationMeasure({self.observable}{targets}{shots}{label})"
+        grouping = "" if self.grouping is None else f", grouping={self.grouping!r}"
+        optimize = ", optimize_shots=True" if self.optimize_shots else ""
+        rounds = (
+            ""
+            if self.allocation_rounds == 1
+            else f", allocation_rounds={self.allocation_rounds}"
+        )
+        observables = (
+            self.observables[0] if len(self.observables) == 1 else self.observables
+        )
+        return (
+            f"ExpectationMeasure({observables}{targets}{shots}{label}{grouping}"
+            f"{optimize}{rounds})"
+        )
 
     def to_other_language(
         self,
@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 
 import numpy as np
 import numpy.typing as npt
+from scipy.sparse import csr_matrix
 
 FixedReal = Union[Real, float]
 from mpqp.core.languages import Language
@@ -67,6 +68,8 @@ class PauliString:
             ps = pauli_string.X + pauli_string.Y/2
     """
 
+    _frozen = False
+
     def __init__(self, monomials: Optional[list["PauliStringMonomial"]] = None):
         self._monomials: list[PauliStringMonomial] = []
 
@@ -98,6 +101,53 @@ class PauliString:
     def __repr__(self):
         return " + ".join(map(str, self._monomials))
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> "PauliString":
+        # the copy of a frozen PauliString is not frozen
+        res = type(self).__new__(type(self))
+        memo[id(self)] = res
+        res.__dict__.update(
+            {
+                name: deepcopy(value, memo)
+                for name, value in self.__dict__.items()
+                if name != "_frozen"
+            }
+        )
+        return res
+
+    def freeze(self) -> "PauliString":
+        """Freezes the PauliString, so it can be shared without being copied
+        (by an :class:`~mpqp.core.instruction.measurement.expectation_value.Observable`
+        for instance). The in place operators (``+=``, ``*=``, ...) of a
+        frozen PauliString return a new PauliString instead of modifying it,
+        and it cannot be simplified in place anymore. Its monomials are frozen
+        as well, and its list of monomials cannot be modified.
+
+        Returns:
+            The PauliString itself.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> ps = (X @ Z + Y @ I).freeze()
+            >>> scaled = ps
+            >>> scaled *= 2
+            >>> ps, scaled
+            (1*X@Z + 1*Y@I, 2*X@Z + 2*Y@I)
+            >>> ps.monomials[0].coef = 3
+            Traceback (most recent call last):
+                ...
+            AttributeError: A frozen PauliStringMonomial cannot be modified.
+
+        """
+        for mono in self._monomials:
+            mono.freeze()
+        self._monomials = _ReadOnlyList(self._monomials)
+        self._frozen = True
+        return self
+
+    def _thawed(self) -> "PauliString":
+        """``self`` if it can be modified in place, a copy otherwise."""
+        return deepcopy(self) if self._frozen else self
+
     def __pos__(self) -> "PauliString":
         return deepcopy(self)
 
@@ -105,6 +155,7 @@ class PauliString:
         return -1 * self
 
     def __iadd__(self, other: "PauliString") -> "PauliString":
+        self = self._thawed()
         for mono in other.monomials:
             if (
                 len(self._monomials) != 0
@@ -129,6 +180,7 @@ class PauliString:
         return self + (-1) * other
 
     def __imul__(self, other: FixedReal) -> "PauliString":
+        self = self._thawed()
         for i, mono in enumerate(self._monomials):
             if isinstance(mono, PauliStringAtom):
                 self.monomials[i] = PauliStringMonomial(atoms=[mono])
@@ -151,6 +203,7 @@ class PauliString:
         return self * (1 / other)  # pyright: ignore[reportOperatorIssue]
 
     def __imatmul__(self, other: "PauliString") -> "PauliString":
+        self = self._thawed()
         self._monomials = [
             mono for s_mono in self.monomials for mono in (s_mono @ other).monomials
         ]
@@ -168,7 +221,8 @@ class PauliString:
 
     def simplify(self, inplace: bool = False) -> PauliString:
         """Simplifies the Pauli string by combining identical terms and removing
-        terms with null coefficients.
+        terms with null coefficients. The identical terms are grouped in a
+        single pass, so the cost is linear in the number of monomials.
 
         Args:
             inplace: Indicates if ``self`` should be updated in addition of a
@@ -177,32 +231,46 @@ class PauliString:
         Returns:
             The simplified version of the Pauli string.
 
+        Raises:
+            ValueError: If ``inplace`` is ``True`` and the Pauli string is
+                frozen (see :meth:`freeze`).
+
         Example:
             >>> from mpqp.measures import I, X, Y, Z
             >>> (I @ I - 2 *I @ I + Z @ I - Z @ I).simplify()
             -1*I@I
+            >>> ps = X @ Y + 2 * I @ Z + X @ Y
+            >>> _ = ps.simplify(inplace=True)
+            >>> ps
+            2*X@Y + 2*I@Z
 
         """
+        # single pass accumulation of the coefficients, the monomials being
+        # identified by the labels of their atoms (in order of first occurrence)
+        coefs: dict[tuple[str, ...], Any] = {}
+        atoms: dict[tuple[str, ...], list[PauliStringAtom]] = {}
+        for mono in self.monomials:
+            key = tuple(atom.label for atom in mono.atoms)
+            if key in coefs:
+                coefs[key] += mono.coef
+            else:
+                coefs[key] = mono.coef
+                atoms[key] = mono.atoms
+
         res = PauliString()
-        for unique_mono_atoms in {tuple(mono.atoms) for mono in self.monomials}:
-            coef = float(
-                sum(
-                    [
-                        mono.coef
-                        for mono in self.monomials
-                        if mono.atoms == list(unique_mono_atoms)
-                    ]
-                ).real
-            )
+        for key, total in coefs.items():
+            coef = float(total.real)
             if coef == int(coef):
                 coef = int(coef)
             if coef != 0:
-                res.monomials.append(PauliStringMonomial(coef, list(unique_mono_atoms)))
+                res.monomials.append(PauliStringMonomial(coef, list(atoms[key])))
         if len(res.monomials) == 0:
             res.monomials.append(
                 PauliStringMonomial(0, [I for _ in range(self.nb_qubits)])
             )
         if inplace:
+            if self._frozen:
+                raise ValueError("A frozen PauliString cannot be simplified in place.")
             self._monomials = res.monomials
         return res
 
@@ -255,6 +323,60 @@ class PauliString:
         )
         return PauliString(sorted_monomials)
 
+    def group_commuting(self, strategy: str = "qubitwise") -> list[PauliString]:
+        """Partitions the monomials of this Pauli string in groups of pairwise
+        commuting monomials. The monomials of a group can be measured
+        simultaneously, so the number of groups is the number of measurement
+        settings needed to estimate the expectation value of this observable.
+
+        The partition is computed by a greedy colouring (largest degree first)
+        of the graph in which two monomials are linked if they do not commute.
+
+        Args:
+            strategy: Either ``"qubitwise"``, in which case the monomials of a
+                group commute on each qubit (a group is then measured by
+                changing the measurement basis of each qubit), or
+                ``"general"``, in which case the monomials of a group commute
+                (leading to fewer groups, but requiring entangling gates to be
+                measured).
+
+        Returns:
+            The groups of monomials, each as a Pauli string.
+
+        Raises:
+            ValueError: If the strategy is not supported.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> ps = X @ X + Y @ Y + Z @ Z + 2 * X @ I + Z @ I
+            >>> ps.group_commuting()
+            [1*Y@Y, 1*X@X + 2*X@I, 1*Z@Z + 1*Z@I]
+            >>> (X @ X + Y @ Y + Z @ Z).group_commuting("general")
+            [1*X@X + 1*Y@Y + 1*Z@Z]
+
+        """
+        if strategy not in {"qubitwise", "general"}:
+            raise ValueError(
+                f"Unknown grouping strategy {strategy}, expected `qubitwise` or "
+                "`general`."
+            )
+        from mpqp.core.instruction.measurement.pauli_string_array import (
+            PauliStringArray,
+        )
+
+        monomials = self.simplify().monomials
+        conflicts = ~PauliStringArray.from_pauli_string(
+            PauliString(monomials)
+        ).commutes(qubitwise=strategy == "qubitwise")
+        colors = np.full(len(monomials), -1)
+        for vertex in np.argsort(-conflicts.sum(axis=1), kind="stable"):
+            used = set(colors[conflicts[vertex] & (colors >= 0)])
+            colors[vertex] = next(c for c in range(len(monomials)) if c not in used)
+        return [
+            PauliString([mono for mono, c in zip(monomials, colors) if c == color])
+            for color in range(colors.max() + 1)
+        ]
+
     def to_matrix(self) -> Matrix:
         """Converts the PauliString to a matrix representation.
 
@@ -268,18 +390,106 @@ class PauliString:
              [0, 0]]
 
         """
-        self = self.simplify()
-        return sum(
-            map(lambda m: m.to_matrix(), self.monomials),
-            start=np.zeros((2**self.nb_qubits, 2**self.nb_qubits), dtype=np.complex64),
+        return self.to_sparse_matrix().toarray().astype(np.complex64)
+
+    def to_sparse_matrix(self) -> csr_matrix:
+        r"""Converts the PauliString to a sparse matrix, in the CSR format.
+
+        A Pauli monomial has exactly one non zero element per column: the
+        column `j` is mapped on the row `j \oplus x`, with `x` the mask of the
+        qubits on which ``X`` or ``Y`` act, and a phase `(-1)^{|j \wedge z|}`
+        (times `i` for each ``Y``), with `z` the mask of the qubits on which
+        ``Z`` or ``Y`` act. The matrix is thus directly built from these masks,
+        with `2^n` non zero elements per monomial.
+
+        Returns:
+            Sparse matrix representation of the Pauli string.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> pprint((I @ X + 2 * Z @ Y).to_sparse_matrix().toarray())
+            [[0   , 1-2j, 0   , 0   ],
+             [1+2j, 0   , 0   , 0   ],
+             [0   , 0   , 0   , 1+2j],
+             [0   , 0   , 1-2j, 0   ]]
+
+        """
+        size = 2**self.nb_qubits
+        columns = np.arange(size, dtype=np.int64)
+        rows, data = [], []
+        for mono in self.simplify().monomials:
+            x_mask, z_mask, phase = _index_masks(mono)
+            rows.append(columns ^ x_mask)
+            data.append(mono.coef * phase * _parity_signs(columns & z_mask))
+        return csr_matrix(
+            (
+                np.concatenate(data),
+                (np.concatenate(rows), np.tile(columns, len(data))),
+            ),
+            shape=(size, size),
+            dtype=complex,
         )
 
+    def expectation(self, state: npt.NDArray[np.complex64]) -> float:
+        r"""Computes the expectation value `\langle\psi|P|\psi\rangle` of this
+        Pauli string for the state `|\psi\rangle` given in parameter, without
+        forming the operator: for each monomial, the state is permuted by
+        flipping the bits of its indices and multiplied by a phase vector (see
+        :meth:`to_sparse_matrix`).
+
+        Args:
+            state: State vector of the system, of size ``2**nb_qubits``.
+
+        Returns:
+            The expectation value.
+
+        Raises:
+            ValueError: If the size of the state does not match the number of
+                qubits of the Pauli string.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> bell = np.array([1, 0, 0, 1]) / np.sqrt(2)
+            >>> round((X @ X + 2 * Z @ Z - Y @ Y + 4 * Z @ I).expectation(bell), 5)
+            4.0
+
+        """
+        size = 2**self.nb_qubits
+        if len(state) != size:
+            raise ValueError(
+                f"The state of size {len(state)} does not match the {self.nb_qubits}"
+                " qubits of the Pauli string."
+            )
+        columns = np.arange(size, dtype=np.int64)
+        result = 0
+        for mono in self.simplify().monomials:
+            x_mask, z_mask, phase = _index_masks(mono)
+            result += (
+                mono.coef
+                * phase
+                * np.vdot(
+                    state[columns ^ x_mask], _parity_signs(columns & z_mask) * state
+                )
+            )
+        return float(np.real(result))
+
     @staticmethod
-    def from_matrix(matrix: Matrix) -> PauliString:
-        """Constructs a PauliString from a matrix.
+    def from_matrix(matrix: Matrix, threshold: Optional[float] = None) -> PauliString:
+        r"""Constructs a PauliString from a matrix.
+
+        The coefficient of each Pauli monomial `P` is `\text{Tr}(PM)/2^n`. All
+        of them are computed at once by a Pauli transform (analogous to the
+        Walsh-Hadamard transform): the matrix is seen as a tensor with one
+        axis of dimension 4 (row bit and column bit) per qubit, and each of
+        these axes is mapped on the Pauli basis in turn, for a total cost of
+        `O(n4^n)`.
 
         Args:
             matrix: Matrix from which the PauliString is generated.
+            threshold: Coefficients smaller (in absolute value) than this
+                threshold are dropped, which can be used to get a sparser
+                decomposition. By default, only the coefficients close to
+                ``0`` (up to the numerical tolerance) are dropped.
 
         Returns:
             Pauli string decomposition of the matrix in parameter.
@@ -300,18 +510,38 @@ class PauliString:
         if 2**num_qubits != matrix.shape[0]:
             raise ValueError("Matrix dimensions must be a power of 2.")
 
-        # Return the ordered Pauli basis for the n-qubit Pauli basis.
-        pauli_1q = [PauliStringMonomial(1, [atom]) for atom in [I, X, Y, Z]]
-        basis = pauli_1q
-        for _ in range(num_qubits - 1):
-            basis = [p1 @ p2 for p1 in basis for p2 in pauli_1q]
+        # the axes are reordered as (row_0, col_0, row_1, col_1, ...) so that
+        # each qubit gets a single axis indexed by 2*row + col
+        coefs = (
+            np.asarray(matrix, dtype=complex)
+            .reshape((2,) * (2 * num_qubits))
+            .transpose(
+                [
+                    axis + offset
+                    for axis in range(num_qubits)
+                    for offset in (0, num_qubits)
+                ]
+            )
+            .reshape((4,) * num_qubits)
+        )
+        for axis in range(num_qubits):
+            coefs = np.moveaxis(
+                np.tensordot(_PAULI_TRANSFORM, coefs, axes=([1], [axis])), 0, axis
+            )
+        coefs = coefs.real.ravel() / 2**num_qubits
+
+        if threshold is None:
+            kept = ~np.isclose(coefs, 0, atol=atol, rtol=rtol)
+        else:
+            kept = np.abs(coefs) > threshold
 
+        atoms = [I, X, Y, Z]
         pauli_list = PauliString()
-        for i, mat in enumerate(basis):
-            coeff = (np.trace(mat.to_matrix().dot(matrix)) / (2**num_qubits)).real
-            if not np.isclose(coeff, 0, atol=atol, rtol=rtol):
-                mono = basis[i] * coeff
-                pauli_list += mono
+        for index in np.flatnonzero(kept):
+            labels = np.unravel_index(index, (4,) * num_qubits)
+            pauli_list.monomials.append(
+                PauliStringMonomial(coefs[index], [atoms[i] for i in labels])
+            )
 
         if len(pauli_list.monomials) == 0:
             pauli_list.monomials.append(
@@ -673,6 +903,27 @@ class PauliString:
         return hash(monomials_as_tuples)
 
 
+class _ReadOnlyList(list):  # pyright: ignore[reportMissingTypeArgument]
+    """List which cannot be modified in place, used to share the content of
+    frozen Pauli strings (see :meth:`PauliString.freeze`). Its copies are
+    regular lists."""
+
+    def _read_only(self, *args: Any, **kwargs: Any):
+        raise ValueError("The content of a frozen PauliString cannot be modified.")
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return [deepcopy(item, memo) for item in self]
+
+    def __reduce__(self):
+        return (_ReadOnlyList, (list(self),))
+
+
 class PauliStringMonomial(PauliString):
     """Represents a monomial in a Pauli string, consisting of a coefficient and
     a list of PauliStringAtom objects.
@@ -687,9 +938,30 @@ class PauliStringMonomial(PauliString):
     ):
         self.coef = coef
         """Coefficient of the monomial."""
+        if isinstance(atoms, _ReadOnlyList):
+            # the atoms of a frozen monomial are not shared with a mutable one
+            atoms = list(atoms)
         self.atoms = [] if atoms is None else atoms
         """The list of atoms in the monomial."""
 
+    def __setattr__(self, name: str, value: Any):
+        if self._frozen and name in {"coef", "atoms"}:
+            raise AttributeError("A frozen PauliStringMonomial cannot be modified.")
+        super().__setattr__(name, value)
+
+    def freeze(self) -> PauliStringMonomial:
+        """Freezes the monomial (see :meth:`PauliString.freeze`): its in place
+        operators return a new monomial, and its coefficient and atoms cannot
+        be modified anymore.
+
+        Returns:
+            The monomial itself.
+        """
+        if not self._frozen:
+            self.atoms = _ReadOnlyList(self.atoms)
+            self._frozen = True
+        return self
+
     @property
     def nb_qubits(self) -> int:
         return len(self.atoms)
@@ -733,6 +1005,7 @@ class PauliStringMonomial(PauliString):
         return res
 
     def __imul__(self, other: FixedReal) -> PauliStringMonomial:
+        self = self._thawed()
         self.coef *= other
         return self
 
@@ -742,6 +1015,7 @@ class PauliStringMonomial(PauliString):
         return res
 
     def __itruediv__(self, other: FixedReal) -> PauliStringMonomial:
+        self = self._thawed()
         self.coef /= other
         return self
 
@@ -751,6 +1025,7 @@ class PauliStringMonomial(PauliString):
         return res
 
     def __imatmul__(self, other: PauliString) -> PauliString:
+        self = self._thawed()
         if isinstance(other, PauliStringAtom):
             self.atoms.append(other)
             return self
@@ -887,6 +1162,10 @@ class PauliStringAtom(PauliStringMonomial):
             raise AttributeError("This object is immutable")
         super().__setattr__(name, value)
 
+    def freeze(self) -> PauliStringAtom:
+        # atoms are always immutable
+        return self
+
     def __str__(self):
         return self.label
 
@@ -1003,7 +1282,7 @@ Matrix representation:
 `\begin{pmatrix}0&1\\1&0\end{pmatrix}`
 
 """
-Y = PauliStringAtom("Y", np.fliplr(np.diag([1j, -1j])))
+Y = PauliStringAtom("Y", np.fliplr(np.diag([-1j, 1j])))
 r"""Pauli-Y atom representing the Y operator in a Pauli monomial or string.
 Matrix representation:
 `\begin{pmatrix}0&-i\\i&0\end{pmatrix}`
@@ -1016,3 +1295,37 @@ Matrix representation:
 
 _pauli_atom_dict = {"I": I, "X": X, "Y": Y, "Z": Z}
 _allow_atom_creation = False
+
+_PAULI_TRANSFORM = np.array(
+    [atom.matrix.T.flatten() for atom in (I, X, Y, Z)], dtype=complex
+)
+"""Maps the entries ``(m00, m01, m10, m11)`` of a 2x2 matrix ``m`` to the traces
+``Tr(Pm)`` for ``P`` in ``I``, ``X``, ``Y`` and ``Z``."""
+
+
+def _index_masks(mono: PauliStringMonomial) -> tuple[int, int, complex]:
+    r"""Computes the masks, on the indices of the computational basis (the first
+    qubit being the most significant bit), of the qubits flipped (``X`` and
+    ``Y``) and of the qubits adding a sign (``Z`` and ``Y``) by a monomial, as
+    well as the global phase `i^{\#Y}` of the monomial."""
+    x_mask, z_mask, nb_y = 0, 0, 0
+    for atom in mono.atoms:
+        x_mask <<= 1
+        z_mask <<= 1
+        if atom.label in "XY":
+            x_mask |= 1
+        if atom.label in "ZY":
+            z_mask |= 1
+        nb_y += atom.label == "Y"
+    return x_mask, z_mask, 1j**nb_y
+
+
+def _parity_signs(values: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    """Computes `(-1)^{|v|}` for each integer `v` of ``values``, `|v|` being
+    the number of bits set in `v`."""
+    values = values.copy()
+    shift = 32
+    while shift > 0:
+        values ^= values >> shift
+        shift //= 2
+    return 1 - 2 * (values & 1)
@@ -0,0 +1,388 @@
+r"""For large Pauli strings (typically molecular Hamiltonians with tens of
+thousands of terms), the object representation of :class:`PauliString` becomes
+slow to manipulate. :class:`PauliStringArray` is a compact alternative, based
+on the symplectic representation of Pauli operators: each monomial is encoded
+by two bit masks, the ``X`` mask and the ``Z`` mask, packed in ``uint64``
+words, with the coefficients stored in a separate array.
+
+On a qubit, the couple of bits `(x, z)` encodes the atom `I` for `(0, 0)`, `X`
+for `(1, 0)`, `Z` for `(0, 1)` and `Y` for `(1, 1)`. All the operations are
+vectorized over the monomials, and the phases appearing when multiplying
+Pauli operators are tracked using bit counts.
+
+The conversion to and from the object API is done with
+:meth:`PauliStringArray.from_pauli_string` and
+:meth:`PauliStringArray.to_pauli_string`."""
+
+from __future__ import annotations
+
+from numbers import Complex
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+from typeguard import typechecked
+
+from mpqp.core.instruction.measurement.pauli_string import (
+    PauliString,
+    PauliStringMonomial,
+    _pauli_atom_dict,
+)
+
+_WORD_SIZE = 64
+_SHIFTS = np.arange(_WORD_SIZE, dtype=np.uint64)
+_PHASES = np.array([1, 1j, -1, -1j])
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+
+@typechecked
+class PauliStringArray:
+    """Pauli string stored as arrays of bit masks and coefficients.
+
+    Args:
+        x: ``X`` masks of the monomials, of shape ``(nb_monomials, nb_words)``.
+        z: ``Z`` masks of the monomials, of the same shape as ``x``.
+        coefs: Coefficients of the monomials.
+        nb_qubits: Number of qubits the Pauli string acts on.
+
+    Raises:
+        ValueError: If the shapes of the arrays are inconsistent.
+
+    Example:
+        >>> from mpqp.measures import I, X, Y, Z
+        >>> ps = PauliStringArray.from_pauli_string(2 * X @ Y + Z @ I)
+        >>> ps
+        2*X@Y + 1*Z@I
+        >>> ps.dot(ps).simplify()
+        5*I@I
+
+    """
+
+    def __init__(
+        self,
+        x: npt.NDArray[np.uint64],
+        z: npt.NDArray[np.uint64],
+        coefs: npt.NDArray[np.complex128],
+        nb_qubits: int,
+    ):
+        nb_words = _nb_words(nb_qubits)
+        if x.shape != z.shape or x.shape != (len(coefs), nb_words):
+            raise ValueError(
+                f"Inconsistent shapes for the masks {x.shape}, {z.shape} and the "
+                f"coefficients {coefs.shape} of a Pauli string on {nb_qubits} qubits."
+            )
+        self.x = x.astype(np.uint64, copy=False)
+        """``X`` masks of the monomials."""
+        self.z = z.astype(np.uint64, copy=False)
+        """``Z`` masks of the monomials."""
+        self.coefs = coefs.astype(np.complex128, copy=False)
+        """Coefficients of the monomials."""
+        self.nb_qubits = nb_qubits
+        """See parameter description."""
+
+    @classmethod
+    def from_pauli_string(cls, pauli_string: PauliString) -> PauliStringArray:
+        """Converts a Pauli string from the object API to the array
+        representation.
+
+        Args:
+            pauli_string: The Pauli string to convert.
+
+        Returns:
+            The equivalent array representation.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> ps = PauliStringArray.from_pauli_string(X @ I + 3 * Y @ Z)
+            >>> ps.x, ps.z
+            (array([[1],
+                   [1]], dtype=uint64), array([[0],
+                   [3]], dtype=uint64))
+
+        """
+        monomials = pauli_string.monomials
+        nb_qubits = pauli_string.nb_qubits
+        labels = np.array(
+            [[atom.label for atom in mono.atoms] for mono in monomials], dtype="<U1"
+        ).reshape(len(monomials), nb_qubits)
+        return cls(
+            _pack((labels == "X") | (labels == "Y"), nb_qubits),
+            _pack((labels == "Z") | (labels == "Y"), nb_qubits),
+            np.array([mono.coef for mono in monomials], dtype=np.complex128),
+            nb_qubits,
+        )
+
+    def to_pauli_string(self) -> PauliString:
+        """Converts this Pauli string back to the object API.
+
+        Returns:
+            The equivalent :class:`PauliString`.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> ps = 2 * X @ Y + Z @ I
+            >>> PauliStringArray.from_pauli_string(ps).to_pauli_string() == ps
+            True
+
+        """
+        codes = self.atom_codes()
+        atoms = [_pauli_atom_dict[label] for label in "IXYZ"]
+        return PauliString(
+            [
+                PauliStringMonomial(_clean_coef(coef), [atoms[c] for c in row])
+                for coef, row in zip(self.coefs, codes.tolist())
+            ]
+        )
+
+    def atom_codes(self) -> npt.NDArray[np.uint8]:
+        """Unpacks the masks into the atoms of each monomial, encoded as ``0``
+        for ``I``, ``1`` for ``X``, ``2`` for ``Y`` and ``3`` for ``Z`` (the
+        alphabetical order of the labels).
+
+        Returns:
+            The array of shape ``(nb_monomials, nb_qubits)`` of the codes.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> PauliStringArray.from_pauli_string(X @ Y @ Z @ I).atom_codes()
+            array([[1, 2, 3, 0]], dtype=uint8)
+
+        """
+        x = _unpack(self.x, self.nb_qubits)
+        z = _unpack(self.z, self.nb_qubits)
+        return (x ^ z) + 2 * z
+
+    def __len__(self) -> int:
+        return len(self.coefs)
+
+    def __repr__(self) -> str:
+        return repr(self.to_pauli_string())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PauliStringArray):
+            return False
+        if self.nb_qubits != other.nb_qubits:
+            return False
+        left, right = self.simplify(), other.simplify()
+        return (
+            np.array_equal(left.x, right.x)
+            and np.array_equal(left.z, right.z)
+            and np.allclose(left.coefs, right.coefs)
+        )
+
+    def __neg__(self) -> PauliStringArray:
+        return -1 * self
+
+    def __add__(self, other: PauliStringArray) -> PauliStringArray:
+        if self.nb_qubits != other.nb_qubits:
+            raise ValueError(
+                f"Non homogeneous sizes for given PauliStrings: {(self, other)}"
+            )
+        return PauliStringArray(
+            np.concatenate([self.x, other.x]),
+            np.concatenate([self.z, other.z]),
+            np.concatenate([self.coefs, other.coefs]),
+            self.nb_qubits,
+        )
+
+    def __sub__(self, other: PauliStringArray) -> PauliStringArray:
+        return self + (-1) * other
+
+    def __mul__(self, other: Complex) -> PauliStringArray:
+        return PauliStringArray(
+            self.x.copy(), self.z.copy(), self.coefs * complex(other), self.nb_qubits
+        )
+
+    def __rmul__(self, other: Complex) -> PauliStringArray:
+        return self * other
+
+    def __truediv__(self, other: Complex) -> PauliStringArray:
+        return self * (1 / complex(other))
+
+    def __matmul__(self, other: PauliStringArray) -> PauliStringArray:
+        """Tensor product, as for :class:`PauliString`, ``self`` acting on the
+        first qubits."""
+        nb_qubits = self.nb_qubits + other.nb_qubits
+
+        def tensor(left: npt.NDArray[np.uint64], right: npt.NDArray[np.uint64]):
+            bits = np.concatenate(
+                [
+                    np.repeat(_unpack(left, self.nb_qubits), len(other), axis=0),
+                    np.tile(_unpack(right, other.nb_qubits), (len(self), 1)),
+                ],
+                axis=1,
+            )
+            return _pack(bits, nb_qubits)
+
+        return PauliStringArray(
+            tensor(self.x, other.x),
+            tensor(self.z, other.z),
+            np.outer(self.coefs, other.coefs).ravel(),
+            nb_qubits,
+        )
+
+    def dot(self, other: PauliStringArray) -> PauliStringArray:
+        r"""Operator product of two Pauli strings, all the products of
+        monomials being computed at once. The phase of the product of two
+        Pauli operators is tracked from the masks: writing each monomial
+        `i^{x \cdot z} X^x Z^z`, the product of `(x_1, z_1)` and `(x_2, z_2)`
+        has masks `(x_1 \oplus x_2, z_1 \oplus z_2)` and the phase
+        `i^{|x_1 z_1| + |x_2 z_2| + 2|z_1 x_2| - |x_3 z_3|}`.
+
+        Args:
+            other: The right hand side of the product.
+
+        Returns:
+            The product, not simplified.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> x = PauliStringArray.from_pauli_string(X @ I)
+            >>> y = PauliStringArray.from_pauli_string(Y @ Z)
+            >>> x.dot(y)
+            1j*Z@Z
+
+        """
+        if self.nb_qubits != other.nb_qubits:
+            raise ValueError(
+                f"Non homogeneous sizes for given PauliStrings: {(self, other)}"
+            )
+        x1, z1 = self.x[:, None, :], self.z[:, None, :]
+        x2, z2 = other.x[None, :, :], other.z[None, :, :]
+        x3, z3 = x1 ^ x2, z1 ^ z2
+        phase = (
+            _popcount(x1 & z1)
+            + _popcount(x2 & z2)
+            + 2 * _popcount(z1 & x2)
+            - _popcount(x3 & z3)
+        ) % 4
+        coefs = np.outer(self.coefs, other.coefs) * _PHASES[phase]
+        nb_words = _nb_words(self.nb_qubits)
+        return PauliStringArray(
+            x3.reshape(-1, nb_words),
+            z3.reshape(-1, nb_words),
+            coefs.ravel(),
+            self.nb_qubits,
+        )
+
+    def commutes(self, qubitwise: bool = False) -> npt.NDArray[np.bool_]:
+        """Computes which pairs of monomials commute.
+
+        Two monomials commute if they anticommute on an even number of qubits
+        (two different non identity atoms anticommute). They commute
+        *qubitwise* if they commute on each qubit, meaning that on each qubit,
+        the atoms are the same or one of them is the identity.
+
+        Args:
+            qubitwise: If ``True``, the qubitwise commutation is checked
+                instead of the general one.
+
+        Returns:
+            The symmetric boolean matrix of size ``nb_monomials`` indicating
+            which pairs of monomials commute.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> ps = PauliStringArray.from_pauli_string(X @ X + Y @ Y + X @ I)
+            >>> ps.commutes().astype(int)
+            array([[1, 1, 1],
+                   [1, 1, 0],
+                   [1, 0, 1]])
+            >>> ps.commutes(qubitwise=True).astype(int)
+            array([[1, 0, 1],
+                   [0, 1, 0],
+                   [1, 0, 1]])
+
+        """
+        x1, z1 = self.x[:, None, :], self.z[:, None, :]
+        x2, z2 = self.x[None, :, :], self.z[None, :, :]
+        if qubitwise:
+            differ = ((x1 ^ x2) | (z1 ^ z2)) & (x1 | z1) & (x2 | z2)
+            return ~np.any(differ, axis=-1)
+        return _popcount((x1 & z2) ^ (z1 & x2)) % 2 == 0
+
+    def sort(self) -> PauliStringArray:
+        """Sorts the monomials in alphabetical order of their atoms, as
+        :meth:`PauliString.sort_monomials` does.
+
+        Returns:
+            The Pauli string with its monomials sorted.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> PauliStringArray.from_pauli_string(2 * I @ Z + .5 * I @ X + X @ Y).sort()
+            0.5*I@X + 2*I@Z + 1*X@Y
+
+        """
+        order = np.lexsort(self.atom_codes().T[::-1])
+        return PauliStringArray(
+            self.x[order], self.z[order], self.coefs[order], self.nb_qubits
+        )
+
+    def simplify(self, atol: Optional[float] = None) -> PauliStringArray:
+        """Merges the identical monomials, sorts them and removes the ones with
+        a null coefficient.
+
+        Args:
+            atol: Coefficients smaller than this tolerance (in absolute value)
+                are considered null. Defaults to exact comparison to ``0``.
+
+        Returns:
+            The simplified Pauli string.
+
+        Example:
+            >>> from mpqp.measures import I, X, Y, Z
+            >>> ps = X @ Z + 2 * I @ I - X @ Z + Y @ Y
+            >>> PauliStringArray.from_pauli_string(ps).simplify()
+            2*I@I + 1*Y@Y
+
+        """
+        nb_words = _nb_words(self.nb_qubits)
+        masks, inverse = np.unique(
+            np.concatenate([self.x, self.z], axis=1), axis=0, return_inverse=True
+        )
+        coefs = np.zeros(len(masks), dtype=np.complex128)
+        np.add.at(coefs, inverse.ravel(), self.coefs)
+        kept = np.abs(coefs) > (0 if atol is None else atol)
+        result = PauliStringArray(
+            masks[kept, :nb_words], masks[kept, nb_words:], coefs[kept], self.nb_qubits
+        )
+        return result.sort()
+
+
+def _nb_words(nb_qubits: int) -> int:
+    return max(1, -(-nb_qubits // _WORD_SIZE))
+
+
+def _pack(bits: npt.NDArray[np.bool_], nb_qubits: int) -> npt.NDArray[np.uint64]:
+    """Packs a boolean array of shape ``(m, nb_qubits)`` in ``uint64`` words,
+    qubit ``q`` being the bit ``q % 64`` of the word ``q // 64``."""
+    nb_words = _nb_words(nb_qubits)
+    padded = np.zeros((len(bits), nb_words * _WORD_SIZE), dtype=np.uint64)
+    padded[:, :nb_qubits] = bits
+    # the bits being distinct powers of two, the sum is a bitwise or
+    return (padded.reshape(len(bits), nb_words, _WORD_SIZE) << _SHIFTS).sum(
+        axis=-1, dtype=np.uint64
+    )
+
+
+def _unpack(words: npt.NDArray[np.uint64], nb_qubits: int) -> npt.NDArray[np.uint8]:
+    """Inverse of :func:`_pack`."""
+    bits = (words[..., None] >> _SHIFTS) & np.uint64(1)
+    return bits.reshape(len(words), words.shape[1] * _WORD_SIZE)[:, :nb_qubits].astype(
+        np.uint8
+    )
+
+
+def _popcount(words: npt.NDArray[np.uint64]) -> npt.NDArray[np.int64]:
+    """Number of bits set, summed over the last axis of ``words``."""
+    as_bytes = np.ascontiguousarray(words).view(np.uint8)
+    return _POPCOUNT_TABLE[as_bytes].sum(axis=-1)
+
+
+def _clean_coef(coef: complex) -> complex | float | int:
+    """Converts back the coefficients to the types used in the object API."""
+    if coef.imag != 0:
+        return complex(coef)
+    real = float(coef.real)
+    return int(real) if real == int(real) else real
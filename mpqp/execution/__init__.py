@@ -6,12 +6,13 @@ from .devices import (
     GOOGLEDevice,
     IBMDevice,
     AZUREDevice,
+    MPQPDevice,
 )
 from .job import Job, JobStatus, JobType
 from .result import BatchResult, Result, Sample, StateVector
-from .runner import adjust_measure, run, submit
+from .runner import adjust_measure, run, run_async, submit, submit_async
 
 # This import has to be done after the loading of result to work, `pass` is a
 # trick to avoid isort to move this line above
 pass
-from .remote_handler import get_remote_result
+from .remote_handler import get_remote_result, get_remote_result_async
@@ -10,6 +10,9 @@ Each supported provider has its available devices listed as these enums:
 - :class:`GOOGLEDevice`.
 - :class:`AZUREDevice`.
 
+In addition to these, :class:`MPQPDevice` lists the simulators shipped with
+``MPQP`` itself, which do not depend on any provider.
+
 Not all combinations of :class:`AvailableDevice` and 
 :class:`~mpqp.execution.job.JobType` are possible. Here is the list of
 compatible jobs types and devices.
@@ -485,3 +488,36 @@ class AZUREDevice(AvailableDevice):
 
     def supports_observable_ideal(self) -> bool:
         return False
+
+
+class MPQPDevice(AvailableDevice):
+    """Enum regrouping all the simulators implemented directly in ``MPQP``.
+
+    These devices only rely on ``numpy``, no provider SDK is needed to use
+    them."""
+
+    STATEVECTOR = auto()
+
+    def is_remote(self) -> bool:
+        return False
+
+    def is_gate_based(self) -> bool:
+        return True
+
+    def is_simulator(self) -> bool:
+        return True
+
+    def is_noisy_simulator(self) -> bool:
+        return False
+
+    def supports_samples(self) -> bool:
+        return True
+
+    def supports_state_vector(self) -> bool:
+        return True
+
+    def supports_observable(self) -> bool:
+        return True
+
+    def supports_observable_ideal(self) -> bool:
+        return True
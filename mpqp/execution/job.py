@@ -88,7 +88,9 @@ class Job:
             sections.
         device: Device (simulator, quantum computer) on which we want to execute
             the job.
-        measure: Object representing the measure to perform.
+        measure: Object representing the measure to perform. For observable
+            jobs evaluating several expectation measures at once, it is left
+            to ``None`` and the measures are the ones of the circuit.
 
     Examples:
         >>> circuit = QCircuit(3)
@@ -104,9 +106,9 @@ class Job:
 
     """
 
-    # 3M-TODO: decide, when there are several measurements, if we define a
-    #  multi-measure job, or if we need several jobs. For the moment, a Job can
-    #  handle only one measurement
+    # 3M-TODO: several measurements are only handled when they are all
+    #  expectation measures (evaluated together by the runner), decide if we
+    #  define a multi-measure job for the other cases
 
     def __init__(
         self,
@@ -125,6 +127,12 @@ class Job:
         """See parameter description."""
         self.measure = measure
         """See parameter description."""
+        self.pruned_from: Optional[Job] = None
+        """The job from which this one was derived by removing the gates and
+        qubits not influencing its measure (see the ``prune`` parameter of
+        :class:`~mpqp.core.instruction.measurement.basis_measure.BasisMeasure`,
+        observable jobs being always restricted to the light cone of their
+        observable). ``None`` if the circuit was not pruned."""
 
         self.id: Optional[str] = None
         """Contains the id of the remote job, used to retrieve the result from 
@@ -146,18 +154,7 @@ class Job:
             if self.device.is_remote():
                 if TYPE_CHECKING:
                     assert isinstance(self.id, str)
-                if isinstance(self.device, ATOSDevice):
-                    self._status = get_qlm_job_status(self.id)
-                elif isinstance(self.device, IBMDevice):
-                    self._status = get_ibm_job_status(self.id)
-                elif isinstance(self.device, AWSDevice):
-                    self._status = get_aws_job_status(self.id)
-                elif isinstance(self.device, AZUREDevice):
-                    self._status = get_azure_job_status(self.id)
-                else:
-                    raise NotImplementedError(
-                        f"Cannot update job status for the device {self.device} yet"
-                    )
+                self._status = get_remote_job_status(self.id, self.device)
         return self._status
 
     @status.setter
@@ -165,6 +162,32 @@ class Job:
         self._status = job_status
 
 
+@typechecked
+def get_remote_job_status(job_id: str, device: AvailableDevice) -> JobStatus:
+    """Retrieves the status of a remote job from its id and the device it was
+    submitted to.
+
+    Args:
+        job_id: Id of the job for which we want to retrieve the status.
+        device: Remote device on which the job was submitted.
+
+    Returns:
+        The status of the job.
+    """
+    if isinstance(device, ATOSDevice):
+        return get_qlm_job_status(job_id)
+    elif isinstance(device, IBMDevice):
+        return get_ibm_job_status(job_id)
+    elif isinstance(device, AWSDevice):
+        return get_aws_job_status(job_id)
+    elif isinstance(device, AZUREDevice):
+        return get_azure_job_status(job_id)
+    else:
+        raise NotImplementedError(
+            f"Cannot update job status for the device {device} yet"
+        )
+
+
 @typechecked
 def get_qlm_job_status(job_id: str) -> JobStatus:
     """Retrieves the status of a QLM job from the id in parameter, and returns
@@ -3,19 +3,20 @@ from __future__ import annotations
 import warnings
 from itertools import permutations
 from statistics import mean
-from typing import TYPE_CHECKING, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 import numpy as np
 from typeguard import typechecked
 
 from mpqp import Language
 from mpqp.core.circuit import QCircuit
+from mpqp.core.instruction.gates.native_gates import RotationGate
 from mpqp.core.instruction.measurement import (
     BasisMeasure,
     ExpectationMeasure,
     Observable,
 )
-from mpqp.gates import CNOT, CRk, Rk
+from mpqp.gates import CNOT, ControlledGate, CRk, Rk, U
 from mpqp.noise.noise_model import Depolarizing, NoiseModel
 
 from ...tools.errors import (
@@ -37,6 +38,75 @@ if TYPE_CHECKING:
     from qat.qlmaas.result import AsyncResult
 
 
+@typechecked
+def mpqp_to_myqlm_Circuit(circuit: QCircuit) -> "Circuit":
+    """Builds the myQLM circuit corresponding to the gates of ``circuit``,
+    applying each native gate directly to a myQLM ``Program``, without going
+    through OpenQASM. The gates are the same as the ones the OpenQASM parser
+    would produce: in particular, controlled phase gates (:class:`CP`,
+    :class:`CRk`, ...) are decomposed in ``CNOT`` and ``PH`` gates, on which
+    the noise of the circuit is applied (see :func:`generate_hardware_model`).
+    Measurements, barriers and breakpoints are left out.
+
+    Args:
+        circuit: The circuit to convert. It must only contain native gates with
+            numeric parameters.
+
+    Returns:
+        The equivalent myQLM circuit.
+
+    Example:
+        >>> myqlm_circuit = mpqp_to_myqlm_Circuit(QCircuit([H(0), CNOT(0, 1)]))
+        >>> myqlm_circuit.display(batchmode=True) # doctest: +NORMALIZE_WHITESPACE
+          ┌─┐
+         ─┤H├─●─
+          └─┘ │
+              │
+             ┌┴┐
+         ────┤X├
+             └─┘
+
+    """
+    from qat.lang import AQASM
+    from qat.lang.AQASM import AbstractGate, Program
+
+    # same definition as the `U` gate of the OpenQASM parser of myQLM
+    u_gate = AbstractGate(
+        "U",
+        [float, float, float],
+        arity=1,
+        matrix_generator=lambda theta, phi, gamma: U(theta, phi, gamma, 0).to_matrix(),
+    )
+    program = Program()
+    qubits = program.qalloc(circuit.nb_qubits)
+
+    def apply(gate: Any, indices: list[int]):
+        program.apply(gate, *(qubits[index] for index in indices))
+
+    for gate in circuit.gates:
+        if isinstance(gate, U):
+            apply(u_gate(*(float(param) for param in gate.parameters)), gate.targets)
+        elif isinstance(gate, RotationGate) and isinstance(gate, ControlledGate):
+            # decomposition of the `cu1` gate of qelib1.inc
+            control, target = gate.controls[0], gate.targets[0]
+            half_theta = float(gate.theta) / 2
+            apply(AQASM.PH(half_theta), [control])
+            apply(AQASM.CNOT, [control, target])
+            apply(AQASM.PH(-half_theta), [target])
+            apply(AQASM.CNOT, [control, target])
+            apply(AQASM.PH(half_theta), [target])
+        else:
+            myqlm_gate = getattr(AQASM, gate.qlm_aqasm_keyword)
+            if isinstance(gate, RotationGate):
+                myqlm_gate = myqlm_gate(float(gate.theta))
+            indices = gate.targets
+            if isinstance(gate, ControlledGate):
+                indices = gate.controls + gate.targets
+            apply(myqlm_gate, indices)
+
+    return program.to_circ()
+
+
 @typechecked
 def job_pre_processing(job: Job) -> "Circuit":
     """Extracts the myQLM circuit and check if ``job.type`` and ``job.measure``
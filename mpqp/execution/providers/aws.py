@@ -5,7 +5,7 @@ import numpy as np
 from typeguard import typechecked
 
 from mpqp import Language, QCircuit
-from mpqp.core.instruction.gates import CRk
+from mpqp.core.instruction.gates import CRk, ControlledGate, Id
 from mpqp.core.instruction.measurement import (
     BasisMeasure,
     ExpectationMeasure,
@@ -23,6 +23,56 @@ if TYPE_CHECKING:
     from braket.tasks import GateModelQuantumTaskResult, QuantumTask
 
 
+@typechecked
+def mpqp_to_braket_Circuit(circuit: QCircuit) -> "Circuit":
+    """Builds the Braket circuit corresponding to the gates of ``circuit``,
+    mapping each native gate directly to its Braket counterpart, without going
+    through OpenQASM. Qubits without any gate get an identity gate, so the
+    Braket circuit has the same number of qubits. Measurements, barriers and
+    breakpoints are left out, and noise is not applied (see
+    :func:`apply_noise_to_braket_circuit`).
+
+    Args:
+        circuit: The circuit to convert. It must only contain native gates with
+            numeric parameters.
+
+    Returns:
+        The equivalent Braket circuit.
+
+    Example:
+        >>> print(mpqp_to_braket_Circuit(QCircuit([H(0), CNOT(0, 1)], nb_qubits=3)))  # doctest: +NORMALIZE_WHITESPACE
+        T  : │  0  │  1  │
+              ┌───┐
+        q0 : ─┤ H ├───●───
+              └───┘   │
+                    ┌─┴─┐
+        q1 : ───────┤ X ├─
+                    └───┘
+              ┌───┐
+        q2 : ─┤ I ├───────
+              └───┘
+        T  : │  0  │  1  │
+
+    """
+    from braket.circuits import Circuit, Instruction
+
+    gates = circuit.gates
+    used_qubits = set().union(*(gate.connections() for gate in gates))
+    instructions = [
+        Instruction(Id(qubit).to_other_language(Language.BRAKET), qubit)
+        for qubit in range(circuit.nb_qubits)
+        if qubit not in used_qubits
+    ]
+    for gate in gates:
+        qubits = gate.targets
+        if isinstance(gate, ControlledGate):
+            qubits = gate.controls + gate.targets
+        instructions.append(
+            Instruction(gate.to_other_language(Language.BRAKET), qubits)
+        )
+    return Circuit(instructions)
+
+
 @typechecked
 def apply_noise_to_braket_circuit(
     braket_circuit: "Circuit",
@@ -185,9 +235,12 @@ def submit_job_braket(job: Job) -> tuple[str, "QuantumTask"]:
     elif job.job_type == JobType.OBSERVABLE:
         if TYPE_CHECKING:
             assert isinstance(job.measure, ExpectationMeasure)
-        herm_op = job.measure.observable.to_other_language(Language.BRAKET)
+        # the Hermitian matrix is only built on the qubits on which the
+        # observable acts non-trivially (padded observables for instance)
+        observable, support = job.measure.observable.restricted_to_support()
+        herm_op = observable.to_other_language(Language.BRAKET)
         braket_circuit.expectation(  # pyright: ignore[reportAttributeAccessIssue]
-            observable=herm_op, target=job.measure.targets
+            observable=herm_op, target=[job.measure.targets[q] for q in support]
         )
 
         job.status = JobStatus.RUNNING
@@ -6,6 +6,7 @@ from mpqp.core.instruction.measurement.pauli_string import PauliString
 from mpqp.tools.errors import DeviceJobIncompatibleError
 
 if TYPE_CHECKING:
+    from cirq.circuits.circuit import Circuit as CirqCircuit
     from cirq.sim.state_vector_simulator import StateVectorTrialResult
     from cirq.study.result import Result as CirqResult
     from cirq.work.observable_measurement_data import ObservableMeasuredResult
@@ -13,6 +14,26 @@ if TYPE_CHECKING:
 from typeguard import typechecked
 
 from mpqp import Language
+from mpqp.core.circuit import QCircuit
+from mpqp.core.instruction.gates import (
+    CNOT,
+    CZ,
+    SWAP,
+    TOF,
+    ControlledGate,
+    H,
+    Id,
+    Rx,
+    Ry,
+    Rz,
+    S,
+    T,
+    U,
+    X,
+    Y,
+    Z,
+)
+from mpqp.core.instruction.gates.native_gates import RotationGate
 from mpqp.core.instruction.measurement.basis_measure import BasisMeasure
 from mpqp.core.instruction.measurement.expectation_value import ExpectationMeasure
 from mpqp.execution.devices import GOOGLEDevice
@@ -20,6 +41,98 @@ from mpqp.execution.job import Job, JobType
 from mpqp.execution.result import Result, Sample, StateVector
 
 
+@typechecked
+def mpqp_to_cirq_Circuit(circuit: QCircuit) -> "CirqCircuit":
+    """Builds the cirq circuit corresponding to ``circuit``, mapping each native
+    gate and basis measure directly to its cirq counterpart, without going
+    through OpenQASM. As with the OpenQASM import, the qubits are named
+    ``q_0``, ``q_1``, ..., each of them starts with an identity gate, and the
+    measurement of qubit ``i`` in the classical bit ``j`` has the key ``c_j``.
+    Barriers and breakpoints are left out.
+
+    Args:
+        circuit: The circuit to convert. It must only contain native gates with
+            numeric parameters.
+
+    Returns:
+        The equivalent cirq circuit.
+
+    Example:
+        >>> print(mpqp_to_cirq_Circuit(QCircuit([H(0), CNOT(0, 1)]))) # doctest: +NORMALIZE_WHITESPACE
+        q_0: ───I───H───@───
+                        │
+        q_1: ───I───────X───
+
+    """
+    import numpy as np
+    from cirq.circuits.circuit import Circuit
+    from cirq.ops.common_gates import CNOT as Cirq_CNOT
+    from cirq.ops.common_gates import CZ as Cirq_CZ
+    from cirq.ops.common_gates import CZPowGate
+    from cirq.ops.common_gates import H as Cirq_H
+    from cirq.ops.common_gates import S as Cirq_S
+    from cirq.ops.common_gates import T as Cirq_T
+    from cirq.ops.common_gates import ZPowGate, rx, ry, rz
+    from cirq.ops.identity import I as Cirq_I
+    from cirq.ops.matrix_gates import MatrixGate
+    from cirq.ops.measure_util import measure
+    from cirq.ops.named_qubit import NamedQubit
+    from cirq.ops.pauli_gates import X as Cirq_X
+    from cirq.ops.pauli_gates import Y as Cirq_Y
+    from cirq.ops.pauli_gates import Z as Cirq_Z
+    from cirq.ops.swap_gates import SWAP as Cirq_SWAP
+    from cirq.ops.three_qubit_gates import TOFFOLI as Cirq_TOFFOLI
+
+    fixed_gates = {
+        Id: Cirq_I,
+        X: Cirq_X,
+        Y: Cirq_Y,
+        Z: Cirq_Z,
+        H: Cirq_H,
+        S: Cirq_S,
+        T: Cirq_T,
+        SWAP: Cirq_SWAP,
+        CNOT: Cirq_CNOT,
+        CZ: Cirq_CZ,
+        TOF: Cirq_TOFFOLI,
+    }
+    rotations = {Rx: rx, Ry: ry, Rz: rz}
+
+    qubits = [NamedQubit(f"q_{index}") for index in range(circuit.nb_qubits)]
+    cirq_circuit = Circuit(Cirq_I(qubit) for qubit in qubits)
+    operations = []
+    for gate in circuit.gates:
+        indices = gate.targets
+        if isinstance(gate, ControlledGate):
+            indices = gate.controls + gate.targets
+        if type(gate) in fixed_gates:
+            cirq_gate = fixed_gates[type(gate)]
+        elif type(gate) in rotations:
+            cirq_gate = rotations[type(gate)](float(gate.theta))
+        elif isinstance(gate, RotationGate):
+            # phase gates: P, Rk, Rk_dagger and their controlled versions
+            exponent = float(gate.theta) / np.pi
+            if isinstance(gate, ControlledGate):
+                cirq_gate = CZPowGate(exponent=exponent)
+            else:
+                cirq_gate = ZPowGate(exponent=exponent)
+        elif isinstance(gate, U):
+            cirq_gate = MatrixGate(gate.to_matrix().astype(complex), name="U")
+        else:
+            raise NotImplementedError(f"Gate {gate} has no cirq equivalent.")
+        operations.append(cirq_gate.on(*(qubits[index] for index in indices)))
+
+    for measurement in circuit.measurements:
+        if not isinstance(measurement, BasisMeasure):
+            continue
+        c_targets = measurement.c_targets or range(len(measurement.targets))
+        for target, c_target in zip(measurement.targets, c_targets):
+            operations.append(measure(qubits[target], key=f"c_{c_target}"))
+
+    cirq_circuit.append(operations)
+    return cirq_circuit
+
+
 @typechecked
 def run_google(job: Job) -> Result:
     """Executes the job on the right Google device precised in the job in
@@ -0,0 +1,154 @@
+"""Simulators developed directly in ``MPQP``, relying only on ``numpy``. They
+do not require any provider SDK to be installed, and are useful as a
+lightweight reference to validate results coming from other providers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+from typeguard import typechecked
+
+from mpqp.core.circuit import QCircuit
+from mpqp.core.instruction.measurement.basis_measure import BasisMeasure
+from mpqp.core.instruction.measurement.expectation_value import ExpectationMeasure
+from mpqp.execution.devices import MPQPDevice
+from mpqp.execution.job import Job, JobStatus, JobType
+from mpqp.execution.result import Result, Sample, StateVector
+from mpqp.tools.maths import apply_matrix, fuse_gates
+
+
+@typechecked
+def simulate_state_vector(
+    circuit: QCircuit, fusion_size: int = 3
+) -> npt.NDArray[np.complex64]:
+    r"""Computes the state vector obtained by applying the gates of the circuit
+    to the state `|0\dots0\rangle`.
+
+    The state is stored as a tensor of shape ``(2,)*n`` and each gate is
+    contracted on the axes it targets, so the memory footprint stays
+    proportional to `2^n` (and not `4^n`). Beforehand, consecutive gates
+    acting together on at most ``fusion_size`` qubits are fused in a single
+    dense block, so the state is swept once per block instead of once per gate.
+
+    Args:
+        circuit: The circuit to simulate. Everything but the gates is ignored.
+        fusion_size: Maximal number of qubits spanned by a block of fused
+            gates. Set it to ``0`` to disable the fusion.
+
+    Returns:
+        The final state vector of the circuit.
+
+    Example:
+        >>> print(clean_1D_array(simulate_state_vector(QCircuit([H(0), CNOT(0, 1)]))))
+        [0.70711, 0, 0, 0.70711]
+
+    """
+    nb_qubits = circuit.nb_qubits
+    state = np.zeros((2,) * nb_qubits, dtype=complex)
+    state[(0,) * nb_qubits] = 1
+    for matrix, qubits in fuse_gates(circuit.gates, fusion_size):
+        state = apply_matrix(state, matrix, qubits)
+    return state.reshape(2**nb_qubits)
+
+
+@typechecked
+def run_native(job: Job) -> Result:
+    """Executes the job on the ``MPQP`` state vector simulator.
+
+    Args:
+        job: Job to be executed.
+
+    Returns:
+        The result of the job.
+
+    Raises:
+        ValueError: If the job's device is not a ``MPQPDevice``, or if the job
+            type is not handled.
+
+    Note:
+        This function is not meant to be used directly, please use
+        :func:`~mpqp.execution.runner.run` instead.
+    """
+    if not isinstance(job.device, MPQPDevice):
+        raise ValueError(
+            "`job` must correspond to an `MPQPDevice`, but corresponds to a "
+            f"{job.device} instead"
+        )
+
+    job.status = JobStatus.RUNNING
+    vector = simulate_state_vector(job.circuit)
+
+    if job.job_type == JobType.STATE_VECTOR:
+        # the simulation is exact, no global phase is lost along the way
+        job.circuit.gphase = 0
+        result = Result(job, StateVector(vector, job.circuit.nb_qubits), 0, 0)
+    elif job.job_type == JobType.SAMPLE:
+        if TYPE_CHECKING:
+            assert isinstance(job.measure, BasisMeasure)
+        result = _sample(vector, job)
+    elif job.job_type == JobType.OBSERVABLE:
+        if TYPE_CHECKING:
+            assert isinstance(job.measure, ExpectationMeasure)
+        result = _expectation_value(vector, job)
+    else:
+        raise ValueError(f"Job type {job.job_type} not handled.")
+
+    job.status = JobStatus.DONE
+    return result
+
+
+def _sample(vector: npt.NDArray[np.complex64], job: Job) -> Result:
+    """Samples the qubits targeted by the basis measure of the job."""
+    assert job.measure is not None
+    nb_qubits = job.circuit.nb_qubits
+    targets = job.measure.targets
+
+    probabilities = np.abs(vector.reshape((2,) * nb_qubits)) ** 2
+    others = tuple(q for q in range(nb_qubits) if q not in targets)
+    marginal = np.sum(probabilities, axis=others) if others else probabilities
+    # `np.sum` keeps the remaining axes in increasing order, we put them back
+    # in the order of the measure targets
+    marginal = np.transpose(marginal, np.argsort(np.argsort(targets))).flatten()
+    marginal /= np.sum(marginal)
+
+    counts = np.random.default_rng().multinomial(job.measure.shots, marginal)
+    samples = [
+        Sample(len(targets), index=int(index), count=int(counts[index]))
+        for index in np.flatnonzero(counts)
+    ]
+    return Result(job, samples, None, job.measure.shots)
+
+
+def _expectation_value(vector: npt.NDArray[np.complex64], job: Job) -> Result:
+    """Computes the expectation value of the observable of the job, exactly if
+    the measure has no shots, and otherwise by sampling each group of qubitwise
+    commuting monomials of the observable in the basis diagonalizing it. The
+    matrix of the observable is never built."""
+    assert isinstance(job.measure, ExpectationMeasure)
+    shots = job.measure.shots
+
+    if shots == 0:
+        return Result(job, job.measure.observable.expectation(vector), 0, 0)
+
+    nb_qubits = job.circuit.nb_qubits
+    rng = np.random.default_rng()
+    mean, variance, total_shots = 0.0, 0.0, 0
+    for group in job.measure.observable.pauli_string.group_commuting("qubitwise"):
+        values = ExpectationMeasure.diagonal_values(group)
+        if ExpectationMeasure.std_dev_bound(group) == 0:
+            # only the groups of identities are not measured
+            mean += float(values[0])
+            continue
+        state = vector.reshape((2,) * nb_qubits)
+        for gate in ExpectationMeasure.basis_rotation(group):
+            state = apply_matrix(state, gate.to_matrix(), gate.targets)
+        probabilities = np.abs(state.reshape(2**nb_qubits)) ** 2
+        probabilities /= np.sum(probabilities)
+        counts = rng.multinomial(shots, probabilities)
+        group_mean = float(counts @ values / shots)
+        mean += group_mean
+        variance += float(counts @ (values - group_mean) ** 2 / shots**2)
+        total_shots += shots
+    return Result(job, mean, float(np.sqrt(variance)), total_shots)
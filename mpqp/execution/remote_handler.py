@@ -1,9 +1,14 @@
 """After the jobs are submitted, one can use the functions of this module to
 retrieve the results from a job_id or the job directly, and list all job
-attached to the configured accounts."""
+attached to the configured accounts.
+
+Results can also be awaited using :func:`get_remote_result_async`, which
+polls the status of the job without blocking the event loop."""
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import Executor
 from typing import Optional
 
 from typeguard import typechecked
@@ -23,11 +28,12 @@ from mpqp.execution.devices import (
     AZUREDevice,
     IBMDevice,
 )
-from mpqp.execution.job import Job
+from mpqp.execution.job import Job, JobStatus, get_remote_job_status
 from mpqp.execution.providers.atos import get_result_from_qlm_job_id
 from mpqp.execution.providers.aws import get_result_from_aws_task_arn
 from mpqp.execution.providers.ibm import get_result_from_ibm_job_id
 from mpqp.execution.providers.azure import get_result_from_azure_job_id
+from mpqp.tools.errors import RemoteExecutionError
 
 
 @typechecked
@@ -82,6 +88,27 @@ def get_remote_result(
          Number of qubits: 2
 
     """
+    job_data, device = _resolve_remote_job(job_data, device)
+
+    if isinstance(device, IBMDevice):
+        return get_result_from_ibm_job_id(job_data)
+    elif isinstance(device, ATOSDevice):
+        return get_result_from_qlm_job_id(job_data)
+    elif isinstance(device, AWSDevice):
+        return get_result_from_aws_task_arn(job_data)
+    elif isinstance(device, AZUREDevice):
+        return get_result_from_azure_job_id(job_data)
+    else:
+        raise NotImplementedError(
+            f"The device {device.name} is not supported for remote features."
+        )
+
+
+def _resolve_remote_job(
+    job_data: str | Job, device: Optional[AvailableDevice]
+) -> tuple[str, AvailableDevice]:
+    """Extracts the job id and the device from the inputs of
+    :func:`get_remote_result`, and checks that they point to a remote job."""
     if isinstance(job_data, Job):
         if job_data.id is None:
             raise ValueError("Can't retrieve remote result for a job whose id is None.")
@@ -100,18 +127,82 @@ def get_remote_result(
             "Trying to retrieve a remote result while the device of the job was local."
         )
 
-    if isinstance(device, IBMDevice):
-        return get_result_from_ibm_job_id(job_data)
-    elif isinstance(device, ATOSDevice):
-        return get_result_from_qlm_job_id(job_data)
-    elif isinstance(device, AWSDevice):
-        return get_result_from_aws_task_arn(job_data)
-    elif isinstance(device, AZUREDevice):
-        return get_result_from_azure_job_id(job_data)
-    else:
-        raise NotImplementedError(
-            f"The device {device.name} is not supported for remote features."
-        )
+    return job_data, device
+
+
+@typechecked
+async def get_remote_result_async(
+    job_data: str | Job,
+    device: Optional[AvailableDevice] = None,
+    poll_interval: float = 1,
+    max_poll_interval: float = 30,
+    timeout: Optional[float] = None,
+    executor: Optional[Executor] = None,
+) -> Result:
+    """Asynchronous version of :func:`get_remote_result`. The status of the job
+    is polled (in an executor, since providers only offer blocking calls) with
+    an exponential backoff until the job is over, after which the result is
+    retrieved. Several results can thus be awaited concurrently, using
+    :func:`asyncio.gather` for instance.
+
+    Args:
+        job_data: Either the :class:`~mpqp.execution.job.Job` object or the
+            job id used to identify the job on the remote device.
+        device: Remote device on which the job was launched, needed only if
+            ``job_data`` is the identifier of the job.
+        poll_interval: Initial delay, in seconds, between two status checks.
+            This delay doubles after each check, up to ``max_poll_interval``.
+        max_poll_interval: Maximal delay, in seconds, between two status
+            checks.
+        timeout: If given, maximal time, in seconds, to wait for the job to
+            be over.
+        executor: Executor in which the calls to the provider are run.
+            Defaults to the default executor of the running event loop.
+
+    Returns:
+        The ``Result`` of the desired remote job.
+
+    Raises:
+        RemoteExecutionError: If the job is not over before the ``timeout``.
+
+    Example:
+        >>> async def main(job_ids: list[str]):
+        ...     return await asyncio.gather(
+        ...         *(
+        ...             get_remote_result_async(job_id, ATOSDevice.QLM_LINALG)
+        ...             for job_id in job_ids
+        ...         )
+        ...     )
+        >>> results = asyncio.run(main(['Job141933', 'Job141934'])) # doctest: +SKIP
+
+    """
+    job_id, device = _resolve_remote_job(job_data, device)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    delay = poll_interval
+
+    def status() -> JobStatus:
+        if isinstance(job_data, Job):
+            return job_data.status
+        return get_remote_job_status(job_id, device)
+
+    while await loop.run_in_executor(executor, status) not in {
+        JobStatus.DONE,
+        JobStatus.ERROR,
+        JobStatus.CANCELLED,
+    }:
+        sleep = delay
+        if timeout is not None:
+            elapsed = loop.time() - start
+            if elapsed >= timeout:
+                raise RemoteExecutionError(
+                    f"Job {job_id} on {device.name} was not over after {timeout}s."
+                )
+            sleep = min(delay, timeout - elapsed)
+        await asyncio.sleep(sleep)
+        delay = min(2 * delay, max_poll_interval)
+
+    return await loop.run_in_executor(executor, get_remote_result, job_id, device)
 
 
 def get_all_job_ids() -> dict[type[AvailableDevice], list[str]]:
@@ -13,7 +13,11 @@ The job type affects the data contained in the :class:`Result`. For a given
   though you could rebuild them from said list, we also provide a few shorthands
   like ``result.probabilities`` and ``result.counts``;
 - for a job type ``OBSERVABLE`` you can retrieve the expectation value (a 
-  ``float``) from ``result.expectation_value``.
+  ``float``) from ``result.expectation_value``. When the circuit contains
+  several expectation measures, all the values are evaluated from the same
+  execution, and ``result.expectation_value`` is the array of the values (in
+  the order of the measures in the circuit). In any case,
+  ``result.expectation_values`` gives this array.
 
 When several devices are given to :func:`~mpqp.execution.runner.run`, the 
 results are stored in a :class:`BatchResult`.
@@ -181,7 +185,8 @@ class Result:
     +-------------+--------------+
     | Job Type    | Data Type    |
     +=============+==============+
-    | OBSERVABLE  | float        |
+    | OBSERVABLE  | float or     |
+    |             | list[float]  |
     +-------------+--------------+
     | SAMPLE      | list[Sample] |
     +-------------+--------------+
@@ -191,8 +196,11 @@ class Result:
     Args:
         job: Type of the job related to this result.
         data: Data of the result, can be an expectation value (float), a
-            StateVector, or a list of sample depending on the job_type.
-        errors: Information about the error or the variance in the measurement.
+            list of expectation values (when several expectation measures are
+            evaluated together), a StateVector, or a list of sample depending
+            on the job_type.
+        errors: Information about the error or the variance in the measurement
+            (one per expectation value if several are given).
         shots: Number of shots of the experiment (equal to zero if the exact
             value was required).
 
@@ -225,6 +233,9 @@ class Result:
         Result: ATOSDevice, MYQLM_CLINALG
          Expectation value: -3.09834
          Error/Variance: 0.021
+        >>> result = Result(job, [-3.09834, 0.5], [0.021, 0.013], 2048)
+        >>> result.expectation_values
+        array([-3.09834,  0.5    ])
 
     """
 
@@ -234,8 +245,10 @@ class Result:
     def __init__(
         self,
         job: Job,
-        data: float | StateVector | list[Sample],
-        errors: Optional[float | dict[PauliString, float] | dict[Any, Any]] = None,
+        data: float | list[float] | StateVector | list[Sample],
+        errors: Optional[
+            float | list[float] | dict[PauliString, float] | dict[Any, Any]
+        ] = None,
         shots: int = 0,
     ):
         self.job = job
@@ -253,13 +266,19 @@ class Result:
 
         # depending on the type of job, fills the result info from the data in parameter
         if job.job_type == JobType.OBSERVABLE:
-            if not isinstance(data, float):
+            if isinstance(data, float):
+                self._expectation_value = data
+            elif (
+                isinstance(data, list)
+                and len(data) != 0
+                and all(isinstance(value, float) for value in data)
+            ):
+                self._expectation_value = np.array(data, dtype=float)
+            else:
                 raise TypeError(
-                    "Wrong type of data in the result. "
-                    "Expecting float for expectation value of an observable"
+                    "Wrong type of data in the result. Expecting float (or list "
+                    "of floats) for expectation value of an observable"
                 )
-            else:
-                self._expectation_value = data
         elif job.job_type == JobType.STATE_VECTOR:
             if not isinstance(data, StateVector):
                 raise TypeError(
@@ -327,8 +346,9 @@ class Result:
         return self.job.device
 
     @property
-    def expectation_value(self) -> float:
-        """Get the expectation value stored in this result"""
+    def expectation_value(self) -> float | npt.NDArray[np.float64]:
+        """Get the expectation value stored in this result (or the array of
+        expectation values if several expectation measures were evaluated)"""
         if self.job.job_type != JobType.OBSERVABLE:
             raise ResultAttributeError(
                 f"Job type: {self.job.job_type.name} but cannot get expectation"
@@ -338,6 +358,12 @@ class Result:
             assert self._expectation_value is not None
         return self._expectation_value
 
+    @property
+    def expectation_values(self) -> npt.NDArray[np.float64]:
+        """Get the array of the expectation values stored in this result (of
+        length one if a single expectation measure was evaluated)"""
+        return np.atleast_1d(np.asarray(self.expectation_value, dtype=float))
+
     @property
     def amplitudes(self) -> npt.NDArray[np.complex64]:
         """Get the amplitudes of the state of this result"""
@@ -572,6 +598,14 @@ class BatchResult:
     def __getitem__(self, index: int):
         return self.results[index]
 
+    @property
+    def expectation_values(self) -> npt.NDArray[np.float64]:
+        """Get the expectation values of all the results, as an array of shape
+        ``(number of results, number of expectation measures)``. All the
+        results must come from observable jobs with the same number of
+        expectation measures."""
+        return np.array([result.expectation_values for result in self.results])
+
     def plot(self, show: bool = True):
         """Display the result(s) using ``matplotlib.pyplot``.
 
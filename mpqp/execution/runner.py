@@ -4,7 +4,10 @@ the function :func:`run`. You can execute said circuit on one or several devices
 (local or remote). The function will wait (blocking) until the job is completed
 and will return a :class:`~mpqp.execution.result.Result` if only one
 device was given or a :class:`~mpqp.execution.result.BatchResult` 
-otherwise (see the section :ref:`Results` for more details).
+otherwise (see the section :ref:`Results` for more details). When several
+circuits and/or devices are given, the executions can be dispatched
+concurrently using the ``max_workers`` or ``executor`` arguments of
+:func:`run`.
 
 Alternatively, when running jobs on a remote device, you might prefer to
 retrieve the result asynchronously, without having to wait and block the
@@ -14,25 +17,42 @@ return the corresponding job id and :class:`~mpqp.execution.job.Job` object.
 
 .. note::
     Unlike :func:`run`, we can only submit on one device at a time.
+
+Both functions also have an ``asyncio`` counterpart, :func:`run_async` and
+:func:`submit_async`, running the blocking provider calls in an executor so
+that several executions can be awaited together (using :func:`asyncio.gather`
+for instance).
 """
 
 from __future__ import annotations
 
+import asyncio
+import warnings
+from concurrent.futures import Executor, ThreadPoolExecutor
+from copy import copy
 from numbers import Complex
 from textwrap import indent
 from typing import Iterable, Optional
 
 import numpy as np
+import numpy.typing as npt
 from sympy import Expr
 from typeguard import typechecked
 
 from mpqp.core.circuit import QCircuit
 from mpqp.core.instruction.breakpoint import Breakpoint
+from mpqp.core.instruction.gates.parametrized_gate import ParametrizedGate
 from mpqp.core.instruction.measurement.basis_measure import BasisMeasure
+from mpqp.core.instruction.measurement.measure import Measure
 from mpqp.core.instruction.measurement.expectation_value import (
     ExpectationMeasure,
     Observable,
 )
+from mpqp.core.instruction.measurement.pauli_string import (
+    I,
+    PauliString,
+    PauliStringMonomial,
+)
 from mpqp.execution.devices import (
     ATOSDevice,
     AvailableDevice,
@@ -40,6 +60,7 @@ from mpqp.execution.devices import (
     AZUREDevice,
     GOOGLEDevice,
     IBMDevice,
+    MPQPDevice,
 )
 from mpqp.execution.job import Job, JobStatus, JobType
 from mpqp.execution.providers.atos import run_atos, submit_QLM
@@ -47,6 +68,7 @@ from mpqp.execution.providers.aws import run_braket, submit_job_braket
 from mpqp.execution.providers.azure import run_azure
 from mpqp.execution.providers.google import run_google
 from mpqp.execution.providers.ibm import run_ibm, submit_remote_ibm
+from mpqp.execution.providers.native import run_native
 from mpqp.execution.result import BatchResult, Result
 from mpqp.execution.simulated_devices import IBMSimulatedDevice, SimulatedDevice
 from mpqp.tools.display import state_vector_ket_shape
@@ -65,6 +87,10 @@ def adjust_measure(measure: ExpectationMeasure, circuit: QCircuit):
     the qubits measured are ordered and contiguous (though this is done in
     :func:`generate_job`)
 
+    The padding is done on the PauliString of the observable, by adding ``I``
+    atoms to its monomials, so the matrix of the padded observable is never
+    built: the providers get a compact representation of the observable.
+
     Args:
         measure: The expectation measure, potentially incomplete.
         circuit: The circuit to which will be added the potential swaps allowing
@@ -74,12 +100,27 @@ def adjust_measure(measure: ExpectationMeasure, circuit: QCircuit):
     Returns:
         The measure padded with identities before and after.
     """
-    Id_before = np.eye(2 ** measure.rearranged_targets[0])
-    Id_after = np.eye(2 ** (circuit.nb_qubits - measure.rearranged_targets[-1] - 1))
+    nb_before = measure.rearranged_targets[0]
+    nb_after = circuit.nb_qubits - measure.rearranged_targets[-1] - 1
+    observable = measure.observable
+    if nb_before != 0 or nb_after != 0:
+        observable = Observable(
+            PauliString(
+                [
+                    PauliStringMonomial(
+                        mono.coef, [I] * nb_before + mono.atoms + [I] * nb_after
+                    )
+                    for mono in observable.pauli_string.monomials
+                ]
+            )
+        )
     tweaked_measure = ExpectationMeasure(
-        Observable(np.kron(np.kron(Id_before, measure.observable.matrix), Id_after)),
+        observable,
         list(range(circuit.nb_qubits)),
         measure.shots,
+        grouping=measure.grouping,
+        optimize_shots=measure.optimize_shots,
+        allocation_rounds=measure.allocation_rounds,
     )
     return tweaked_measure
 
@@ -103,14 +144,26 @@ def generate_job(
     Returns:
         The Job containing information about the execution of the circuit.
     """
-    circuit = circuit.subs(values, True)
+    if len(values) != 0 or _has_symbolic_parameters(circuit):
+        circuit = circuit.subs(values, True)
+    else:
+        # nothing to substitute: a shallow copy is enough to isolate the job
+        # from the caller's circuit (the global phase can be set during the
+        # execution for instance), the gates are never modified by the job but
+        # the lists and the measures can be
+        circuit = copy(circuit)
+        circuit.instructions = [
+            copy(instruction) if isinstance(instruction, Measure) else instruction
+            for instruction in circuit.instructions
+        ]
+        circuit.noises = list(circuit.noises)
 
     m_list = circuit.measurements
     nb_meas = len(m_list)
 
     if nb_meas == 0:
         job = Job(JobType.STATE_VECTOR, circuit, device)
-    elif nb_meas == 1:
+    elif nb_meas == 1 and not _has_several_observables(circuit):
         measurement = m_list[0]
         if isinstance(measurement, BasisMeasure):
             modified_circuit = circuit.without_measurements() + measurement.pre_measure
@@ -119,6 +172,8 @@ def generate_job(
                 job = Job(JobType.STATE_VECTOR, modified_circuit, device, measurement)
             else:
                 job = Job(JobType.SAMPLE, modified_circuit, device, measurement)
+                if measurement.prune:
+                    job = _pruned(job)
         elif isinstance(measurement, ExpectationMeasure):
             job = Job(
                 JobType.OBSERVABLE,
@@ -126,19 +181,139 @@ def generate_job(
                 device,
                 adjust_measure(measurement, circuit),
             )
+            reduced, reduced_measure = _light_cone_reduction(circuit, measurement)
+            if reduced is not circuit:
+                reduced_job = Job(
+                    JobType.OBSERVABLE,
+                    reduced + reduced_measure.pre_measure,
+                    device,
+                    adjust_measure(reduced_measure, reduced),
+                )
+                reduced_job.pruned_from = job
+                job = reduced_job
         else:
             raise NotImplementedError(
                 f"Measurement type {type(measurement)} not handled"
             )
+    elif all(isinstance(measurement, ExpectationMeasure) for measurement in m_list):
+        # the observables are evaluated together by the runner, see
+        # `_run_observables`
+        job = Job(JobType.OBSERVABLE, circuit, device)
     else:
         raise NotImplementedError(
-            "The current version of MPQP does not support multiple measurements in a "
-            "circuit."
+            "The current version of MPQP only supports multiple measurements in a "
+            "circuit when they are all expectation measures."
         )
 
     return job
 
 
+def _light_cone_reduction(
+    circuit: QCircuit, measure: ExpectationMeasure
+) -> tuple[QCircuit, ExpectationMeasure]:
+    """Restricts the circuit to the light cone of the qubits on which the
+    observable acts non-trivially (see :meth:`~mpqp.core.circuit.QCircuit.light_cone`),
+    the measure being moved on the relabelled qubits. The circuit and measure
+    are left unchanged when the light cone spans the whole circuit, or when
+    the circuit contains noise models (the noise models being defined on the
+    qubits of the original circuit).
+
+    As for :func:`_pruned`, the job of the reduced circuit keeps track of the
+    original one (see :func:`generate_job`), so the result can be reported on
+    it."""
+    if len(circuit.noises) != 0:
+        return circuit, measure
+    observable, support = measure.observable.restricted_to_support()
+    reduced, qubits = circuit.light_cone([measure.targets[q] for q in support])
+    if len(qubits) == circuit.nb_qubits:
+        return circuit, measure
+    relabelling = {qubit: index for index, qubit in enumerate(qubits)}
+    with warnings.catch_warnings():
+        # the user was already warned about unordered targets
+        warnings.simplefilter("ignore")
+        reduced_measure = ExpectationMeasure(
+            observable,
+            [relabelling[measure.targets[q]] for q in support],
+            measure.shots,
+            measure.label,
+            grouping=measure.grouping,
+            optimize_shots=measure.optimize_shots,
+            allocation_rounds=measure.allocation_rounds,
+        )
+    reduced.add(reduced_measure)
+    return reduced, reduced_measure
+
+
+def _pruned(job: Job) -> Job:
+    """Removes from the circuit of a sample job the gates outside of the light
+    cone of the measured qubits, and the qubits they only act on (see
+    :meth:`~mpqp.core.circuit.QCircuit.light_cone`). The pruned job keeps
+    track of the original one, so the result can be reported on it.
+
+    The change of basis of the measure being already part of the circuit of a
+    sample job, the pruned measure is done in the computational basis.
+
+    The job is left unchanged if its circuit contains noise models, if the
+    classical bits of the measure were chosen by the user (they would not
+    match the pruned circuit), or if no qubit can be removed."""
+    measure = job.measure
+    assert isinstance(measure, BasisMeasure)
+    if len(job.circuit.noises) != 0 or measure.user_set_c_targets:
+        return job
+    reduced, qubits = job.circuit.light_cone(measure.targets)
+    if len(qubits) == job.circuit.nb_qubits:
+        return job
+    relabelling = {qubit: index for index, qubit in enumerate(qubits)}
+    reduced_measure = BasisMeasure(
+        [relabelling[target] for target in measure.targets],
+        shots=measure.shots,
+        label=measure.label,
+    )
+    reduced.add(reduced_measure)
+    pruned_job = Job(JobType.SAMPLE, reduced, job.device, reduced_measure)
+    pruned_job.pruned_from = job
+    return pruned_job
+
+
+def _unpruned(result: Result) -> Result:
+    """Reports the result of a pruned job (see :func:`_pruned` and
+    :func:`_light_cone_reduction`) on the original job. The samples are indexed
+    on the measured qubits, in the same order in both jobs, and the
+    expectation value does not depend on the pruned qubits, so they are kept as
+    is."""
+    original = result.job.pruned_from
+    if original is None:
+        return result
+    original.status = result.job.status
+    if result.job.job_type == JobType.OBSERVABLE:
+        return Result(original, result.expectation_value, result.error, result.shots)
+    return Result(original, result.samples, result.error, result.shots)
+
+
+def _has_symbolic_parameters(circuit: QCircuit) -> bool:
+    """Checks if some parameters of the circuit are still symbolic, and thus
+    need to be substituted before the execution."""
+    return any(
+        isinstance(param, Expr)
+        for inst in circuit.instructions
+        if isinstance(inst, ParametrizedGate)
+        for param in inst.parameters
+    )
+
+
+def _has_several_observables(circuit: QCircuit) -> bool:
+    """Whether the circuit has several observables to evaluate, either in
+    several expectation measures or in a single one."""
+    return (
+        sum(
+            len(measure.observables)
+            for measure in circuit.measurements
+            if isinstance(measure, ExpectationMeasure)
+        )
+        > 1
+    )
+
+
 @typechecked
 def _run_single(
     circuit: QCircuit,
@@ -184,7 +359,8 @@ def _run_single(
         for k in range(len(circuit.breakpoints)):
             display_kth_breakpoint(circuit, k, device)
 
-    circuit = circuit.without_breakpoints()
+    if len(circuit.breakpoints) != 0:
+        circuit = circuit.without_breakpoints()
     job = generate_job(circuit, device, values)
     job.status = JobStatus.INIT
 
@@ -198,18 +374,304 @@ def _run_single(
         ):
             raise NotImplementedError(f"Noisy simulations not supported on {device}.")
 
+    if _has_several_observables(job.circuit):
+        return _run_observables(job)
+
+    if (
+        isinstance(job.measure, ExpectationMeasure)
+        and job.measure.grouping is not None
+        and job.measure.shots != 0
+    ):
+        return _unpruned(_run_grouped_observable(job))
+
     if isinstance(device, (IBMDevice, IBMSimulatedDevice)):
-        return run_ibm(job)
+        result = run_ibm(job)
     elif isinstance(device, ATOSDevice):
-        return run_atos(job)
+        result = run_atos(job)
     elif isinstance(device, AWSDevice):
-        return run_braket(job)
+        result = run_braket(job)
     elif isinstance(device, GOOGLEDevice):
-        return run_google(job)
+        result = run_google(job)
     elif isinstance(device, AZUREDevice):
-        return run_azure(job)
+        result = run_azure(job)
+    elif isinstance(device, MPQPDevice):
+        result = run_native(job)
     else:
         raise NotImplementedError(f"Device {device} not handled")
+    return _unpruned(result)
+
+
+def _run_grouped_observable(job: Job) -> Result:
+    """Estimates the expectation value of an observable job by measuring its
+    groups of qubitwise commuting Pauli monomials. Each group is measured in a
+    single sampling job, in the basis diagonalizing all its monomials, and the
+    expectation values of these monomials are computed from the same counts.
+
+    If the measure optimizes its shots, the budget is split across the groups
+    by :meth:`~mpqp.core.instruction.measurement.expectation_value.ExpectationMeasure.allocate_shots`,
+    possibly over several rounds, each round using the standard deviations
+    estimated from the counts of the previous ones.
+
+    Args:
+        job: The observable job to execute.
+
+    Returns:
+        The result of the job, the error being the standard deviation of the
+        estimator of the expectation value.
+    """
+    measure = job.measure
+    assert isinstance(measure, ExpectationMeasure)
+    job.status = JobStatus.RUNNING
+    circuit = job.circuit.without_measurements()
+    nb_qubits = circuit.nb_qubits
+
+    groups = measure.observable.pauli_string.group_commuting("qubitwise")
+    bounds = [measure.std_dev_bound(group) for group in groups]
+    # value of each (diagonalized) group observable for each basis state
+    values = [ExpectationMeasure.diagonal_values(group) for group in groups]
+    counts = [np.zeros(2**nb_qubits) for _ in groups]
+
+    def moments(index: int) -> tuple[float, float]:
+        nb_shots = counts[index].sum()
+        if nb_shots == 0:
+            # only the groups of identities are not measured
+            return values[index][0], 0
+        mean = counts[index] @ values[index] / nb_shots
+        return mean, counts[index] @ (values[index] - mean) ** 2 / nb_shots
+
+    rounds = measure.allocation_rounds if measure.optimize_shots else 1
+    std_devs = None
+    for round_index in range(rounds):
+        if measure.optimize_shots:
+            budget = (round_index + 1) * measure.shots // rounds
+            budget -= round_index * measure.shots // rounds
+            allocation = measure.allocate_shots(groups, std_devs, budget)
+        else:
+            allocation = [measure.shots if bound != 0 else 0 for bound in bounds]
+        for index, (group, shots) in enumerate(zip(groups, allocation)):
+            if shots != 0:
+                counts[index] += _sample_group(circuit, group, shots, job.device)
+        # the bound is used as an additional pseudo-observation of the variance
+        # to avoid starving the groups for which only a few shots were done
+        std_devs = [
+            float(np.sqrt((moments(i)[1] * count.sum() + bound**2) / (count.sum() + 1)))
+            for i, (count, bound) in enumerate(zip(counts, bounds))
+        ]
+
+    expectation_value, variance = 0.0, 0.0
+    for index, count in enumerate(counts):
+        mean, group_variance = moments(index)
+        expectation_value += mean
+        if count.sum() != 0:
+            variance += group_variance / count.sum()
+
+    job.status = JobStatus.DONE
+    return Result(
+        job,
+        float(expectation_value),
+        float(np.sqrt(variance)),
+        int(sum(count.sum() for count in counts)),
+    )
+
+
+def _run_observables(job: Job) -> Result:
+    """Evaluates all the observables of the expectation measures of the circuit
+    of the job from a single execution of the circuit.
+
+    If the measures are exact (no shots), the state is prepared once and each
+    observable is evaluated against it. When the device cannot return the
+    state (or the circuit is noisy), one observable job is run per observable
+    instead.
+
+    Otherwise, the monomials of all the observables are gathered in groups of
+    qubitwise commuting monomials, shared by all the observables containing
+    their monomials. Each observable allocates the shots of its measure to the
+    groups it needs, as in :func:`_run_grouped_observable`, and each group is
+    sampled with the largest number of shots allocated to it.
+
+    Args:
+        job: The observable job, its circuit containing several expectation
+            measures, or a measure with several observables.
+
+    Returns:
+        The result of the job, containing the expectation value (and error) of
+        each observable, in the order of the measures in the circuit and of
+        the observables in each measure.
+
+    Raises:
+        ValueError: If exact and shot based measures are mixed.
+    """
+    measures = [
+        measure
+        for measure in job.circuit.measurements
+        if isinstance(measure, ExpectationMeasure)
+    ]
+    assert len(measures) == len(job.circuit.measurements)
+    job.status = JobStatus.RUNNING
+    circuit = job.circuit.without_measurements()
+    nb_qubits = circuit.nb_qubits
+    entries = [
+        (measure, observable)
+        for measure in measures
+        for observable in measure.observables
+    ]
+    pauli_strings = [
+        _widened_pauli_string(measure, observable, nb_qubits)
+        for measure, observable in entries
+    ]
+    shots = {measure.shots for measure in measures}
+
+    if shots == {0}:
+        if job.device.supports_state_vector() and len(circuit.noises) == 0:
+            state = _run_single(circuit, job.device, {}, False).amplitudes
+            expectation_values = [ps.expectation(state) for ps in pauli_strings]
+        else:
+            expectation_values = []
+            for measure, observable in entries:
+                single = _run_single(
+                    circuit
+                    + QCircuit([ExpectationMeasure(observable, measure.targets)]),
+                    job.device,
+                    {},
+                    False,
+                )
+                expectation_values.append(float(single.expectation_value))
+        job.status = JobStatus.DONE
+        return Result(job, expectation_values, [0.0] * len(entries), 0)
+    if 0 in shots:
+        raise ValueError(
+            "Exact and shot based expectation measures cannot be mixed in a circuit."
+        )
+
+    # the union of the non identity monomials of all the observables
+    settings: dict[tuple[str, ...], PauliStringMonomial] = {}
+    for ps in pauli_strings:
+        for mono in ps.monomials:
+            key = tuple(atom.label for atom in mono.atoms)
+            if any(label != "I" for label in key):
+                settings.setdefault(key, PauliStringMonomial(1, mono.atoms))
+    groups = PauliString(list(settings.values())).group_commuting("qubitwise")
+    group_of = {
+        tuple(atom.label for atom in mono.atoms): index
+        for index, group in enumerate(groups)
+        for mono in group.monomials
+    }
+
+    # the constant part of each observable, and the part measured by each group
+    constants: list[float] = []
+    parts: list[dict[int, PauliString]] = []
+    for ps in pauli_strings:
+        constant = 0.0
+        monomials: dict[int, list[PauliStringMonomial]] = {}
+        for mono in ps.monomials:
+            key = tuple(atom.label for atom in mono.atoms)
+            if key in group_of:
+                monomials.setdefault(group_of[key], []).append(mono)
+            else:
+                constant += float(np.real(mono.coef))
+        constants.append(constant)
+        parts.append({index: PauliString(monos) for index, monos in monomials.items()})
+    values = [
+        {index: ExpectationMeasure.diagonal_values(part) for index, part in p.items()}
+        for p in parts
+    ]
+    counts = [np.zeros(2**nb_qubits) for _ in groups]
+
+    def moments(entry: int, index: int) -> tuple[float, float]:
+        nb_shots = counts[index].sum()
+        if nb_shots == 0:
+            # only the parts with null coefficients are not measured
+            return values[entry][index][0], 0
+        mean = counts[index] @ values[entry][index] / nb_shots
+        return mean, counts[index] @ (values[entry][index] - mean) ** 2 / nb_shots
+
+    def rounds(measure: ExpectationMeasure) -> int:
+        return measure.allocation_rounds if measure.optimize_shots else 1
+
+    for round_index in range(max(rounds(measure) for measure in measures)):
+        requested = [0] * len(groups)
+        for entry, (measure, _) in enumerate(entries):
+            if round_index >= rounds(measure):
+                continue
+            indices = list(parts[entry])
+            if measure.optimize_shots:
+                budget = (round_index + 1) * measure.shots // rounds(measure)
+                budget -= round_index * measure.shots // rounds(measure)
+                std_devs = None
+                if round_index != 0:
+                    # the bound is used as an additional pseudo-observation of
+                    # the variance, see `_run_grouped_observable`
+                    std_devs = [
+                        float(
+                            np.sqrt(
+                                (
+                                    moments(entry, index)[1] * counts[index].sum()
+                                    + measure.std_dev_bound(parts[entry][index]) ** 2
+                                )
+                                / (counts[index].sum() + 1)
+                            )
+                        )
+                        for index in indices
+                    ]
+                allocation = measure.allocate_shots(
+                    [parts[entry][index] for index in indices], std_devs, budget
+                )
+            else:
+                allocation = [measure.shots] * len(indices)
+            for index, nb_shots in zip(indices, allocation):
+                requested[index] = max(requested[index], nb_shots)
+        for index, nb_shots in enumerate(requested):
+            if nb_shots != 0:
+                counts[index] += _sample_group(
+                    circuit, groups[index], nb_shots, job.device
+                )
+
+    expectation_values, errors = [], []
+    for entry, constant in enumerate(constants):
+        expectation_value, variance = constant, 0.0
+        for index in parts[entry]:
+            mean, part_variance = moments(entry, index)
+            expectation_value += mean
+            if counts[index].sum() != 0:
+                variance += part_variance / counts[index].sum()
+        expectation_values.append(float(expectation_value))
+        errors.append(float(np.sqrt(variance)))
+
+    job.status = JobStatus.DONE
+    return Result(
+        job,
+        expectation_values,
+        errors,
+        int(sum(count.sum() for count in counts)),
+    )
+
+
+def _widened_pauli_string(
+    measure: ExpectationMeasure, observable: Observable, nb_qubits: int
+) -> PauliString:
+    """The Pauli string of an observable of the measure, acting on the
+    ``nb_qubits`` qubits of the circuit: the atoms of each monomial are placed
+    on the targets of the measure and completed by identities."""
+    targets = measure.targets if len(measure.targets) != 0 else range(nb_qubits)
+    monomials = []
+    for mono in observable.pauli_string.monomials:
+        atoms = [I] * nb_qubits
+        for atom, target in zip(mono.atoms, targets):
+            atoms[target] = atom
+        monomials.append(PauliStringMonomial(mono.coef, atoms))
+    return PauliString(monomials)
+
+
+def _sample_group(
+    circuit: QCircuit, group: PauliString, shots: int, device: AvailableDevice
+) -> npt.NDArray[np.float64]:
+    """Counts of the basis states once the basis of the qubits rotated to
+    diagonalize the group of qubitwise commuting monomials."""
+    group_circuit = circuit + QCircuit(
+        ExpectationMeasure.basis_rotation(group), nb_qubits=circuit.nb_qubits
+    )
+    group_circuit.add(BasisMeasure(list(range(circuit.nb_qubits)), shots=shots))
+    return np.array(_run_single(group_circuit, device, {}, False).counts, dtype=float)
 
 
 @typechecked
@@ -218,6 +680,8 @@ def run(
     device: OneOrMany[AvailableDevice],
     values: Optional[dict[Expr | str, Complex]] = None,
     display_breakpoints: bool = True,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
 ) -> Result | BatchResult:
     """Runs the circuit on the backend, or list of backend, provided in
     parameter.
@@ -233,9 +697,20 @@ def run(
         display_breakpoints: If ``False``, breakpoints will be disabled. Each
             breakpoint adds an execution of the circuit(s), so you may use this
             option for performance if need be.
+        max_workers: If given, the executions of a batch (several circuits
+            and/or devices) are dispatched concurrently on a thread pool of
+            this size. Threads are well suited here since most of the time is
+            spent waiting for remote providers or in native simulators
+            releasing the GIL.
+        executor: Alternatively, an already existing
+            :class:`~concurrent.futures.Executor` to dispatch the executions
+            of a batch on. It is left open after the call. Takes precedence
+            over ``max_workers``.
 
     Returns:
         The Result containing information about the measurement required.
+        For batches, the results are ordered as the circuits and the devices
+        given in input, regardless of the order in which they complete.
 
     Examples:
         >>> c = QCircuit(
@@ -287,25 +762,115 @@ def run(
          Samples:
           State: 11, Index: 3, Count: 1000, Probability: 1
          Error: None
+        >>> result = run([c, c2], IBMDevice.AER_SIMULATOR, max_workers=2)
+        >>> [r.job.circuit.label for r in result]
+        ['X CNOT circuit', 'X circuit']
 
     """
     if values is None:
         values = {}
 
-    def namer(circ: QCircuit, i: int):
-        circ.label = f"circuit {i}" if circ.label is None else circ.label
-        return circ
+    if not (isinstance(circuit, Iterable) or isinstance(device, Iterable)):
+        return _run_single(circuit, device, values, display_breakpoints)
+
+    tasks = _batch_tasks(circuit, device)
 
-    if isinstance(circuit, Iterable) or isinstance(device, Iterable):
+    if executor is None and max_workers is None:
         return BatchResult(
-            [
-                _run_single(namer(circ, i + 1), dev, values, display_breakpoints)
-                for i, circ in enumerate(flatten(circuit))
-                for dev in flatten(device)
-            ]
+            [_run_single(circ, dev, values, display_breakpoints) for circ, dev in tasks]
         )
-    else:
-        return _run_single(circuit, device, values, display_breakpoints)
+
+    def dispatch(pool: Executor) -> list[Result]:
+        futures = [
+            pool.submit(_run_single, circ, dev, values, display_breakpoints)
+            for circ, dev in tasks
+        ]
+        # futures are collected in submission order to keep the results ordered
+        return [future.result() for future in futures]
+
+    if executor is not None:
+        return BatchResult(dispatch(executor))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return BatchResult(dispatch(pool))
+
+
+def _batch_tasks(
+    circuit: OneOrMany[QCircuit], device: OneOrMany[AvailableDevice]
+) -> list[tuple[QCircuit, AvailableDevice]]:
+    """Lists the (circuit, device) pairs to execute for a batch, in the order
+    of the resulting :class:`~mpqp.execution.result.BatchResult`. Unnamed
+    circuits are given a default label."""
+
+    def namer(circ: QCircuit, i: int) -> QCircuit:
+        if circ.label is not None:
+            return circ
+        # the label is set on a copy to leave the user's circuit untouched
+        named = copy(circ)
+        named.label = f"circuit {i}"
+        return named
+
+    return [
+        (namer(circ, i + 1), dev)
+        for i, circ in enumerate(flatten(circuit))
+        for dev in flatten(device)
+    ]
+
+
+@typechecked
+async def run_async(
+    circuit: OneOrMany[QCircuit],
+    device: OneOrMany[AvailableDevice],
+    values: Optional[dict[Expr | str, Complex]] = None,
+    display_breakpoints: bool = True,
+    executor: Optional[Executor] = None,
+) -> Result | BatchResult:
+    """Asynchronous version of :func:`run`. The (blocking) executions are run in
+    an executor so the event loop remains free while waiting for the providers,
+    and all the executions of a batch run concurrently.
+
+    Args:
+        circuit: Circuit, or list of circuits, to be run.
+        device: Device, or list of devices, on which the circuit will be run.
+        values: Set of values to substitute symbolic variables. Defaults to ``{}``.
+        display_breakpoints: If ``False``, breakpoints will be disabled.
+        executor: Executor in which the executions are run. Defaults to the
+            default executor of the running event loop.
+
+    Returns:
+        The Result containing information about the measurement required, or
+        the BatchResult (in the same order as for :func:`run`) for batches.
+
+    Example:
+        >>> import asyncio
+        >>> async def main():
+        ...     return await asyncio.gather(
+        ...         run_async(QCircuit([X(0)]), MPQPDevice.STATEVECTOR),
+        ...         run_async(QCircuit([H(0), H(0)]), MPQPDevice.STATEVECTOR),
+        ...     )
+        >>> for result in asyncio.run(main()):
+        ...     print(clean_1D_array(result.amplitudes))
+        [0, 1]
+        [1, 0]
+
+    """
+    if values is None:
+        values = {}
+    loop = asyncio.get_running_loop()
+
+    if not (isinstance(circuit, Iterable) or isinstance(device, Iterable)):
+        return await loop.run_in_executor(
+            executor, _run_single, circuit, device, values, display_breakpoints
+        )
+
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                executor, _run_single, circ, dev, values, display_breakpoints
+            )
+            for circ, dev in _batch_tasks(circuit, device)
+        )
+    )
+    return BatchResult(list(results))
 
 
 @typechecked
@@ -344,6 +909,11 @@ def submit(
 
     Note:
         Unlike :func:`run`, you can only submit on one device at a time.
+
+    Raises:
+        RemoteExecutionError: If the device is not remote.
+        NotImplementedError: If the circuit contains several observables, or
+            if the device is not handled.
     """
     if values is None:
         values = {}
@@ -354,6 +924,10 @@ def submit(
 
     job = generate_job(circuit, device, values)
     job.status = JobStatus.INIT
+    if _has_several_observables(job.circuit):
+        raise NotImplementedError(
+            "Circuits with several observables can only be run, not submitted."
+        )
 
     if isinstance(device, IBMDevice):
         job_id, _ = submit_remote_ibm(job)
@@ -367,6 +941,47 @@ def submit(
     return job_id, job
 
 
+@typechecked
+async def submit_async(
+    circuit: QCircuit,
+    device: AvailableDevice,
+    values: Optional[dict[Expr | str, Complex]] = None,
+    executor: Optional[Executor] = None,
+) -> tuple[str, Job]:
+    """Asynchronous version of :func:`submit`, the submission (which can involve
+    network handshakes with the provider) is run in an executor. The result
+    can then be awaited using
+    :func:`~mpqp.execution.remote_handler.get_remote_result_async`.
+
+    Args:
+        circuit: QCircuit to be run.
+        device: Remote device to which the circuit will be submitted.
+        values: Values to substitute for symbolic variables. Defaults to ``{}``.
+        executor: Executor in which the submission is run. Defaults to the
+            default executor of the running event loop.
+
+    Returns:
+        The job id provided by the remote device after submission of the job.
+
+    Example:
+        >>> async def main():
+        ...     circuit = QCircuit([H(0), CNOT(0,1), BasisMeasure([0,1], shots=10)])
+        ...     _, job = await submit_async(circuit, ATOSDevice.QLM_LINALG)
+        ...     return await get_remote_result_async(job)
+        >>> print(asyncio.run(main())) # doctest: +SKIP
+        Result: ATOSDevice, QLM_LINALG
+         Counts: [5, 0, 0, 5]
+         Probabilities: [0.5, 0, 0, 0.5]
+         Samples:
+          State: 00, Index: 0, Count: 5, Probability: 0.5
+          State: 11, Index: 3, Count: 5, Probability: 0.5
+         Error: 0.16666666666666666
+
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, submit, circuit, device, values)
+
+
 def display_kth_breakpoint(
     circuit: QCircuit, k: int, device: AvailableDevice = ATOSDevice.MYQLM_CLINALG
 ):
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Collection, Optional, TypeVar, Union
+from typing import Any, Callable, Optional, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -14,8 +14,6 @@ from mpqp.execution.devices import AvailableDevice
 from mpqp.execution.runner import _run_single  # pyright: ignore[reportPrivateUsage]
 from mpqp.execution.vqa.optimizer import Optimizer
 
-T1 = TypeVar("T1")
-T2 = TypeVar("T2")
 OptimizerInput = Union[list[float], npt.NDArray[np.float32]]
 OptimizableFunc = Callable[[OptimizerInput], float]
 OptimizerOptions = dict[str, Any]
@@ -30,15 +28,6 @@ OptimizerCallable = Callable[
 # TODO: test the minimizer options
 
 
-def _maps(l1: Collection[T1], l2: Collection[T2]) -> dict[T1, T2]:
-    """Does like zip, but with a dictionary instead of a list of tuples"""
-    if len(l1) != len(l2):
-        ValueError(
-            f"Length of the two collections are not equal ({len(l1)} and {len(l2)})."
-        )
-    return {e1: e2 for e1, e2 in zip(l1, l2)}
-
-
 @typechecked
 def minimize(
     optimizable: QCircuit | OptimizableFunc,
@@ -253,15 +242,12 @@ def _minimize_local_circ(
     # is not relevant.
     # TODO: bellow might be a bug, check why we need this type ignore
     variables: set[Expr] = circ.variables()  # pyright: ignore[reportAssignmentType]
+    # the circuit is analysed once, so each evaluation only has to bind numeric
+    # values, without going through sympy
+    compiled = circ.compile_parameters(list(variables))
 
     def eval_circ(params: OptimizerInput):
-        # pyright is bad with abstract numeric types:
-        # "float" is incompatible with "Complex"
-        return _run_single(
-            circ,
-            device,
-            _maps(variables, params),  # pyright: ignore[reportArgumentType]
-        ).expectation_value
+        return _run_single(compiled.bind(params), device, {}).expectation_value
 
     return _minimize_local_func(
         eval_circ, method, init_params, len(variables), optimizer_options
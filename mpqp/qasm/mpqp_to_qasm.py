@@ -2,19 +2,24 @@ from __future__ import annotations
 
 import logging
 from typing import TYPE_CHECKING
+from warnings import warn
 
 import numpy as np
 from typeguard import typechecked
 
 if TYPE_CHECKING:
+    from sympy import Expr
+
     from mpqp.core.circuit import QCircuit
 
-from mpqp.core.instruction import Instruction
+from mpqp.core.instruction import Barrier, Instruction
 from mpqp.core.instruction.gates import *
 from mpqp.core.instruction.gates.gate import SingleQubitGate
+from mpqp.core.instruction.gates.native_gates import NativeGate, RotationGate
 from mpqp.core.languages import Language
 from mpqp.core.instruction.breakpoint import Breakpoint
 from mpqp.core.instruction.measurement import ExpectationMeasure, BasisMeasure
+from mpqp.tools.errors import OpenQASMTranslationWarning
 
 
 @typechecked
@@ -198,3 +203,130 @@ def mpqp_to_qasm2(qcircuit: QCircuit, simplify: bool = False) -> tuple[str, floa
     qasm_str += qasm_measure
 
     return qasm_str, gphase
+
+
+def _parameter_to_qasm3(param: Expr | float, inputs: dict[str, None]) -> str:
+    from sympy import Expr
+
+    if isinstance(param, Expr) and param.free_symbols:
+        for symbol in sorted(param.free_symbols, key=str):
+            inputs[str(symbol)] = None
+        return str(param)
+    return float_to_qasm_str(float(param))
+
+
+def _warn_u_translation(translation_warning: bool):
+    if translation_warning:
+        from mpqp.qasm.open_qasm_2_and_3 import U_TRANSLATION_WARNING
+
+        warn(U_TRANSLATION_WARNING, OpenQASMTranslationWarning)
+
+
+@typechecked
+def mpqp_to_qasm3(
+    qcircuit: QCircuit, translation_warning: bool = True
+) -> tuple[str, float]:
+    """Converts a :class:`~mpqp.core.circuit.QCircuit` object into a string in
+    OpenQASM 3.0 format, in a single pass over its instructions.
+
+    The symbolic parameters of the circuit are declared as ``input float``
+    variables, so that a parametrized circuit can be exported once, and its
+    parameters bound afterwards.
+
+    Args:
+        qcircuit: The circuit to be converted.
+        translation_warning: If ``True``, a warning is raised when a ``U`` gate
+            is encountered, since ``u3`` differs from the OpenQASM 2.0 ``U``
+            by a phase.
+
+    Returns:
+        A tuple containing, OpenQASM 3.0 string representation of the provided
+        circuit, and a global phase value associated with custom gates.
+
+    Raises:
+        ValueError: If an unknown gate or instruction type is encountered during
+            the conversion process.
+
+    Example:
+        >>> theta = symbols("θ")
+        >>> circuit = QCircuit([H(0), Rx(2 * theta, 1), CNOT(0, 1), BasisMeasure()])
+        >>> qasm_code, gphase = mpqp_to_qasm3(circuit)
+        >>> print(qasm_code)
+        OPENQASM 3.0;
+        include "stdgates.inc";
+        input float θ;
+        <BLANKLINE>
+        qubit[2] q;
+        bit[2] c;
+        h q[0];
+        rx(2*θ) q[1];
+        cx q[0],q[1];
+        c[0] = measure q[0];
+        c[1] = measure q[1];
+        <BLANKLINE>
+    """
+    if qcircuit.noises:
+        logging.warning(
+            "Instructions such as noise are not supported by QASM3 hence have "
+            "been ignored."
+        )
+
+    inputs: dict[str, None] = {}
+    body = [f"qubit[{qcircuit.nb_qubits}] q;\n"]
+    if qcircuit.nb_cbits != None and qcircuit.nb_cbits != 0:
+        body.append(f"bit[{qcircuit.nb_cbits}] c;\n")
+    measures = []
+    uses_std_lib = False
+    gphase = 0
+
+    for instruction in qcircuit.instructions:
+        if isinstance(instruction, (Breakpoint, ExpectationMeasure)):
+            continue
+        elif isinstance(instruction, BasisMeasure):
+            c_targets = instruction.c_targets or range(len(instruction.targets))
+            measures.extend(
+                f"c[{c_target}] = measure q[{target}];\n"
+                for target, c_target in zip(instruction.targets, c_targets)
+            )
+        elif isinstance(instruction, Barrier):
+            qubits = ",".join(f"q[{target}]" for target in instruction.targets)
+            body.append(f"barrier {qubits};\n")
+        elif isinstance(instruction, CustomGate):
+            qasm2_code, phase = instruction.to_other_language(Language.QASM2)
+            gphase += phase
+            uses_std_lib = True
+            for line in qasm2_code.splitlines():
+                if line.startswith("u("):
+                    _warn_u_translation(translation_warning)
+                    line = "u3" + line[1:]
+                body.append(line + "\n")
+        elif isinstance(instruction, NativeGate):
+            uses_std_lib = True
+            if isinstance(instruction, U):
+                _warn_u_translation(translation_warning)
+                name, params = "u3", instruction.parameters
+            else:
+                name = instruction.qasm2_gate
+                params = (
+                    [instruction.theta] if isinstance(instruction, RotationGate) else []
+                )
+            if params:
+                name += (
+                    "("
+                    + ",".join(_parameter_to_qasm3(param, inputs) for param in params)
+                    + ")"
+                )
+            qubits = ",".join(
+                f"q[{qubit}]"
+                for qubit in getattr(instruction, "controls", []) + instruction.targets
+            )
+            body.append(f"{name} {qubits};\n")
+        else:
+            raise ValueError(f"Unknown instruction: {instruction}")
+
+    header = ["OPENQASM 3.0;\n"]
+    if uses_std_lib:
+        header.append('include "stdgates.inc";\n')
+    header.extend(f"input float {name};\n" for name in inputs)
+
+    return "".join(header + ["\n"] + body + measures), gphase
@@ -170,6 +170,12 @@ std_gates_3_to_2_map = {
     "cphase": "cu1",
 }
 
+U_TRANSLATION_WARNING = """
+There is a phase e^(i(a+c)/2) difference between U(a,b,c) gate in 2.0 and 3.0.
+We handled that for you by adding the extra phase at the right place. 
+Be careful if you want to create a control gate from this circuit/gate, the
+phase can become non-global."""
+
 
 @typechecked
 def qasm_code(instr: Instr) -> str:
@@ -337,14 +343,7 @@ def convert_instruction_2_to_3(
         instructions_code += instr + ";\n"
     elif instr_name.lower() == "u":
         if translation_warning:
-            warn(
-                """
-There is a phase e^(i(a+c)/2) difference between U(a,b,c) gate in 2.0 and 3.0.
-We handled that for you by adding the extra phase at the right place. 
-Be careful if you want to create a control gate from this circuit/gate, the
-phase can become non-global.""",
-                OpenQASMTranslationWarning,
-            )
+            warn(U_TRANSLATION_WARNING, OpenQASMTranslationWarning)
         header_code += add_std_lib()
         instructions_code += "u3" + instr[1:] + ";\n"
     elif instr_name == "cu1":
@@ -10,14 +10,18 @@ On occasion, there is also a need to "flatten" the string representation of an
 object *i.e.* to display it on one line. In this case :func:`one_line_repr` is
 your friend.
 
-Lastly, we find the default list search mechanism in python a bit too
+We find the default list search mechanism in python a bit too
 restrictive. :func:`find` allow us a much more versatile search using an 
 ``oracle``.
+
+Lastly, :func:`structural_key` turns the (mutable) objects of the library into
+hashable keys, used to compare and hash circuits and instructions.
 """
 
 from __future__ import annotations
 
 from abc import ABCMeta
+from enum import Enum as BaseEnum
 
 # from functools import update_wrapper
 from inspect import getsource
@@ -25,6 +29,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Hashable,
     Iterable,
     Iterator,
     Sequence,
@@ -156,6 +161,65 @@ def find_index(iterable: Iterable[T], oracle: Callable[[T], bool]) -> int:
     raise ValueError("No objects satisfies the given oracle")
 
 
+def structural_key(value: Any) -> Hashable:
+    """Builds a hashable key describing the structure of ``value``: two objects
+    with the same attributes (recursively) have the same key.
+
+    Lists, tuples, sets and dictionaries are converted to their immutable
+    counterparts, ``numpy`` arrays to their shape, type and content, and
+    objects to their type and attributes. Objects defining a ``_fingerprint``
+    method are described by the result of this method instead, which allows
+    them to ignore caches or to cache their key.
+
+    Args:
+        value: The object to describe.
+
+    Returns:
+        A hashable key describing the object.
+
+    Example:
+        >>> structural_key({"a": [1, 2], "b": np.array([0.5])}) == structural_key(
+        ...     {"b": np.array([0.5]), "a": [1, 2]}
+        ... )
+        True
+        >>> structural_key([1, 2]) == structural_key([2, 1])
+        False
+
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        return value
+    fingerprint = getattr(value, "_fingerprint", None)
+    if fingerprint is not None and not isinstance(value, type):
+        return fingerprint()
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(structural_key(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(structural_key(item) for item in value)
+    if isinstance(value, dict):
+        items = [
+            (structural_key(key), structural_key(item)) for key, item in value.items()
+        ]
+        if all(isinstance(key, str) for key in value):
+            # sorting keeps the key deterministic across processes
+            return ("dict", tuple(sorted(items, key=lambda item: item[0])))
+        return frozenset(items)
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            content = tuple(structural_key(item) for item in value.flat)
+        else:
+            content = np.ascontiguousarray(value).tobytes()
+        return ("ndarray", value.shape, value.dtype.str, content)
+    if isinstance(value, np.generic):
+        return value.item()
+    if (
+        isinstance(value, (type, BaseEnum))
+        or callable(value)
+        or not hasattr(value, "__dict__")
+    ):
+        return value
+    return (type(value), structural_key(vars(value)))
+
+
 class SimpleClassReprMeta(type):
     """Metaclass used to change the repr of the class (not the instances) to
     display the name of the class only (instead of the usual
@@ -6,12 +6,14 @@ from __future__ import annotations
 import math
 from functools import reduce
 from numbers import Complex, Real
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
 if TYPE_CHECKING:
     from sympy import Expr
     import sympy as sp
 
+    from mpqp.core.instruction.gates.gate import Gate
+
 import numpy as np
 import numpy.typing as npt
 from scipy.linalg import inv, sqrtm
@@ -426,3 +428,160 @@ def is_power_of_two(n: int):
 
     """
     return n >= 1 and (n & (n - 1)) == 0
+
+
+@typechecked
+def apply_matrix(
+    tensor: npt.NDArray[np.complex64], matrix: Matrix, axes: list[int]
+) -> npt.NDArray[np.complex64]:
+    """Applies a ``2^k x 2^k`` matrix on ``k`` axes of a tensor of shape
+    ``(2,)*n``, without ever building the full ``2^n x 2^n`` matrix.
+
+    The first axis given in ``axes`` corresponds to the most significant qubit
+    of ``matrix``, following the ordering used everywhere else in this library.
+    Any extra trailing axis of ``tensor`` (beyond the ones targeted) is left
+    untouched, which allows this function to act on operators as well as states.
+
+    Args:
+        tensor: The tensor on which the matrix is applied.
+        matrix: The matrix to apply.
+        axes: Indices of the axes of the tensor the matrix acts on.
+
+    Returns:
+        The tensor resulting from the contraction, with the same shape as the
+        input one.
+
+    Example:
+        >>> state = np.zeros((2, 2), dtype=complex)
+        >>> state[0, 0] = 1
+        >>> cnot = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+        >>> h = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+        >>> bell = apply_matrix(apply_matrix(state, h, [0]), cnot, [0, 1])
+        >>> print(clean_1D_array(bell.flatten()))
+        [0.70711, 0, 0, 0.70711]
+
+    """
+    k = len(axes)
+    gate_tensor = np.asarray(matrix, dtype=complex).reshape((2,) * (2 * k))
+    result = np.tensordot(gate_tensor, tensor, axes=(list(range(k, 2 * k)), axes))
+    return np.moveaxis(result, list(range(k)), axes)
+
+
+@typechecked
+def embed_matrix(matrix: Matrix, qubits: list[int], nb_qubits: int) -> Matrix:
+    """Embeds a matrix acting on some qubits in the space of ``nb_qubits``
+    qubits, padding it with the identity on the other qubits.
+
+    Instead of conjugating the matrix with permutation (SWAP) matrices, the
+    qubits are reordered by transposing the axes of the tensor representation
+    of the matrix, so the cost stays linear in the size of the result.
+
+    Args:
+        matrix: The matrix to embed, acting on ``len(qubits)`` qubits.
+        qubits: Qubits the matrix acts on. The first one corresponds to the
+            most significant qubit of ``matrix``.
+        nb_qubits: Number of qubits of the resulting matrix.
+
+    Returns:
+        The matrix of size ``2^nb_qubits`` acting as ``matrix`` on ``qubits``
+        and as the identity on the other qubits.
+
+    Example:
+        >>> cnot = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+        >>> pprint(embed_matrix(cnot, [1, 0], 2))
+        [[1, 0, 0, 0],
+         [0, 0, 0, 1],
+         [0, 0, 1, 0],
+         [0, 1, 0, 0]]
+
+    """
+    matrix = np.asarray(matrix)
+    others = [qubit for qubit in range(nb_qubits) if qubit not in qubits]
+    identity = np.eye(2 ** len(others))
+    full = np.kron(matrix, identity).reshape((2,) * 2 * nb_qubits)
+    axes = list(np.argsort(qubits + others))
+    full = full.transpose(axes + [nb_qubits + axis for axis in axes])
+    return full.reshape(2**nb_qubits, 2**nb_qubits)
+
+
+@typechecked
+def group_gates(
+    gates: list[Gate], fusion_size: int, contiguous: bool = False
+) -> list[tuple[list[Gate], list[int]]]:
+    """Greedily groups consecutive gates in blocks acting on at most
+    ``fusion_size`` qubits.
+
+    Args:
+        gates: The gates to group, in the order of application.
+        fusion_size: Maximal number of qubits of a block. Gates larger than
+            this are kept alone in their own block.
+        contiguous: If ``True``, each block acts on a contiguous range of
+            qubits (as required by a
+            :class:`~mpqp.core.instruction.gates.custom_gate.CustomGate`), and
+            ``fusion_size`` bounds the size of this range.
+
+    Returns:
+        The list of the blocks, as pairs of a list of gates and the sorted list
+        of qubits they act on.
+    """
+
+    def span(qubits: Iterable[int]) -> list[int]:
+        qubits = sorted(set(qubits))
+        return list(range(qubits[0], qubits[-1] + 1)) if contiguous else qubits
+
+    groups: list[tuple[list[Gate], list[int]]] = []
+    current: list[Gate] = []
+    qubits: list[int] = []
+    for gate in gates:
+        union = span(qubits + gate.canonical_qubits())
+        if len(current) != 0 and len(union) > fusion_size:
+            groups.append((current, qubits))
+            current, union = [], span(gate.canonical_qubits())
+        current.append(gate)
+        qubits = union
+    if len(current) != 0:
+        groups.append((current, qubits))
+    return groups
+
+
+@typechecked
+def block_matrix(gates: list[Gate], qubits: list[int]) -> npt.NDArray[np.complex64]:
+    """Computes the matrix of a sequence of gates, on the qubits given (in this
+    order), which must contain all the qubits the gates act on."""
+    size = len(qubits)
+    block = np.eye(2**size, dtype=complex).reshape((2,) * 2 * size)
+    for gate in gates:
+        axes = [qubits.index(qubit) for qubit in gate.canonical_qubits()]
+        block = apply_matrix(block, gate.to_canonical_matrix(), axes)
+    return block.reshape(2**size, 2**size)
+
+
+@typechecked
+def fuse_gates(
+    gates: list[Gate], fusion_size: int
+) -> list[tuple[npt.NDArray[np.complex64], list[int]]]:
+    """Greedily groups consecutive gates in blocks acting on at most
+    ``fusion_size`` qubits, and computes the matrix of each block.
+
+    Args:
+        gates: The gates to fuse, in the order of application.
+        fusion_size: Maximal number of qubits of a block. Gates larger than
+            this are kept alone in their own block.
+
+    Returns:
+        The list of the blocks, as pairs of a matrix and the ordered list of
+        qubits this matrix acts on.
+
+    Example:
+        >>> blocks = fuse_gates([H(0), CNOT(0, 1), X(2), H(3)], 2)
+        >>> [(matrix.shape, qubits) for matrix, qubits in blocks]
+        [((4, 4), [0, 1]), ((4, 4), [2, 3])]
+
+    """
+    blocks = []
+    for group, qubits in group_gates(gates, fusion_size):
+        if len(group) == 1:
+            blocks.append((group[0].to_canonical_matrix(), group[0].canonical_qubits()))
+        else:
+            blocks.append((block_matrix(group, qubits), qubits))
+    return blocks
@@ -0,0 +1,409 @@
+"""Peephole optimization passes used by :meth:`QCircuit.optimize
+<mpqp.core.circuit.QCircuit.optimize>`.
+
+Each pass takes the list of instructions of a circuit and returns a new list,
+equivalent to the input (global phase included). Only gates are rewritten, and
+only with the instruction directly preceding them on exactly the same qubits:
+measurements, barriers, breakpoints and gates acting on a different set of
+qubits act as blockers. The passes are registered by name in
+:data:`OPTIMIZATION_PASSES`.
+
+In addition to these logical simplifications, :func:`fuse_blocks` groups
+neighbouring gates in dense
+:class:`~mpqp.core.instruction.gates.custom_gate.CustomGate` blocks. It does
+not reduce the circuit logically, but local simulators then go over the state
+once per block instead of once per gate.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Optional
+
+import numpy as np
+from sympy import Expr
+from typeguard import typechecked
+
+from mpqp.core.instruction.gates.custom_gate import CustomGate
+from mpqp.core.instruction.gates.gate import Gate, InvolutionGate
+from mpqp.core.instruction.gates.gate_definition import UnitaryMatrix
+from mpqp.core.instruction.gates.native_gates import CP, SWAP, Id, P, Rx, Ry, Rz, U
+from mpqp.core.instruction.gates.parametrized_gate import ParametrizedGate
+from mpqp.core.instruction.instruction import Instruction
+from mpqp.tools.generics import OneOrMany
+from mpqp.tools.maths import block_matrix, group_gates, matrix_eq
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+Rewrite = Callable[[Gate, Gate], Optional[list[Gate]]]
+"""A peephole rule: given two consecutive gates acting on the same qubits,
+returns the gates replacing them, or ``None`` if the rule does not apply."""
+
+_ADDITIVE_ROTATIONS = (Rx, Ry, Rz, P, CP)
+
+
+def _peephole(instructions: list[Instruction], rewrite: Rewrite) -> list[Instruction]:
+    """Applies ``rewrite`` on each pair of consecutive gates acting on the same
+    qubits, in a single sweep over the instructions. The gates produced by a
+    rewrite are themselves fed back to the rule, so chains (``Rx Rx Rx``) or
+    nested patterns (``H X X H``) are fully reduced."""
+    output: list[Optional[Instruction]] = []
+    last_on_qubit: defaultdict[int, list[int]] = defaultdict(list)
+
+    def push(instruction: Instruction):
+        qubits = instruction.connections()
+        if isinstance(instruction, Gate) and qubits:
+            tops = {last_on_qubit[q][-1] if last_on_qubit[q] else -1 for q in qubits}
+            index = tops.pop()
+            if len(tops) == 0 and index != -1:
+                previous = output[index]
+                if (
+                    isinstance(previous, Gate)
+                    and previous.connections() == qubits
+                    and (replacement := rewrite(previous, instruction)) is not None
+                ):
+                    output[index] = None
+                    for qubit in qubits:
+                        last_on_qubit[qubit].pop()
+                    for gate in replacement:
+                        push(gate)
+                    return
+        output.append(instruction)
+        for qubit in qubits:
+            last_on_qubit[qubit].append(len(output) - 1)
+
+    for instruction in instructions:
+        push(instruction)
+    return [instruction for instruction in output if instruction is not None]
+
+
+def _is_symbolic(gate: Gate) -> bool:
+    return isinstance(gate, ParametrizedGate) and any(
+        isinstance(parameter, Expr) for parameter in gate.parameters
+    )
+
+
+def _is_identity(gate: Gate, up_to_phase: bool = False) -> bool:
+    if _is_symbolic(gate):
+        return False
+    matrix = np.array(gate.to_canonical_matrix(), dtype=complex)
+    if up_to_phase:
+        matrix = matrix * np.conj(matrix[0, 0]) / max(abs(matrix[0, 0]), 1e-12)
+    return matrix_eq(matrix, np.eye(len(matrix)))
+
+
+def _same_roles(first: Gate, second: Gate) -> bool:
+    if isinstance(first, SWAP):
+        return set(first.targets) == set(second.targets)
+    return first.targets == second.targets and set(
+        getattr(first, "controls", [])
+    ) == set(getattr(second, "controls", []))
+
+
+@typechecked
+def remove_identities(instructions: list[Instruction]) -> list[Instruction]:
+    """Removes the :class:`~mpqp.core.instruction.gates.native_gates.Id` gates.
+
+    Args:
+        instructions: The instructions to optimize.
+
+    Returns:
+        The instructions without the identity gates.
+
+    Example:
+        >>> remove_identities([H(0), Id(0), CNOT(0, 1)])
+        [H(0), CNOT(0, 1)]
+
+    """
+    return [
+        instruction for instruction in instructions if not isinstance(instruction, Id)
+    ]
+
+
+@typechecked
+def cancel_involutions(instructions: list[Instruction]) -> list[Instruction]:
+    """Cancels pairs of identical consecutive involutions (``X``, ``H``,
+    ``CNOT``, ``SWAP``, ``TOF``, ...), *i.e.* gates such that :math:`G^2=I`.
+
+    Args:
+        instructions: The instructions to optimize.
+
+    Returns:
+        The instructions without the cancelling pairs.
+
+    Example:
+        >>> cancel_involutions([H(0), X(0), X(0), H(0), CNOT(0, 1)])
+        [CNOT(0, 1)]
+        >>> cancel_involutions([CNOT(0, 1), CNOT(1, 0)])
+        [CNOT(0, 1), CNOT(1, 0)]
+
+    """
+
+    def rewrite(previous: Gate, gate: Gate) -> Optional[list[Gate]]:
+        if (
+            isinstance(gate, InvolutionGate)
+            and type(previous) is type(gate)
+            and _same_roles(previous, gate)
+        ):
+            return []
+        return None
+
+    return _peephole(instructions, rewrite)
+
+
+@typechecked
+def merge_rotations(instructions: list[Instruction]) -> list[Instruction]:
+    """Merges consecutive rotations of the same kind (``Rx``, ``Ry``, ``Rz``,
+    ``P`` and ``CP``) on the same qubits by adding their angles. Symbolic
+    angles are supported. Merged rotations equal to the identity are removed.
+
+    Args:
+        instructions: The instructions to optimize.
+
+    Returns:
+        The instructions with the rotations merged.
+
+    Example:
+        >>> merge_rotations([Rz(0.25, 0), Rz(0.5, 0), Rx(1, 1)])
+        [Rz(0.75, 0), Rx(1, 1)]
+        >>> merge_rotations([P(np.pi, 0), P(np.pi, 0)])
+        []
+        >>> theta = symbols("θ")
+        >>> merge_rotations([Ry(theta, 0), Ry(theta, 0)])
+        [Ry(2*θ, 0)]
+
+    """
+
+    def rewrite(previous: Gate, gate: Gate) -> Optional[list[Gate]]:
+        if not (
+            type(gate) in _ADDITIVE_ROTATIONS
+            and type(previous) is type(gate)
+            and _same_roles(previous, gate)
+        ):
+            return None
+        assert isinstance(gate, ParametrizedGate)
+        assert isinstance(previous, ParametrizedGate)
+        theta = previous.parameters[0] + gate.parameters[0]
+        if isinstance(gate, CP):
+            merged = CP(theta, gate.controls[0], gate.targets[0])
+        else:
+            merged = type(gate)(theta, gate.targets[0])
+        return [] if _is_identity(merged) else [merged]
+
+    return _peephole(instructions, rewrite)
+
+
+def _to_u(matrix: npt.NDArray[np.complex128], target: int) -> tuple[U, float]:
+    """Decomposes a 2x2 unitary as ``e^{iα} U(θ, φ, γ)``, returns the gate and
+    the global phase ``α``."""
+    cos_half, sin_half = abs(matrix[0, 0]), abs(matrix[1, 0])
+    theta = 2 * np.arctan2(sin_half, cos_half)
+    if cos_half > 1e-8:
+        phase = np.angle(matrix[0, 0])
+        if sin_half > 1e-8:
+            phi = np.angle(matrix[1, 0]) - phase
+            gamma = np.angle(-matrix[0, 1]) - phase
+        else:
+            phi, gamma = np.angle(matrix[1, 1]) - phase, 0.0
+    else:
+        phase = np.angle(-matrix[0, 1])
+        phi, gamma = np.angle(matrix[1, 0]) - phase, 0.0
+    gate = U(float(theta), float(phi % (2 * np.pi)), float(gamma % (2 * np.pi)), target)
+    return gate, float(phase)
+
+
+def _with_phase(gate: U, phase: float) -> list[Gate]:
+    """Gates equal to ``e^{iα} U(θ, φ, γ)``, ``α`` being the phase: a single
+    ``U`` gate when ``α`` is ``0`` or ``π``, or when ``cos(θ/2)`` is null, and
+    ``Rz(-2α)`` followed by ``U(θ, φ, γ + 2α)`` otherwise."""
+    theta, phi, gamma = (float(parameter) for parameter in gate.parameters)
+    target = gate.targets[0]
+    phase = float(np.angle(np.exp(1j * phase)))
+    if np.isclose(phase, 0):
+        return [gate]
+    if np.isclose(np.cos(theta / 2), 0):
+        phi, gamma = phi + phase, gamma + phase
+    elif np.isclose(abs(phase), np.pi):
+        theta, phi, gamma = 2 * np.pi - theta, phi + np.pi, gamma + np.pi
+    else:
+        return [
+            Rz(float(-2 * phase), target),
+            U(theta, phi, float((gamma + 2 * phase) % (2 * np.pi)), target),
+        ]
+    return [U(theta, float(phi % (2 * np.pi)), float(gamma % (2 * np.pi)), target)]
+
+
+@typechecked
+def fuse_single_qubit_gates(instructions: list[Instruction]) -> list[Instruction]:
+    """Fuses each run of consecutive single-qubit gates on the same qubit in a
+    single :class:`~mpqp.core.instruction.gates.native_gates.U` gate. Runs
+    equal to the identity (up to a global phase) are removed. Gates with
+    symbolic parameters are left untouched.
+
+    The global phases dropped by the fusions are summed and folded back in the
+    first fused gate, so that the circuit is unchanged, global phase included.
+    This gate is preceded by an ``Rz`` gate when the phase cannot be expressed
+    by a ``U`` gate alone.
+
+    Args:
+        instructions: The instructions to optimize.
+
+    Returns:
+        The instructions with the single-qubit runs fused.
+
+    Example:
+        >>> fuse_single_qubit_gates([H(0), S(0), H(1), CNOT(0, 1), X(1), Y(1)])
+        [Rz(3.141592653589793, 0), U(1.5707963267948966, 1.5707963267948966, 0.0, 0), H(1), CNOT(0, 1), U(0.0, 3.141592653589793, 0.0, 1)]
+        >>> fuse_single_qubit_gates([H(0), Z(0), H(0), X(0)])
+        []
+
+    """
+
+    # global phase of each fused gate, and of the removed ones
+    phases: dict[int, float] = {}
+    dropped = 0.0
+    last_target = 0
+
+    def rewrite(previous: Gate, gate: Gate) -> Optional[list[Gate]]:
+        nonlocal dropped, last_target
+        if len(gate.connections()) != 1 or _is_symbolic(previous) or _is_symbolic(gate):
+            return None
+        matrix = np.array(gate.to_canonical_matrix(), dtype=complex) @ np.array(
+            previous.to_canonical_matrix(), dtype=complex
+        )
+        fused, phase = _to_u(matrix, gate.targets[0])
+        phase += phases.pop(id(previous), 0) + phases.pop(id(gate), 0)
+        if _is_identity(fused, up_to_phase=True):
+            dropped += phase
+            last_target = gate.targets[0]
+            return []
+        phases[id(fused)] = phase
+        return [fused]
+
+    fused = _peephole(instructions, rewrite)
+    gphase = float(np.angle(np.exp(1j * (dropped + sum(phases.values())))))
+    if np.isclose(gphase, 0):
+        return fused
+    for index, instruction in enumerate(fused):
+        if id(instruction) in phases:
+            assert isinstance(instruction, U)
+            fused[index : index + 1] = _with_phase(instruction, gphase)
+            return fused
+    # all the fused gates were removed, the phase is carried by an identity
+    return _with_phase(U(0, 0, 0, last_target), gphase) + fused
+
+
+@typechecked
+def fuse_blocks(
+    instructions: list[Instruction], fusion_size: int = 3
+) -> list[Instruction]:
+    """Greedily groups consecutive gates acting together on a range of at most
+    ``fusion_size`` contiguous qubits in a single
+    :class:`~mpqp.core.instruction.gates.custom_gate.CustomGate`, the matrix of
+    which is computed once and for all. Gates with symbolic parameters and
+    other instructions (measurements, barriers, ...) are kept as is, and
+    interrupt the fusion.
+
+    Args:
+        instructions: The instructions to optimize.
+        fusion_size: Maximal number of qubits of a block.
+
+    Returns:
+        The instructions with the gates fused in blocks.
+
+    Example:
+        >>> fused = fuse_blocks([H(0), CNOT(0, 1), T(1), CNOT(1, 2), H(2)], 2)
+        >>> [(type(gate).__name__, gate.targets) for gate in fused]
+        [('CustomGate', [0, 1]), ('CustomGate', [1, 2])]
+        >>> fuse_blocks([H(0), Barrier(), H(1)])
+        [H(0), Barrier(0), H(1)]
+
+    """
+    fused: list[Instruction] = []
+    run: list[Gate] = []
+
+    def flush():
+        for group, qubits in group_gates(run, fusion_size, contiguous=True):
+            if len(group) == 1:
+                fused.append(group[0])
+            else:
+                matrix = block_matrix(group, qubits)
+                fused.append(CustomGate(UnitaryMatrix(matrix), qubits))
+        run.clear()
+
+    for instruction in instructions:
+        if isinstance(instruction, Gate) and not _is_symbolic(instruction):
+            run.append(instruction)
+        else:
+            flush()
+            fused.append(instruction)
+    flush()
+    return fused
+
+
+OptimizationPass = Callable[[list[Instruction]], list[Instruction]]
+"""An optimization pass: returns the optimized instructions."""
+
+OPTIMIZATION_PASSES: dict[str, OptimizationPass] = {
+    "identities": remove_identities,
+    "involutions": cancel_involutions,
+    "rotations": merge_rotations,
+    "single_qubit_fusion": fuse_single_qubit_gates,
+    "block_fusion": fuse_blocks,
+}
+"""The optimization passes available, by name. When several of them are
+applied, they are run in this order unless specified otherwise."""
+
+DEFAULT_PASSES = ["identities", "involutions", "rotations"]
+"""The passes applied when no criterion is given. ``"single_qubit_fusion"`` is
+left out since it replaces the gates of the circuit by ``U`` gates, and
+``"block_fusion"`` as it replaces them by opaque blocks."""
+
+
+@typechecked
+def optimize_instructions(
+    instructions: list[Instruction], criteria: Optional[OneOrMany[str]] = None
+) -> list[Instruction]:
+    """Applies the optimization passes named in ``criteria`` (see
+    :data:`OPTIMIZATION_PASSES`, and :data:`DEFAULT_PASSES` for the default
+    ones) in order, until the number of instructions stops decreasing.
+
+    Args:
+        instructions: The instructions to optimize.
+        criteria: Name, or list of names, of the passes to apply.
+
+    Returns:
+        The optimized instructions.
+
+    Raises:
+        ValueError: If one of the criteria is not a known pass.
+
+    Example:
+        >>> optimize_instructions([H(0), Id(0), H(0), Rx(1, 0), Rx(-1, 0)])
+        []
+        >>> optimize_instructions([X(0), Y(0)], "single_qubit_fusion")
+        [Rz(3.141592653589793, 0), U(0.0, 3.141592653589793, 3.141592653589793, 0)]
+        >>> optimize_instructions([H(0), Z(0)], "depth")
+        Traceback (most recent call last):
+            ...
+        ValueError: Unknown optimization criterion 'depth', expected one of ['identities', 'involutions', 'rotations', 'single_qubit_fusion', 'block_fusion'].
+
+    """
+    if criteria is None:
+        criteria = DEFAULT_PASSES
+    elif isinstance(criteria, str):
+        criteria = [criteria]
+    for criterion in criteria:
+        if criterion not in OPTIMIZATION_PASSES:
+            raise ValueError(
+                f"Unknown optimization criterion '{criterion}', expected one of "
+                f"{list(OPTIMIZATION_PASSES)}."
+            )
+
+    while True:
+        size = len(instructions)
+        for criterion in criteria:
+            instructions = OPTIMIZATION_PASSES[criterion](instructions)
+        if len(instructions) >= size:
+            return instructions
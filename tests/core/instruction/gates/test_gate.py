@@ -4,7 +4,23 @@ import pytest
 from mpqp.tools import matrix_eq
 
 from mpqp.core.circuit import QCircuit
-from mpqp.gates import SWAP, CustomGate, Gate, H, UnitaryMatrix, X, Z
+from mpqp.core.languages import Language
+from mpqp.gates import (
+    CNOT,
+    CZ,
+    SWAP,
+    TOF,
+    CP,
+    CRk,
+    CustomGate,
+    Gate,
+    H,
+    Rx,
+    U,
+    UnitaryMatrix,
+    X,
+    Z,
+)
 from mpqp.tools.errors import NumberQubitsWarning
 
 
@@ -145,3 +161,29 @@ def test_range(gates: list[Gate], targets: list[int]):
     circuit.add(gates)
 
     assert {instr.targets[0] for instr in circuit.instructions} == set(targets)
+
+
+@pytest.mark.parametrize(
+    "gate, desired_gate_size",
+    [
+        (H(2), 4),
+        (Rx(0.3, 0), 3),
+        (U(0.1, 0.2, 0.3, 1), 2),
+        (SWAP(3, 0), 5),
+        (CNOT(2, 0), 3),
+        (CZ(0, 3), 4),
+        (CP(0.7, 3, 1), 4),
+        (CRk(3, 1, 2), 3),
+        (TOF([3, 1], 0), 4),
+        (TOF([0, 2], 1), 3),
+        (CustomGate(UnitaryMatrix(np.kron(np.eye(2), [[0, 1], [1, 0]])), [1, 2]), 4),
+    ],
+)
+def test_to_matrix_embedding(gate: Gate, desired_gate_size: int):
+    from qiskit.quantum_info.operators import Operator
+
+    qiskit_circuit = QCircuit([gate], nb_qubits=desired_gate_size).to_other_language(
+        Language.QISKIT
+    )
+    expected = Operator.from_circuit(qiskit_circuit).reverse_qargs().to_matrix()
+    assert matrix_eq(gate.to_matrix(desired_gate_size), expected)
@@ -17,9 +17,10 @@ from cirq.ops.pauli_string import PauliString as CirqPauliString
 from qat.core.wrappers.observable import Observable as QLMObservable
 
 
-from mpqp.core.instruction.measurement.pauli_string import I, X
+from mpqp.core.instruction.measurement.pauli_string import I, X, Y, Z
 from mpqp.core.languages import Language
 from mpqp.measures import ExpectationMeasure, Observable
+from mpqp.tools.errors import NumberQubitsError
 
 
 @pytest.mark.parametrize(
@@ -72,3 +73,49 @@ def test_to_other_language(
     ],
 ):
     assert obs.to_other_language(Language.CIRQ) == translation
+
+
+def test_pauli_conversions_match_matrix():
+    ps = 2 * X @ I @ Z - Y @ Y @ I + 0.5 * I @ I @ I
+    from_pauli = Observable(ps)
+    from_matrix = Observable(from_pauli.matrix)
+    assert from_pauli.to_other_language(Language.QISKIT).equiv(
+        from_matrix.to_other_language(Language.QISKIT)
+    )
+    qlm_pauli = from_pauli.to_other_language(Language.MY_QLM)
+    qlm_matrix = from_matrix.to_other_language(Language.MY_QLM)
+    assert isinstance(qlm_pauli, QLMObservable)
+    assert isinstance(qlm_matrix, QLMObservable)
+    assert np.allclose(
+        qlm_pauli.to_matrix().toarray(), qlm_matrix.to_matrix().toarray()
+    )
+    state = np.array([1, 2, 0, 1j, 0, 0, -1, 1]) / np.sqrt(8)
+    assert np.isclose(from_pauli.expectation(state), from_matrix.expectation(state))
+
+
+@pytest.mark.parametrize("budget", [2, 3, 101, 1000])
+def test_allocate_shots(budget: int):
+    groups = [3 * X @ I + 2 * I @ I, 4 * X @ X - X @ I, 1 * I @ I]
+    measure = ExpectationMeasure(Observable(X @ X), shots=budget, optimize_shots=True)
+    assert measure.grouping == "qubitwise"
+    allocation = measure.allocate_shots(groups)
+    assert sum(allocation) == budget
+    assert allocation[2] == 0 and allocation[0] >= 1 and allocation[1] >= allocation[0]
+    with pytest.raises(ValueError):
+        measure.allocate_shots(groups, budget=1)
+    with pytest.raises(ValueError):
+        ExpectationMeasure(Observable(X @ X), shots=10, allocation_rounds=0)
+
+
+def test_several_observables():
+    observables = [Observable(X @ Z), Observable(np.diag([1, 2, 3, 4]))]
+    measure = ExpectationMeasure(observables, [0, 1])
+    assert measure.observables == observables
+    with pytest.raises(ValueError):
+        measure.observable
+    single = ExpectationMeasure(observables[0], [0, 1])
+    assert single.observables == [single.observable] == observables[:1]
+    with pytest.raises(NumberQubitsError):
+        ExpectationMeasure([Observable(X @ Z), Observable(Z)])
+    with pytest.raises(ValueError):
+        ExpectationMeasure([])
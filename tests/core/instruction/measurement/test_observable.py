@@ -1,7 +1,9 @@
 import numpy as np
 import pytest
 
+from mpqp.core.instruction.measurement.expectation_value import Observable
 from mpqp.core.instruction.measurement.pauli_string import I, PauliString, X, Y, Z
+from mpqp.core.languages import Language
 from mpqp.tools.generics import Matrix
 from mpqp.tools.maths import matrix_eq
 
@@ -75,3 +77,67 @@ def test_matrix_to_pauli_to_matrix(matrix: Matrix, ps: PauliString):
 def test_pauli_to_matrix_to_pauli(matrix: Matrix, ps: PauliString):
     print(PauliString().from_matrix(ps.to_matrix()))
     assert PauliString().from_matrix(ps.to_matrix()) == ps
+
+
+@pytest.mark.parametrize("nb_qubits", [1, 2, 4])
+def test_from_matrix_matches_traces(nb_qubits: int):
+    rng = np.random.default_rng(nb_qubits)
+    matrix = rng.normal(size=(2**nb_qubits, 2**nb_qubits))
+    matrix = matrix + matrix.T
+    decomposition = PauliString.from_matrix(matrix)
+    for mono in decomposition.monomials:
+        expected = np.trace(mono.to_matrix() / mono.coef @ matrix).real
+        assert np.isclose(mono.coef, expected / 2**nb_qubits)
+    assert matrix_eq(decomposition.to_matrix(), matrix)
+
+
+def test_from_matrix_threshold():
+    ps = 2 * X @ Y + 0.01 * Z @ Z - 0.5 * I @ X
+    assert PauliString.from_matrix(ps.to_matrix(), threshold=0.1) == (
+        2 * X @ Y - 0.5 * I @ X
+    )
+
+
+def test_observable_shared_views():
+    observable = Observable(np.diag([1.0, -1, 2, 0]))
+    assert observable.matrix is observable.matrix
+    with pytest.raises(ValueError):
+        observable.matrix[0, 0] = 3
+
+    pauli_string = observable.pauli_string
+    assert pauli_string is observable.pauli_string
+    scaled = pauli_string
+    scaled *= 2
+    assert scaled is not pauli_string
+    assert observable.pauli_string == PauliString.from_matrix(np.diag([1, -1, 2, 0]))
+    with pytest.raises(ValueError):
+        pauli_string.simplify(inplace=True)
+
+
+def test_observable_conversion_cache():
+    observable = Observable(X @ Z + 2 * Y @ I)
+    qiskit_observable = observable.to_other_language(Language.QISKIT)
+    assert observable.to_other_language(Language.QISKIT) is qiskit_observable
+
+    observable.pauli_string = Z @ Z
+    assert observable.to_other_language(Language.QISKIT) is not qiskit_observable
+    assert matrix_eq(observable.matrix, np.diag([1, -1, -1, 1]))
+
+    observable.matrix = np.diag([1, 1, 1, -1])
+    assert matrix_eq(
+        observable.to_other_language(Language.QISKIT).to_matrix(),
+        np.diag([1, 1, 1, -1]),
+    )
+
+
+def test_restricted_to_support_cache():
+    observable = Observable(I @ X @ I @ Z + 2 * I @ Z @ I @ I)
+    restricted, support = observable.restricted_to_support()
+    assert observable.restricted_to_support()[0] is restricted
+    support.append(0)
+    assert observable.restricted_to_support()[1] == [1, 3]
+
+    observable.pauli_string = Z @ I @ I @ I
+    restricted, support = observable.restricted_to_support()
+    assert restricted.pauli_string == PauliString.from_matrix(np.diag([1, -1]))
+    assert support == [0]
@@ -1,3 +1,4 @@
+import pickle
 from copy import deepcopy
 from itertools import product
 from operator import (
@@ -35,7 +36,14 @@ from cirq.ops.pauli_gates import Y as Cirq_Y
 from cirq.ops.pauli_gates import Z as Cirq_Z
 from qat.core.wrappers.observable import Term
 
-from mpqp.core.instruction.measurement.pauli_string import I, PauliString, X, Y, Z
+from mpqp.core.instruction.measurement.pauli_string import (
+    I,
+    PauliString,
+    PauliStringMonomial,
+    X,
+    Y,
+    Z,
+)
 from mpqp.core.languages import Language
 from mpqp.tools.maths import matrix_eq
 
@@ -122,6 +130,28 @@ def test_simplify(init_ps: PauliString, simplified_ps: PauliString):
     assert simplified_ps == simplified_ps
 
 
+def test_simplify_many_monomials():
+    rng = np.random.default_rng(42)
+    atoms = [I, X, Y, Z]
+    monomials = [
+        PauliStringMonomial(int(rng.integers(-3, 4)), [atoms[i] for i in labels])
+        for labels in rng.integers(0, 4, (5000, 4))
+    ]
+    expected: dict[str, int] = {}
+    for mono in monomials:
+        key = "".join(atom.label for atom in mono.atoms)
+        expected[key] = expected.get(key, 0) + mono.coef
+    expected = {key: coef for key, coef in expected.items() if coef != 0}
+
+    ps = PauliString(monomials)
+    simplified = ps.simplify(inplace=True)
+    assert ps.monomials is simplified.monomials
+    assert {
+        "".join(atom.label for atom in mono.atoms): mono.coef
+        for mono in simplified.monomials
+    } == expected
+
+
 a, b, c = LineQubit.range(3)
 
 
@@ -405,3 +435,87 @@ def test_to_from_other_language(
         PauliString.from_other_language(mpqp_ps.to_other_language(Language.MY_QLM))
         == mpqp_ps
     )
+
+
+@pytest.mark.parametrize(
+    "ps",
+    [
+        I @ X + 2 * Z @ Y,
+        X @ Y @ Z - 0.5 * Y @ Y @ I + 3 * I @ I @ Z,
+        Y @ X @ Z @ I - 2 * X @ X @ Y @ Y + Z @ I @ I @ Z,
+    ],
+)
+def test_sparse_matrix_and_expectation(ps: PauliString):
+    dense = sum(mono.to_matrix() for mono in ps.monomials)
+    assert matrix_eq(ps.to_sparse_matrix().toarray(), dense)
+
+    rng = np.random.default_rng(ps.nb_qubits)
+    state = rng.normal(size=2**ps.nb_qubits) + 1j * rng.normal(size=2**ps.nb_qubits)
+    state /= np.linalg.norm(state)
+    assert np.isclose(ps.expectation(state), np.vdot(state, dense @ state).real)
+
+
+@pytest.mark.parametrize("strategy", ["qubitwise", "general"])
+def test_group_commuting(strategy: str):
+    rng = np.random.default_rng(7)
+    atoms = [I, X, Y, Z]
+    ps = PauliString(
+        [
+            PauliStringMonomial(int(rng.integers(1, 5)), [atoms[i] for i in labels])
+            for labels in rng.integers(0, 4, (60, 4))
+        ]
+    )
+    groups = ps.group_commuting(strategy)
+    assert len(groups) < len(ps.simplify().monomials)
+    assert sum(groups, PauliString()).to_dict() == ps.to_dict()
+    for group in groups:
+        for mono_1 in group.monomials:
+            for mono_2 in group.monomials:
+                m1, m2 = mono_1.to_matrix(), mono_2.to_matrix()
+                assert matrix_eq(m1 @ m2, m2 @ m1)
+                if strategy == "qubitwise":
+                    assert all(
+                        a1 == a2 or I in (a1, a2)
+                        for a1, a2 in zip(mono_1.atoms, mono_2.atoms)
+                    )
+
+
+def test_atom_matrices():
+    from braket.circuits.observables import Y as Braket_Y
+    from qiskit.quantum_info import Pauli
+
+    assert matrix_eq(I.to_matrix(), np.eye(2))
+    assert matrix_eq(X.to_matrix(), np.array([[0, 1], [1, 0]]))
+    assert matrix_eq(Y.to_matrix(), np.array([[0, -1j], [1j, 0]]))
+    assert matrix_eq(Z.to_matrix(), np.array([[1, 0], [0, -1]]))
+    assert matrix_eq(Y.to_matrix(), Pauli("Y").to_matrix())
+    assert matrix_eq(Y.to_matrix(), Braket_Y().to_matrix())
+    # XY = iZ, and |+i> is the +1 eigenstate of Y
+    assert matrix_eq(X.to_matrix() @ Y.to_matrix(), 1j * Z.to_matrix())
+    plus_i = np.array([1, 1j]) / np.sqrt(2)
+    assert Y.expectation(plus_i) == pytest.approx(1)
+
+
+def test_freeze_monomials():
+    ps = (2 * X @ Z + Y @ I).freeze()
+    mono = ps.monomials[0]
+    with pytest.raises(AttributeError):
+        mono.coef = 3
+    with pytest.raises(ValueError):
+        mono.atoms.append(X)
+    with pytest.raises(ValueError):
+        ps.monomials.append(Z @ Z)
+
+    scaled = mono
+    scaled *= 3
+    extended = mono
+    extended @= X
+    assert scaled is not mono and extended is not mono
+    assert ps == 2 * X @ Z + Y @ I
+    assert scaled == 6 * X @ Z and extended == 2 * X @ Z @ X
+
+    copied = deepcopy(ps)
+    copied.monomials[0].coef = 5
+    copied.monomials[0].atoms.append(X)
+    assert ps == 2 * X @ Z + Y @ I
+    assert pickle.loads(pickle.dumps(ps)) == ps
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from typeguard import TypeCheckError
+
+from mpqp.core.instruction.measurement.pauli_string import (
+    I,
+    PauliString,
+    PauliStringMonomial,
+    X,
+    Y,
+    Z,
+)
+from mpqp.core.instruction.measurement.pauli_string_array import PauliStringArray
+from mpqp.tools.maths import matrix_eq
+
+
+def random_pauli_string(nb_qubits: int, nb_monomials: int, seed: int) -> PauliString:
+    rng = np.random.default_rng(seed)
+    atoms = [I, X, Y, Z]
+    return PauliString(
+        [
+            PauliStringMonomial(
+                int(rng.integers(1, 5)),
+                [atoms[i] for i in rng.integers(0, 4, nb_qubits)],
+            )
+            for _ in range(nb_monomials)
+        ]
+    )
+
+
+@pytest.mark.parametrize("nb_qubits", [1, 3, 64, 70])
+def test_round_trip(nb_qubits: int):
+    ps = random_pauli_string(nb_qubits, 10, nb_qubits)
+    array = PauliStringArray.from_pauli_string(ps)
+    assert array.x.shape == (10, -(-nb_qubits // 64))
+    assert array.to_pauli_string().to_dict() == ps.to_dict()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_dot_matches_matrix_product(seed: int):
+    left = random_pauli_string(3, 4, seed)
+    right = random_pauli_string(3, 5, seed + 100)
+    product = PauliStringArray.from_pauli_string(left).dot(
+        PauliStringArray.from_pauli_string(right)
+    )
+    assert len(product) == 20
+    # the coefficients being complex, the monomials are summed without
+    # simplification (which only keeps the real part)
+    product_matrix = sum(
+        mono.to_matrix() for mono in product.to_pauli_string().monomials
+    )
+    assert matrix_eq(product_matrix, left.to_matrix() @ right.to_matrix())
+
+
+def test_tensor_product():
+    left, right = X @ Y + 2 * Z @ I, 3 * Y + I
+    tensor = PauliStringArray.from_pauli_string(
+        left
+    ) @ PauliStringArray.from_pauli_string(right)
+    assert tensor.nb_qubits == 3
+    assert tensor.to_pauli_string().to_dict() == {
+        "XYI": 1,
+        "XYY": 3,
+        "ZII": 2,
+        "ZIY": 6,
+    }
+
+
+def test_simplify_and_sort():
+    ps = Z @ X + 2 * I @ I - Z @ X + Y @ Y + 0.5 * I @ I + X @ Z
+    simplified = PauliStringArray.from_pauli_string(ps).simplify()
+    assert len(simplified) == 3
+    assert str(simplified.to_pauli_string()) == str(ps.simplify().sort_monomials())
+    assert simplified == PauliStringArray.from_pauli_string(ps)
+
+
+def test_arithmetic():
+    a = PauliStringArray.from_pauli_string(X @ Z + I @ I)
+    b = PauliStringArray.from_pauli_string(2 * X @ Z)
+    assert (a + b).simplify() == PauliStringArray.from_pauli_string(3 * X @ Z + I @ I)
+    assert (a - a).simplify().to_pauli_string().monomials == []
+    assert (a * 2) / 2 == a
+    with pytest.raises(ValueError):
+        a + PauliStringArray.from_pauli_string(X)
+
+
+def test_type_checks():
+    with pytest.raises(TypeCheckError):
+        PauliStringArray.from_pauli_string("X@Y")  # pyright: ignore[reportArgumentType]
+    with pytest.raises(TypeCheckError):
+        PauliStringArray.from_pauli_string(X @ Y) @ (
+            X @ Y
+        )  # pyright: ignore[reportOperatorIssue]
@@ -16,12 +16,31 @@ from mpqp.core.instruction.measurement.pauli_string import I
 from mpqp.core.instruction.measurement.pauli_string import Z as Pauli_Z
 from mpqp.execution.devices import ATOSDevice
 from mpqp.execution.runner import run
-from mpqp.gates import CNOT, CZ, SWAP, TOF, CRk, Gate, H, Id, Rx, Ry, Rz, S, T, X, Y, Z
+from mpqp.gates import (
+    CNOT,
+    CZ,
+    SWAP,
+    TOF,
+    CRk,
+    CustomGate,
+    Gate,
+    H,
+    Id,
+    Rx,
+    Ry,
+    Rz,
+    S,
+    T,
+    U,
+    X,
+    Y,
+    Z,
+)
 from mpqp.measures import BasisMeasure, ExpectationMeasure, Observable
 from mpqp.noise.noise_model import AmplitudeDamping, BitFlip, Depolarizing, NoiseModel
 from mpqp.tools.circuit import compute_expected_matrix, random_circuit
 from mpqp.tools.display import one_lined_repr
-from mpqp.tools.errors import UnsupportedBraketFeaturesWarning, NonReversibleWarning
+from mpqp.tools.errors import NonReversibleWarning
 from mpqp.tools.generics import Matrix, OneOrMany
 from mpqp.tools.maths import matrix_eq
 
@@ -81,6 +100,60 @@ def test_add(
         assert str(init_circuit) == f.read()
 
 
+def test_eq_and_hash():
+    from pickle import dumps, loads
+
+    from mpqp.core.instruction.measurement.pauli_string import X as Pauli_X
+
+    def build():
+        return QCircuit(
+            [
+                H(0),
+                CNOT(0, 1),
+                Rx(0.5, 1),
+                ExpectationMeasure(Observable(Pauli_Z @ Pauli_X), [0, 1], shots=10),
+            ]
+        )
+
+    circuit = build()
+    assert circuit == build() and hash(circuit) == hash(build())
+    assert circuit == loads(dumps(circuit))
+    assert {circuit: 1}[build()] == 1
+
+    circuit.depth()
+    assert circuit == build()
+    circuit.add(X(0))
+    assert circuit != build()
+    circuit.instructions = circuit.instructions[:-1]
+    assert circuit == build() and hash(circuit) == hash(build())
+    circuit.label = "labelled"
+    assert circuit != build()
+
+    shifted = build()
+    shifted.gphase = np.pi / 2
+    assert shifted != build() and hash(shifted) == hash(build())
+
+    assert Rx(0.5, 1) == Rx(0.5, 1) and hash(Rx(0.5, 1)) == hash(Rx(0.5, 1))
+    assert Rx(0.5, 1) != Ry(0.5, 1) and Rx(0.5, 1) != Rx(0.5, 0)
+    assert len({H(0), H(0), H(1), CNOT(0, 1), CNOT(1, 0)}) == 4
+    assert Observable(np.diag([1, -1])) == Observable(Pauli_Z)
+
+
+def test_eq_and_hash_in_place_edits():
+    circuit = QCircuit([H(0), X(1)])
+    reference = QCircuit([H(0), X(1)])
+    assert circuit == reference and hash(circuit) == hash(reference)
+
+    circuit.instructions[1] = Y(1)
+    assert circuit != reference and hash(circuit) != hash(reference)
+    assert circuit == QCircuit([H(0), Y(1)])
+
+    old_hash = hash(circuit)
+    circuit.instructions[0].targets = [1]
+    assert hash(circuit) != old_hash
+    assert circuit == QCircuit([H(1), Y(1)], nb_qubits=2)
+
+
 @pytest.mark.parametrize(
     "instructions, result",
     [
@@ -89,12 +162,79 @@ def test_add(
         ([CNOT(0, 1), CNOT(1, 2), CNOT(0, 1), X(2)], 3),
         ([CNOT(0, 1), CNOT(1, 2), CNOT(0, 1), Barrier(), X(2)], 4),
         ([CNOT(0, 1), CNOT(1, 2), CNOT(2, 3), X(0), X(0)], 3),
+        ([X(0), X(0), X(1), X(1)], 2),
+        ([X(0), X(0), X(1), CNOT(1, 2)], 2),
     ],
 )
 def test_depth(instructions: list[Instruction], result: int):
     assert QCircuit(instructions).depth() == result
 
 
+@pytest.mark.parametrize("seed", range(5))
+def test_depth_after_edits(seed: int):
+    reference = random_circuit(nb_qubits=5, nb_gates=30, seed=seed)
+    circuit = QCircuit(5)
+    for gate in reference.gates:
+        circuit.add(gate)
+        assert circuit.depth() == QCircuit(circuit.instructions).depth()
+    assert circuit == QCircuit(circuit.instructions, nb_qubits=5)
+
+    path = circuit.critical_path()
+    assert len(path) == circuit.depth()
+    assert all(
+        set(first.connections()) & set(second.connections())
+        for first, second in zip(path, path[1:])
+    )
+
+    circuit.instructions = circuit.instructions[:10]
+    assert circuit.depth() == QCircuit(reference.gates[:10], nb_qubits=5).depth()
+
+
+def test_depth_in_place_edits():
+    circuit = QCircuit([H(0), H(1)])
+    assert circuit.depth() == 1
+    circuit.instructions[1].targets = [0]
+    assert circuit.depth() == 2
+    circuit.instructions[1] = CNOT(0, 1)
+    assert circuit.depth() == circuit.two_qubit_depth() + 1 == 2
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_depth_mixed_add_and_insert(seed: int):
+    reference = random_circuit(nb_qubits=5, nb_gates=40, seed=seed)
+    rng = np.random.default_rng(seed)
+    circuit = QCircuit(5)
+    for gate in reference.gates:
+        if rng.random() < 0.3:
+            circuit.instructions.insert(int(rng.integers(len(circuit) + 1)), gate)
+        else:
+            tracker = circuit._depth_tracker  # pyright: ignore[reportPrivateUsage]
+            circuit.add(gate)
+            if tracker is not None:
+                # the cached tracker is updated in place by ``add``
+                assert (
+                    circuit._depth_tracker  # pyright: ignore[reportPrivateUsage]
+                    is tracker
+                )
+        expected = QCircuit(list(circuit.instructions), nb_qubits=5)
+        assert circuit.depth() == expected.depth()
+        assert circuit.two_qubit_depth() == expected.two_qubit_depth()
+        assert len(circuit.critical_path()) == circuit.depth()
+
+
+@pytest.mark.parametrize(
+    "instructions, result",
+    [
+        ([H(0), X(1), Y(2)], 0),
+        ([H(0), CNOT(0, 1), H(1), CNOT(1, 2), CNOT(0, 1)], 3),
+        ([CNOT(0, 1), CNOT(2, 3), H(0)], 1),
+        ([CNOT(0, 1), Barrier(), CNOT(2, 3)], 2),
+    ],
+)
+def test_two_qubit_depth(instructions: list[Instruction], result: int):
+    assert QCircuit(instructions).two_qubit_depth() == result
+
+
 @pytest.mark.parametrize(
     "circuit, result",
     [
@@ -198,6 +338,139 @@ def test_get_measurements(circuit: QCircuit, result_repr: str):
     assert one_lined_repr(circuit.measurements) == result_repr
 
 
+@pytest.mark.parametrize("seed", range(5))
+def test_light_cone(seed: int):
+    from mpqp.execution.providers.native import simulate_state_vector
+
+    circuit = random_circuit(nb_qubits=6, nb_gates=8, seed=seed)
+    qubits = [seed % 6]
+    reduced, cone = circuit.light_cone(qubits)
+    assert reduced.nb_qubits == len(cone) and set(qubits) <= set(cone)
+    assert len(reduced.gates) <= len(circuit.gates)
+
+    def marginal(circuit: QCircuit, qubits: list[int]):
+        probabilities = np.abs(simulate_state_vector(circuit)) ** 2
+        probabilities = probabilities.reshape((2,) * circuit.nb_qubits)
+        others = tuple(q for q in range(circuit.nb_qubits) if q not in qubits)
+        return np.sum(probabilities, axis=others)
+
+    assert np.allclose(
+        marginal(circuit, qubits),
+        marginal(reduced, [cone.index(qubit) for qubit in qubits]),
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_optimize_random(seed: int):
+    circuit = random_circuit(nb_qubits=4, nb_gates=30, seed=seed)
+    circuit.add([gate.inverse() for gate in reversed(circuit.gates[-10:])])
+
+    exact = circuit.optimize()
+    assert len(exact.gates) <= len(circuit.gates) - 2
+    assert matrix_eq(exact.to_matrix(), circuit.to_matrix())
+    assert exact.gphase == 0
+
+    fused = circuit.optimize(["identities", "involutions", "single_qubit_fusion"])
+    # the global phase can cost an additional Rz gate
+    assert len(fused.gates) <= len(exact.gates) + 1
+    assert fused.gphase == 0
+    assert matrix_eq(fused.to_matrix(), circuit.to_matrix(), atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "circuit, criteria, expected",
+    [
+        (QCircuit([H(0), Id(1), H(0)]), "identities", [H(0), H(0)]),
+        (QCircuit([H(0), X(0), X(0), H(0)]), "involutions", []),
+        (QCircuit([SWAP(0, 1), SWAP(1, 0)]), "involutions", []),
+        (QCircuit([CNOT(0, 1), CNOT(1, 0)]), "involutions", [CNOT(0, 1), CNOT(1, 0)]),
+        (QCircuit([H(0), CNOT(0, 1), H(0)]), "involutions", [H(0), CNOT(0, 1), H(0)]),
+        (QCircuit([Rx(0.5, 0), Rx(0.5, 0), Rx(-1, 0)]), "rotations", []),
+        (QCircuit([Rx(0.5, 0), Ry(0.5, 0)]), "rotations", [Rx(0.5, 0), Ry(0.5, 0)]),
+        (QCircuit([H(0), Barrier(), H(0)]), None, [H(0), H(0)]),
+    ],
+)
+def test_optimize(circuit: QCircuit, criteria: Optional[str], expected: list[Gate]):
+    optimized = circuit.optimize(criteria)
+    assert repr(optimized.gates) == repr(expected)
+    assert len(circuit.gates) >= len(expected)
+
+
+@pytest.mark.parametrize("fusion_size", [2, 3, 4, 5])
+def test_fuse_blocks(fusion_size: int):
+    from mpqp.tools.optimization import fuse_blocks
+
+    circuit = random_circuit(nb_qubits=6, nb_gates=40, seed=fusion_size)
+    fused = QCircuit(fuse_blocks(circuit.instructions, fusion_size), nb_qubits=6)
+    assert len(fused.gates) < len(circuit.gates)
+    for gate in fused.gates:
+        if isinstance(gate, CustomGate):
+            assert len(gate.targets) <= fusion_size
+    assert matrix_eq(fused.to_matrix(), circuit.to_matrix())
+    assert len(circuit.optimize("block_fusion").gates) <= len(circuit.gates)
+
+
+@pytest.mark.parametrize(
+    "gates",
+    [
+        [X(0), H(1), Y(0), S(1), T(1), CNOT(0, 1)],
+        [H(0), T(0), H(0), CNOT(0, 1)],
+        [Rz(np.pi, 0), Rz(np.pi, 0), H(1)],
+        [Rx(0.3, 0), Ry(1.2, 0), X(1), Z(1), Rz(0.7, 1)],
+    ],
+)
+def test_optimize_global_phase(gates: list[Gate]):
+    from mpqp.execution import (
+        ATOSDevice,
+        AWSDevice,
+        GOOGLEDevice,
+        IBMDevice,
+        MPQPDevice,
+        Result,
+    )
+
+    circuit = QCircuit(gates)
+    fused = circuit.optimize(["single_qubit_fusion"])
+    assert fused.gphase == 0
+    assert matrix_eq(fused.to_matrix(), circuit.to_matrix())
+
+    for device in [
+        IBMDevice.AER_SIMULATOR_STATEVECTOR,
+        ATOSDevice.MYQLM_PYLINALG,
+        AWSDevice.BRAKET_LOCAL_SIMULATOR,
+        GOOGLEDevice.CIRQ_LOCAL_SIMULATOR,
+        MPQPDevice.STATEVECTOR,
+    ]:
+        expected = run(circuit, device)
+        result = run(fused, device)
+        assert isinstance(expected, Result) and isinstance(result, Result)
+        assert matrix_eq(result.amplitudes, expected.amplitudes, atol=1e-6)
+
+
+def test_optimize_skips_noisy_circuits():
+    circuit = QCircuit([H(0), H(0), Depolarizing(0.1, [0])])
+    with pytest.warns(UserWarning, match="noise"):
+        optimized = circuit.optimize()
+    assert optimized == circuit and optimized is not circuit
+
+
+def test_optimize_keeps_measures_and_parameters():
+    from sympy import symbols
+
+    theta = symbols("θ")
+    circuit = QCircuit(
+        [Rz(theta, 0), Rz(theta, 0), H(1), H(1), BasisMeasure(shots=100), X(0)]
+    )
+    optimized = circuit.optimize()
+    assert repr(optimized.gates) == repr([Rz(2 * theta, 0), X(0)])
+    assert len(optimized.measurements) == 1
+    assert optimized.instructions.index(optimized.measurements[0]) == 1
+    assert len(circuit.gates) == 5
+
+    with pytest.raises(ValueError):
+        circuit.optimize("depth")
+
+
 @pytest.mark.parametrize(
     "circuit, printed_result_filename",
     [
@@ -295,14 +568,8 @@ T  : │         0         │"""
 def test_to_other_language(
     circuit: QCircuit, args: tuple[Language], result_type: type, result_repr: str
 ):
-    language = Language.QISKIT if len(args) == 0 else args[0]
     # TODO: test other languages
-    if language == Language.BRAKET:
-        with pytest.warns(UnsupportedBraketFeaturesWarning) as record:
-            converted_circuit = circuit.to_other_language(*args)
-        assert len(record) == 1
-    else:
-        converted_circuit = circuit.to_other_language(*args)
+    converted_circuit = circuit.to_other_language(*args)
     assert type(converted_circuit) == result_type
     if isinstance(converted_circuit, QiskitCircuit):
         assert repr(converted_circuit.data) == result_repr
@@ -455,6 +722,47 @@ def test_to_matrix_random():
         matrix_eq(qcircuit.to_matrix(), expected_matrix)
 
 
+def test_compile_parameters_matches_subs():
+    from sympy import pi, symbols
+
+    theta, phi, k = symbols("θ φ k")
+    circuit = QCircuit(
+        [
+            Rx(theta, 0),
+            CNOT(0, 1),
+            Ry(2 * theta + phi, 1),
+            U(theta, phi, pi / 2, 2),
+            CRk(k, 1, 2),
+            Rz(0.3, 0),
+            BasisMeasure(shots=100),
+        ]
+    )
+    compiled = circuit.compile_parameters([theta, phi, k])
+    for values in [[0.1, 0.2, 2], [1.5, -0.7, 3]]:
+        bound = compiled.bind(values)
+        expected = circuit.subs(dict(zip([theta, phi, k], values)), True)
+        assert bound.variables() == set()
+        assert matrix_eq(bound.to_matrix(), expected.to_matrix())
+    assert circuit.variables() == {theta, phi, k}
+
+    with pytest.raises(ValueError):
+        circuit.compile_parameters([theta, phi])
+    with pytest.raises(ValueError):
+        compiled.bind([0.1])
+
+
+@pytest.mark.parametrize("fusion_size", [0, 1, 2, 3])
+def test_to_matrix_matches_qiskit(fusion_size: int):
+    from qiskit.quantum_info.operators import Operator
+
+    for seed in range(5):
+        qcircuit = random_circuit(nb_qubits=4, nb_gates=25, seed=seed)
+        qiskit_circuit = qcircuit.to_other_language(Language.QISKIT)
+        assert isinstance(qiskit_circuit, QiskitCircuit)
+        expected_matrix = Operator.from_circuit(qiskit_circuit).reverse_qargs()
+        assert matrix_eq(qcircuit.to_matrix(fusion_size), expected_matrix.to_matrix())
+
+
 @pytest.mark.parametrize(
     "circuit, expected_inverse",
     [
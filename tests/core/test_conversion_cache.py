@@ -0,0 +1,167 @@
+import os
+import warnings
+
+import pytest
+from qiskit import QuantumCircuit
+
+from mpqp import Language, QCircuit
+from mpqp.core.conversion_cache import CONVERSION_CACHE, ConversionCache
+from mpqp.gates import CNOT, H, U, X, Y
+from mpqp.tools.errors import OpenQASMTranslationWarning
+
+
+def test_lru_bounds():
+    cache = ConversionCache(max_entries=2, max_bytes=10)
+    for key in ["a", "b", "c"]:
+        cache.get_or_convert(key, lambda: ("qasm", 0.0))
+    assert len(cache) == 2 and cache.misses == 3
+
+    cache.get_or_convert("b", lambda: ("other", 0.0))
+    cache.get_or_convert("d", lambda: ("qasm", 0.0))
+    assert cache.hits == 1 and len(cache) == 2
+    assert cache.get_or_convert("b", lambda: ("other", 0.0))[0] == "qasm"
+    assert cache.get_or_convert("c", lambda: ("other", 0.0))[0] == "other"
+
+    cache.get_or_convert("e", lambda: ("a" * 20, 0.0))
+    assert cache.nb_bytes <= 10 and cache.get_or_convert("e", lambda: ("", 0.0)) == (
+        "",
+        0.0,
+    )
+
+
+def test_hits_return_copies():
+    CONVERSION_CACHE.clear()
+    QCircuit([H(0), CNOT(0, 1)]).to_other_language(Language.QISKIT)
+    # circuits converted once are not serialized
+    assert len(CONVERSION_CACHE) == 0
+    first = QCircuit([H(0), CNOT(0, 1)]).to_other_language(Language.QISKIT)
+    assert isinstance(first, QuantumCircuit)
+    assert len(CONVERSION_CACHE) == 1
+    first.x(0)
+    second = QCircuit([H(0), CNOT(0, 1)]).to_other_language(Language.QISKIT)
+    assert isinstance(second, QuantumCircuit)
+    assert len(second.data) == 2 and second is not first
+    assert CONVERSION_CACHE.hits == 1
+
+    QCircuit([H(0), CNOT(0, 1), X(1)]).to_other_language(Language.QISKIT)
+    QCircuit([H(0), CNOT(0, 1)]).to_other_language(Language.QASM2)
+    assert CONVERSION_CACHE.misses == 4
+
+
+def test_in_place_edits():
+    circuit = QCircuit([H(0), X(1)])
+    assert "x q[1];" in str(circuit.to_other_language(Language.QASM2))
+    circuit.instructions[1] = Y(1)
+    qasm = circuit.to_other_language(Language.QASM2)
+    assert "y q[1];" in str(qasm) and "x q[1];" not in str(qasm)
+
+
+def test_translation_warning_flag():
+    CONVERSION_CACHE.clear()
+    QCircuit([U(0.1, 0.2, 0.3, 0)]).to_other_language(
+        Language.QASM3, translation_warning=False
+    )
+    with pytest.warns(OpenQASMTranslationWarning):
+        QCircuit([U(0.1, 0.2, 0.3, 0)]).to_other_language(Language.QASM3)
+    assert CONVERSION_CACHE.misses == 2
+
+
+def test_warnings_are_replayed():
+    cache = ConversionCache()
+
+    def convert():
+        warnings.warn("lossy conversion", UserWarning)
+        return "qasm", 0.5
+
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="lossy conversion"):
+            assert cache.get_or_convert("key", convert) == ("qasm", 0.5)
+
+
+def test_warning_filters_are_kept():
+    cache = ConversionCache()
+
+    def convert():
+        warnings.warn("lossy conversion", UserWarning)
+        return "qasm", 0.5
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("ignore")
+        cache.get_or_convert("ignored", convert)
+        cache.get_or_convert("ignored", convert)
+    assert caught == []
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(UserWarning):
+            cache.get_or_convert("error", convert)
+    assert len(cache) == 1
+
+
+def test_disk_tier(tmp_path: str):
+    circuit = QCircuit([H(0), CNOT(0, 1)])
+    key = (circuit._fingerprint(), Language.QISKIT, None)
+    convert = lambda: (circuit._to_other_language(Language.QISKIT), 0.0)
+
+    ConversionCache(directory=str(tmp_path)).get_or_convert(key, convert)
+    worker = ConversionCache(directory=str(tmp_path))
+    converted, _ = worker.get_or_convert(key, lambda: pytest.fail("not cached"))
+    assert isinstance(converted, QuantumCircuit)
+    assert worker.disk_hits == 1 and worker.misses == 0
+
+    worker.clear()
+    worker.get_or_convert(key, convert)
+    assert worker.misses == 1
+
+
+def test_disk_tier_signatures(tmp_path: str):
+    import pickle
+
+    key = ("signed",)
+    ConversionCache(directory=str(tmp_path), secret=b"key").get_or_convert(
+        key, lambda: ("qasm", 0.0)
+    )
+    path = ConversionCache(directory=str(tmp_path))._path(key)
+    assert path is not None and os.path.isfile(path)
+
+    # a wrong secret, or a file forged without it, is not loaded
+    other = ConversionCache(directory=str(tmp_path), secret=b"other")
+    assert other.get_or_convert(key, lambda: ("other", 0.0))[0] == "other"
+    with open(path, "wb") as file:
+        file.write(bytes(32) + pickle.dumps(("forged", 0.0, [])))
+    worker = ConversionCache(directory=str(tmp_path), secret=b"key")
+    assert worker.get_or_convert(key, lambda: ("qasm", 0.0))[0] == "qasm"
+    assert worker.disk_hits == 0 and worker.misses == 1
+
+    worker = ConversionCache(directory=str(tmp_path), secret=b"key")
+    assert worker.get_or_convert(key, lambda: ("other", 0.0))[0] == "qasm"
+    assert worker.disk_hits == 1
+
+
+def test_disk_key_is_process_independent(tmp_path: str):
+    import subprocess
+    import sys
+
+    script = (
+        "from mpqp.core.conversion_cache import ConversionCache;"
+        f"cache = ConversionCache(directory={str(tmp_path)!r});"
+        "print(cache._path((frozenset('abcdefgh'), frozenset({('x', 1), ('y', 2)}))))"
+    )
+    paths = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ["1", "2", "3"]
+    }
+    assert len(paths) == 1
+
+
+def test_disabled():
+    cache = ConversionCache(enabled=False)
+    for value in ["a", "b"]:
+        assert cache.get_or_convert("key", lambda: (value, 0.0))[0] == value
+    assert len(cache) == 0 and cache.hits == cache.misses == 0
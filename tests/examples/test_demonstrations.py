@@ -1,5 +1,3 @@
-from typing import Any, Callable
-
 import numpy as np
 import pytest
 from braket.devices import LocalSimulator
@@ -8,7 +6,7 @@ from mpqp import QCircuit
 from mpqp.core.instruction.measurement import ExpectationMeasure, Observable
 from mpqp.core.languages import Language
 from mpqp.execution import run
-from mpqp.execution.devices import ATOSDevice, AvailableDevice, AWSDevice, IBMDevice
+from mpqp.execution.devices import ATOSDevice, AWSDevice, IBMDevice
 from mpqp.gates import *
 from mpqp.measures import BasisMeasure
 from mpqp.qasm.qasm_to_braket import qasm3_to_braket_Circuit
@@ -17,14 +15,6 @@ from mpqp.tools.errors import UnsupportedBraketFeaturesWarning
 # TODO: add CIRQ local simulator devices to this file
 
 
-def warn_guard(device: AvailableDevice, run: Callable[[], Any]):
-    if isinstance(device, AWSDevice):
-        with pytest.warns(UnsupportedBraketFeaturesWarning):
-            return run()
-    else:
-        return run()
-
-
 def test_sample_demo():
     # Declaration of the circuit with the right size
     circuit = QCircuit(4)
@@ -49,7 +39,7 @@ def test_sample_demo():
     circuit.add(BasisMeasure([0, 1, 2, 3], shots=2000))
 
     # Run the circuit on a selected device
-    runner = lambda: run(
+    run(
         circuit,
         [
             IBMDevice.AER_SIMULATOR,
@@ -64,8 +54,6 @@ def test_sample_demo():
         ],
     )
 
-    warn_guard(AWSDevice.BRAKET_LOCAL_SIMULATOR, runner)
-
     assert True
 
 
@@ -122,7 +110,7 @@ def test_statevector_demo():
     )
 
     # when no measure in the circuit, must run in statevector mode
-    runner = lambda: run(
+    run(
         circuit,
         [
             IBMDevice.AER_SIMULATOR_STATEVECTOR,
@@ -134,13 +122,11 @@ def test_statevector_demo():
         ],
     )
 
-    warn_guard(AWSDevice.BRAKET_LOCAL_SIMULATOR, runner)
-
     # same when we add a BasisMeasure with 0 shots
     circuit.add(BasisMeasure([0, 1, 2, 3], shots=0))
 
     # Run the circuit on a selected device
-    runner = lambda: run(
+    run(
         circuit,
         [
             IBMDevice.AER_SIMULATOR_STATEVECTOR,
@@ -152,8 +138,6 @@ def test_statevector_demo():
         ],
     )
 
-    warn_guard(AWSDevice.BRAKET_LOCAL_SIMULATOR, runner)
-
     assert True
 
 
@@ -201,7 +185,7 @@ def test_observable_demo(shots: int):
     circuit.add(ExpectationMeasure(obs, shots=shots))
 
     # Running the computation on myQLM and on Aer simulator, then retrieving the results
-    runner = lambda: run(
+    run(
         circuit,
         [
             ATOSDevice.MYQLM_PYLINALG,
@@ -216,8 +200,6 @@ def test_observable_demo(shots: int):
         ],
     )
 
-    warn_guard(AWSDevice.BRAKET_LOCAL_SIMULATOR, runner)
-
     assert True
 
 
@@ -233,8 +215,8 @@ def test_aws_qasm_executions():
     c[0] = measure q[0];
     c[1] = measure q[1];"""
 
-    runner = lambda: qasm3_to_braket_Circuit(qasm_str)
-    circuit = warn_guard(AWSDevice.BRAKET_LOCAL_SIMULATOR, runner)
+    with pytest.warns(UnsupportedBraketFeaturesWarning):
+        circuit = qasm3_to_braket_Circuit(qasm_str)
     device.run(circuit, shots=100).result()
 
 
@@ -261,9 +243,7 @@ def test_aws_mpqp_executions():
     # Add measurement
     circuit.add(BasisMeasure([0, 1, 2, 3], shots=2000))
 
-    runner = lambda: run(circuit, AWSDevice.BRAKET_LOCAL_SIMULATOR)
-
-    warn_guard(AWSDevice.BRAKET_LOCAL_SIMULATOR, runner)
+    run(circuit, AWSDevice.BRAKET_LOCAL_SIMULATOR)
 
     #####################################################
 
@@ -287,10 +267,7 @@ def test_aws_mpqp_executions():
     circuit.add(ExpectationMeasure(obs, shots=0))
 
     # Running the computation on myQLM and on Braket simulator, then retrieving the results
-    runner = lambda: run(
-        circuit, [AWSDevice.BRAKET_LOCAL_SIMULATOR, ATOSDevice.MYQLM_PYLINALG]
-    )
-    warn_guard(AWSDevice.BRAKET_LOCAL_SIMULATOR, runner)
+    run(circuit, [AWSDevice.BRAKET_LOCAL_SIMULATOR, ATOSDevice.MYQLM_PYLINALG])
 
     #####################################################
 
@@ -300,10 +277,7 @@ def test_aws_mpqp_executions():
     )
 
     # Running the computation on myQLM and on Aer simulator, then retrieving the results
-    runner = lambda: run(
-        circuit, [AWSDevice.BRAKET_LOCAL_SIMULATOR, ATOSDevice.MYQLM_PYLINALG]
-    )
-    warn_guard(AWSDevice.BRAKET_LOCAL_SIMULATOR, runner)
+    run(circuit, [AWSDevice.BRAKET_LOCAL_SIMULATOR, ATOSDevice.MYQLM_PYLINALG])
 
 
 def test_all_native_gates():
@@ -319,13 +293,12 @@ def test_all_native_gates():
 
     circuit.to_other_language(Language.QASM2)
     circuit.to_other_language(Language.QASM3, translation_warning=False)
-    with pytest.warns(UnsupportedBraketFeaturesWarning):
-        run(
-            circuit,
-            [
-                ATOSDevice.MYQLM_PYLINALG,
-                ATOSDevice.MYQLM_CLINALG,
-                IBMDevice.AER_SIMULATOR_STATEVECTOR,
-                AWSDevice.BRAKET_LOCAL_SIMULATOR,
-            ],
-        )
+    run(
+        circuit,
+        [
+            ATOSDevice.MYQLM_PYLINALG,
+            ATOSDevice.MYQLM_CLINALG,
+            IBMDevice.AER_SIMULATOR_STATEVECTOR,
+            AWSDevice.BRAKET_LOCAL_SIMULATOR,
+        ],
+    )
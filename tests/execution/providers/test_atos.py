@@ -7,12 +7,14 @@ import sys
 import numpy as np
 import pytest
 
-from mpqp import QCircuit
+from mpqp import Language, QCircuit
 from mpqp.core.instruction.measurement import ExpectationMeasure, Observable
 from mpqp.execution import run
 from mpqp.execution.devices import ATOSDevice
 from mpqp.gates import *
 from mpqp.measures import BasisMeasure
+from mpqp.qasm.qasm_to_myqlm import qasm2_to_myqlm_Circuit
+from mpqp.tools.circuit import random_circuit
 
 
 @pytest.mark.parametrize(
@@ -71,3 +73,20 @@ def running_remote_QLM_without_error(circuit: QCircuit):
 
 if "--long" in sys.argv:
     test_running_remote_QLM_without_error = running_remote_QLM_without_error
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_direct_myqlm_conversion(seed: int):
+    circuit = random_circuit(nb_qubits=4, nb_gates=30, seed=seed)
+    expected = qasm2_to_myqlm_Circuit(circuit.to_other_language(Language.QASM2))
+    converted = circuit.to_other_language(Language.MY_QLM)
+    assert converted.nbqbits == expected.nbqbits
+    assert len(converted.ops) == len(expected.ops)
+    for op, expected_op in zip(converted.ops, expected.ops):
+        syntax = converted.gateDic[op.gate].syntax
+        expected_syntax = expected.gateDic[expected_op.gate].syntax
+        assert syntax.name == expected_syntax.name and op.qbits == expected_op.qbits
+        assert np.allclose(
+            [param.double_p for param in syntax.parameters],
+            [param.double_p for param in expected_syntax.parameters],
+        )
@@ -1,10 +1,14 @@
 # 3M-TODO
+import numpy as np
 import pytest
+from braket.circuits import Circuit
 
-from mpqp import QCircuit
-from mpqp.execution import AWSDevice, run
+from mpqp import Language, QCircuit
+from mpqp.execution import AWSDevice, MPQPDevice, Result, run
 from mpqp.gates import *
+from mpqp.tools.circuit import random_circuit
 from mpqp.tools.errors import UnsupportedBraketFeaturesWarning
+from mpqp.tools.maths import matrix_eq
 
 
 @pytest.mark.parametrize(
@@ -17,5 +21,25 @@ from mpqp.tools.errors import UnsupportedBraketFeaturesWarning
     ],
 )
 def test_braket_non_contiguous_qubits(circuit: QCircuit):
+    run(circuit, AWSDevice.BRAKET_LOCAL_SIMULATOR)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_direct_braket_conversion(seed: int):
+    circuit = random_circuit(nb_qubits=4, nb_gates=30, seed=seed)
+    braket_circuit = circuit.to_other_language(Language.BRAKET)
+    assert isinstance(braket_circuit, Circuit)
+    assert braket_circuit.qubit_count == 4
+
+    braket = run(circuit, AWSDevice.BRAKET_LOCAL_SIMULATOR)
+    native = run(circuit, MPQPDevice.STATEVECTOR)
+    assert isinstance(braket, Result) and isinstance(native, Result)
+    assert matrix_eq(braket.amplitudes, native.amplitudes)
+
+
+def test_braket_conversion_qasm_fallback():
+    circuit = QCircuit([CustomGate(UnitaryMatrix(np.diag([1, 1j])), [0]), H(1)])
     with pytest.warns(UnsupportedBraketFeaturesWarning):
-        run(circuit, AWSDevice.BRAKET_LOCAL_SIMULATOR)
+        braket_circuit = circuit.to_other_language(Language.BRAKET)
+    assert isinstance(braket_circuit, Circuit)
+    assert braket_circuit.qubit_count == 2
@@ -3,16 +3,20 @@ import pytest
 from cirq.circuits.circuit import Circuit
 from cirq.ops.common_gates import CNOT as CirqCNOT
 from cirq.ops.measure_util import measure
+from cirq.ops.measurement_gate import MeasurementGate
 from cirq.ops.named_qubit import NamedQubit
 from cirq.ops.pauli_gates import X as CirqX
 from cirq.ops.identity import I as CirqI
+from cirq.protocols.unitary_protocol import unitary
 
-from mpqp import QCircuit
+from mpqp import Language, QCircuit
 from mpqp.core.instruction.measurement import ExpectationMeasure, Observable
 from mpqp.execution import GOOGLEDevice, run
 from mpqp.gates import *
 from mpqp.measures import BasisMeasure
 from mpqp.qasm import qasm2_to_cirq_Circuit
+from mpqp.tools.circuit import random_circuit
+from mpqp.tools.maths import matrix_eq
 
 
 @pytest.mark.parametrize(
@@ -93,3 +97,28 @@ def test_qasm2_to_cirq_Circuit(circuit: QCircuit, qasm_filename: str):
         encoding="utf-8",
     ) as f:
         assert qasm2_to_cirq_Circuit(f.read()) == circuit
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_direct_cirq_conversion(seed: int):
+    circuit = random_circuit(nb_qubits=4, nb_gates=30, seed=seed)
+    expected = qasm2_to_cirq_Circuit(circuit.to_other_language(Language.QASM2))
+    converted = circuit.to_other_language(Language.CIRQ)
+    assert isinstance(converted, Circuit)
+    assert converted.all_qubits() == expected.all_qubits()
+    assert matrix_eq(unitary(converted), unitary(expected))
+
+    circuit.add(BasisMeasure([3, 1, 0, 2], shots=100))
+    expected = qasm2_to_cirq_Circuit(circuit.to_other_language(Language.QASM2))
+    converted = circuit.to_other_language(Language.CIRQ)
+    assert isinstance(converted, Circuit)
+    assert list(converted.findall_operations_with_gate_type(MeasurementGate)) == list(
+        expected.findall_operations_with_gate_type(MeasurementGate)
+    )
+
+
+def test_cirq_conversion_qasm_fallback():
+    circuit = QCircuit([CustomGate(UnitaryMatrix(np.diag([1, 1j])), [0]), H(1)])
+    converted = circuit.to_other_language(Language.CIRQ)
+    assert isinstance(converted, Circuit)
+    assert matrix_eq(unitary(converted), circuit.to_matrix())
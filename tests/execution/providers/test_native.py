@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from mpqp import QCircuit
+from mpqp.execution import IBMDevice, MPQPDevice, Result, run
+from mpqp.execution.providers.native import simulate_state_vector
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure, ExpectationMeasure, Observable
+from mpqp.tools.circuit import random_circuit
+from mpqp.tools.maths import matrix_eq
+
+
+@pytest.mark.parametrize(
+    "circuit",
+    [
+        QCircuit([H(0), CNOT(0, 1)]),
+        QCircuit([H(2), CNOT(2, 0), TOF([0, 2], 1), SWAP(0, 2)]),
+        QCircuit([X(1), CRk(3, 1, 0), CP(0.4, 2, 0), T(1), U(0.2, 0.9, 1.7, 2)]),
+        QCircuit(
+            [CustomGate(UnitaryMatrix(np.array([[0, 1], [1, 0]])), [1]), H(1)],
+            nb_qubits=3,
+        ),
+    ],
+)
+def test_state_vector_matches_matrix_semantics(circuit: QCircuit):
+    initial = np.zeros(2**circuit.nb_qubits, dtype=complex)
+    initial[0] = 1
+    expected = circuit.to_matrix().dot(initial)
+    assert matrix_eq(simulate_state_vector(circuit), expected)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_circuit_state_vector(seed: int):
+    circuit = random_circuit(nb_qubits=4, nb_gates=20, seed=seed)
+    reference = run(circuit, IBMDevice.AER_SIMULATOR_STATEVECTOR)
+    result = run(circuit, MPQPDevice.STATEVECTOR)
+    assert isinstance(reference, Result) and isinstance(result, Result)
+    assert matrix_eq(result.amplitudes, reference.amplitudes)
+
+
+@pytest.mark.parametrize("fusion_size", [0, 1, 2, 3, 5])
+def test_state_vector_fusion_size(fusion_size: int):
+    circuit = random_circuit(nb_qubits=5, nb_gates=40, seed=fusion_size)
+    assert matrix_eq(
+        simulate_state_vector(circuit, fusion_size),
+        simulate_state_vector(circuit, 0),
+    )
+
+
+def test_sample_subset_of_qubits():
+    circuit = QCircuit([X(0), X(2), BasisMeasure([2, 1], shots=100)])
+    result = run(circuit, MPQPDevice.STATEVECTOR)
+    assert isinstance(result, Result)
+    assert result.counts == [0, 0, 100, 0]
+
+
+@pytest.mark.parametrize("shots", [0, 20000])
+def test_expectation_value(shots: int):
+    observable = np.array([[4, 2, 3, 8], [2, -3, 1, 0], [3, 1, -1, 5], [8, 0, 5, 2]])
+    circuit = QCircuit(
+        [
+            H(0),
+            Ry(0.7, 1),
+            CNOT(0, 1),
+            ExpectationMeasure(Observable(observable), [1, 0], shots=shots),
+        ]
+    )
+    reference = run(circuit, IBMDevice.AER_SIMULATOR)
+    result = run(circuit, MPQPDevice.STATEVECTOR)
+    assert isinstance(reference, Result) and isinstance(result, Result)
+    tolerance = 1e-5 if shots == 0 else 0.3
+    assert abs(result.expectation_value - reference.expectation_value) < tolerance
+
+
+def test_expectation_value_shots_without_matrix(monkeypatch: pytest.MonkeyPatch):
+    from mpqp.measures import I as Pauli_I
+    from mpqp.measures import X as Pauli_X
+    from mpqp.measures import Y as Pauli_Y
+    from mpqp.measures import Z as Pauli_Z
+
+    def no_matrix(_: Observable):
+        raise AssertionError("the matrix of the observable should not be built")
+
+    monkeypatch.setattr(Observable, "matrix", property(no_matrix))
+    observable = Observable(
+        Pauli_Z @ Pauli_Z
+        + 0.5 * Pauli_X @ Pauli_X
+        - 2 * Pauli_Y @ Pauli_Y
+        + 0.25 * Pauli_I @ Pauli_I
+    )
+    circuit = QCircuit(
+        [H(0), CNOT(0, 1), ExpectationMeasure(observable, [0, 1], shots=1000)],
+        nb_qubits=8,
+    )
+    result = run(circuit, MPQPDevice.STATEVECTOR)
+    assert isinstance(result, Result)
+    assert result.expectation_value == pytest.approx(3.75)
+    assert result.error == pytest.approx(0)
@@ -0,0 +1,85 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from mpqp import QCircuit
+from mpqp.execution import IBMDevice, Job, JobStatus, JobType, Result, StateVector
+from mpqp.execution import remote_handler
+from mpqp.execution.remote_handler import get_remote_result_async
+from mpqp.tools.errors import RemoteExecutionError
+
+
+class FakeProvider:
+    """Local stand-in for a remote provider: each job is over after a given
+    number of status checks."""
+
+    def __init__(self, nb_checks: int):
+        self.nb_checks = nb_checks
+        self.checks: dict[str, int] = {}
+
+    def status(self, job_id: str, device: IBMDevice) -> JobStatus:
+        self.checks[job_id] = self.checks.get(job_id, 0) + 1
+        if self.checks[job_id] < self.nb_checks:
+            return JobStatus.RUNNING
+        return JobStatus.DONE
+
+    def result(self, job_id: str) -> Result:
+        assert self.checks[job_id] >= self.nb_checks
+        job = Job(JobType.STATE_VECTOR, QCircuit(1), IBMDevice.IBM_BRISBANE)
+        job.id = job_id
+        return Result(job, StateVector(np.array([1, 0])))
+
+
+@pytest.fixture
+def provider(monkeypatch: pytest.MonkeyPatch):
+    fake = FakeProvider(nb_checks=3)
+    monkeypatch.setattr(remote_handler, "get_remote_job_status", fake.status)
+    monkeypatch.setattr(remote_handler, "get_result_from_ibm_job_id", fake.result)
+    return fake
+
+
+def test_get_remote_result_async_gather(provider: FakeProvider):
+    job_ids = [f"job{i}" for i in range(5)]
+
+    async def main():
+        return await asyncio.gather(
+            *(
+                get_remote_result_async(
+                    job_id, IBMDevice.IBM_BRISBANE, poll_interval=0.001
+                )
+                for job_id in job_ids
+            )
+        )
+
+    results = asyncio.run(main())
+    assert [result.job.id for result in results] == job_ids
+    assert all(provider.checks[job_id] == 3 for job_id in job_ids)
+
+
+def test_get_remote_result_async_timeout(provider: FakeProvider):
+    provider.nb_checks = 100
+    with pytest.raises(RemoteExecutionError):
+        asyncio.run(
+            get_remote_result_async(
+                "job", IBMDevice.IBM_BRISBANE, poll_interval=0.01, timeout=0.05
+            )
+        )
+
+
+def test_get_remote_result_async_polls_until_timeout(provider: FakeProvider):
+    provider.nb_checks = 2
+    result = asyncio.run(
+        get_remote_result_async(
+            "job", IBMDevice.IBM_BRISBANE, poll_interval=10, timeout=0.05
+        )
+    )
+    assert result.job.id == "job"
+    assert provider.checks["job"] == 2
+
+
+def test_get_remote_result_async_local_device():
+    job = Job(JobType.STATE_VECTOR, QCircuit(1), IBMDevice.AER_SIMULATOR)
+    job.id = "job"
+    with pytest.raises(ValueError):
+        asyncio.run(get_remote_result_async(job))
@@ -1,10 +1,31 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
 
 from mpqp import QCircuit
-from mpqp.gates import H, Rx
-from mpqp.measures import ExpectationMeasure, Observable
-from mpqp.execution import adjust_measure
+from mpqp.gates import CNOT, H, Rx, Ry, Rz, X
+from mpqp.measures import I as Pauli_I
+from mpqp.measures import X as Pauli_X
+from mpqp.measures import Y as Pauli_Y
+from mpqp.measures import Z as Pauli_Z
+from mpqp.measures import BasisMeasure, ExpectationMeasure, Observable
+from mpqp.execution import (
+    AWSDevice,
+    BatchResult,
+    IBMDevice,
+    MPQPDevice,
+    Result,
+    adjust_measure,
+    run,
+    run_async,
+    submit_async,
+)
+from mpqp.core.languages import Language
+from mpqp.execution.runner import generate_job
+from mpqp.noise import Depolarizing
+from mpqp.tools.errors import RemoteExecutionError
 from mpqp.tools.maths import matrix_eq
 
 
@@ -40,3 +61,319 @@ def test_adjust_measure(
     assert matrix_eq(
         adjust_measure(measure, circuit).observable.matrix, adjusted_observable_matrix
     )
+
+
+def test_adjust_measure_stays_compact():
+    measure = ExpectationMeasure(
+        Observable(Pauli_X @ Pauli_Z + 2 * Pauli_Y @ Pauli_I), [10, 11]
+    )
+    adjusted = adjust_measure(measure, QCircuit(40))
+    assert adjusted.observable.nb_qubits == 40
+    qiskit_observable = adjusted.observable.to_other_language(Language.QISKIT)
+    assert len(qiskit_observable) == 2
+    assert qiskit_observable.num_qubits == 40
+    observable, support = adjusted.observable.restricted_to_support()
+    assert support == [10, 11]
+    assert matrix_eq(observable.matrix, measure.observable.matrix)
+
+
+@pytest.mark.parametrize("max_workers, with_executor", [(4, False), (None, True)])
+def test_parallel_run_keeps_order(max_workers: int | None, with_executor: bool):
+    circuits = [QCircuit([Rx(0.3 * i, 0), CNOT(0, 1)]) for i in range(8)]
+    sequential = run(circuits, MPQPDevice.STATEVECTOR)
+    if with_executor:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            parallel = run(circuits, MPQPDevice.STATEVECTOR, executor=executor)
+    else:
+        parallel = run(circuits, MPQPDevice.STATEVECTOR, max_workers=max_workers)
+    assert isinstance(sequential, BatchResult) and isinstance(parallel, BatchResult)
+    assert len(parallel.results) == len(circuits)
+    for seq_result, par_result in zip(sequential.results, parallel.results):
+        assert seq_result.job.circuit.label == par_result.job.circuit.label
+        assert matrix_eq(seq_result.amplitudes, par_result.amplitudes)
+
+
+def test_run_batch_does_not_mutate_circuits():
+    circuits = [QCircuit([H(0)]), QCircuit([X(0)], label="named")]
+    result = run(circuits, MPQPDevice.STATEVECTOR, max_workers=2)
+    assert isinstance(result, BatchResult)
+    assert [r.job.circuit.label for r in result.results] == ["circuit 1", "named"]
+    assert circuits[0].label is None
+    assert circuits[0].gphase == 0
+
+
+def test_generate_job_isolates_lists_and_measures():
+    circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure()])
+    circuit.add(Depolarizing(0.1))
+    job = generate_job(circuit, MPQPDevice.STATEVECTOR)
+    assert job.circuit.noises is not circuit.noises
+    assert job.circuit.instructions is not circuit.instructions
+    assert job.circuit.instructions[-1] is not circuit.instructions[-1]
+    job.circuit.noises.clear()
+    assert len(circuit.noises) == 1
+
+
+def test_run_async_gather_matches_run():
+    circuits = [QCircuit([Rx(0.4 * i, 0), CNOT(0, 1)]) for i in range(4)]
+
+    async def main():
+        return await asyncio.gather(
+            run_async(circuits, MPQPDevice.STATEVECTOR),
+            *(run_async(circ, MPQPDevice.STATEVECTOR) for circ in circuits),
+        )
+
+    batch, *singles = asyncio.run(main())
+    expected = run(circuits, MPQPDevice.STATEVECTOR)
+    assert isinstance(batch, BatchResult) and isinstance(expected, BatchResult)
+    for reference, from_batch, single in zip(expected.results, batch.results, singles):
+        assert isinstance(single, Result)
+        assert matrix_eq(reference.amplitudes, from_batch.amplitudes)
+        assert matrix_eq(reference.amplitudes, single.amplitudes)
+
+
+def test_submit_async_local_device():
+    with pytest.raises(RemoteExecutionError):
+        asyncio.run(submit_async(QCircuit([H(0)]), MPQPDevice.STATEVECTOR))
+
+
+@pytest.mark.parametrize(
+    "device", [MPQPDevice.STATEVECTOR, AWSDevice.BRAKET_LOCAL_SIMULATOR]
+)
+def test_grouped_expectation_value(device: MPQPDevice | AWSDevice):
+    observable = Observable(
+        Pauli_X @ Pauli_X @ Pauli_I
+        + 0.5 * Pauli_Y @ Pauli_Y @ Pauli_Z
+        - Pauli_Z @ Pauli_I @ Pauli_X
+        + 2 * Pauli_Z @ Pauli_Z @ Pauli_I
+        + Pauli_X @ Pauli_I @ Pauli_I
+    )
+    circuit = QCircuit([H(0), Ry(0.7, 1), CNOT(0, 1), Rz(0.3, 0), Rx(1.2, 2)])
+    exact = run(
+        circuit + QCircuit([ExpectationMeasure(observable, [0, 1, 2])]),
+        MPQPDevice.STATEVECTOR,
+    )
+    grouped = run(
+        circuit
+        + QCircuit(
+            [ExpectationMeasure(observable, [0, 1, 2], 10000, grouping="qubitwise")]
+        ),
+        device,
+    )
+    assert isinstance(exact, Result) and isinstance(grouped, Result)
+    assert isinstance(grouped.error, float) and 0 < grouped.error < 0.05
+    assert abs(grouped.expectation_value - exact.expectation_value) < 5 * grouped.error
+
+
+@pytest.mark.parametrize("rounds", [1, 3])
+def test_optimized_shots_expectation_value(rounds: int):
+    observable = Observable(
+        3 * Pauli_X @ Pauli_X
+        + 0.1 * Pauli_Z @ Pauli_I
+        - 2 * Pauli_Y @ Pauli_Y
+        + Pauli_I @ Pauli_I
+    )
+    circuit = QCircuit([H(0), Ry(0.7, 1), CNOT(0, 1), Rz(0.3, 0)])
+    exact = run(
+        circuit + QCircuit([ExpectationMeasure(observable, [0, 1])]),
+        MPQPDevice.STATEVECTOR,
+    )
+    measure = ExpectationMeasure(
+        observable, [0, 1], 12000, optimize_shots=True, allocation_rounds=rounds
+    )
+    optimized = run(circuit + QCircuit([measure]), MPQPDevice.STATEVECTOR)
+    assert isinstance(exact, Result) and isinstance(optimized, Result)
+    assert optimized.shots == 12000
+    assert isinstance(optimized.error, float) and 0 < optimized.error < 0.1
+    assert (
+        abs(optimized.expectation_value - exact.expectation_value) < 5 * optimized.error
+    )
+
+
+@pytest.mark.parametrize("shots", [0, 5000])
+def test_several_expectation_measures(shots: int):
+    observables = [
+        Observable(Pauli_X @ Pauli_Z + 0.5 * Pauli_Y @ Pauli_Y),
+        Observable(np.diag([1, 2, 3, 4])),
+        Observable(2 * Pauli_Z + Pauli_X),
+    ]
+    targets = [[0, 1], [2, 0], [1]]
+    circuit = QCircuit([H(0), Ry(0.4, 1), CNOT(0, 1), Rx(0.3, 2)])
+    measures = [
+        ExpectationMeasure(observable, target, shots)
+        for observable, target in zip(observables, targets)
+    ]
+    expected = []
+    for observable, target in zip(observables, targets):
+        single = run(
+            circuit + QCircuit([ExpectationMeasure(observable, target)]),
+            MPQPDevice.STATEVECTOR,
+        )
+        assert isinstance(single, Result)
+        expected.append(single.expectation_value)
+
+    result = run(circuit + QCircuit(measures), MPQPDevice.STATEVECTOR)
+    assert isinstance(result, Result)
+    assert result.expectation_values.shape == (3,)
+    if shots == 0:
+        assert np.allclose(result.expectation_values, expected)
+    else:
+        assert isinstance(result.error, list)
+        assert np.all(
+            np.abs(result.expectation_values - expected) < 5 * np.array(result.error)
+        )
+
+
+@pytest.mark.parametrize("shots", [0, 5000])
+def test_expectation_measure_with_several_observables(shots: int):
+    observables = [
+        Observable(Pauli_X @ Pauli_Z + 0.5 * Pauli_Y @ Pauli_Y),
+        Observable(np.diag([1, 2, 3, 4])),
+    ]
+    circuit = QCircuit([H(0), Ry(0.4, 1), CNOT(0, 1)])
+    several = run(
+        circuit + QCircuit([ExpectationMeasure(observables, [0, 1], shots)]),
+        MPQPDevice.STATEVECTOR,
+    )
+    separate = run(
+        circuit
+        + QCircuit(
+            [ExpectationMeasure(observable, [0, 1]) for observable in observables]
+        ),
+        MPQPDevice.STATEVECTOR,
+    )
+    assert isinstance(several, Result) and isinstance(separate, Result)
+    assert several.expectation_values.shape == (2,)
+    if shots == 0:
+        assert np.allclose(several.expectation_values, separate.expectation_values)
+    else:
+        assert isinstance(several.error, list)
+        assert np.all(
+            np.abs(several.expectation_values - separate.expectation_values)
+            < 5 * np.array(several.error)
+        )
+
+
+def test_several_expectation_measures_allocation():
+    circuit = QCircuit([H(0), Ry(0.4, 1), CNOT(0, 1)])
+    optimized = ExpectationMeasure(
+        Observable(Pauli_Z @ Pauli_Z + Pauli_X @ Pauli_X),
+        [0, 1],
+        4000,
+        optimize_shots=True,
+    )
+    fixed = ExpectationMeasure(Observable(Pauli_Z @ Pauli_I), [0, 1], 100)
+    result = run(circuit + QCircuit([optimized, fixed]), MPQPDevice.STATEVECTOR)
+    assert isinstance(result, Result)
+    # the group {ZZ, ZI} gets the 2000 shots allocated by the first measure,
+    # which are shared with the second one, and {XX} gets the other 2000
+    assert result.shots == 4000
+    exact = run(
+        circuit
+        + QCircuit(
+            [
+                ExpectationMeasure(optimized.observable, [0, 1]),
+                ExpectationMeasure(fixed.observable, [0, 1]),
+            ]
+        ),
+        MPQPDevice.STATEVECTOR,
+    )
+    assert isinstance(exact, Result) and isinstance(result.error, list)
+    assert np.all(
+        np.abs(result.expectation_values - exact.expectation_values)
+        < 5 * np.array(result.error)
+    )
+
+
+def test_several_exact_expectation_measures_without_state_vector(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    circuit = QCircuit(
+        [
+            H(0),
+            CNOT(0, 1),
+            ExpectationMeasure(Observable(Pauli_X @ Pauli_X), [0, 1]),
+            ExpectationMeasure(Observable(Pauli_Z), [1]),
+        ]
+    )
+    expected = run(circuit, MPQPDevice.STATEVECTOR)
+    monkeypatch.setattr(MPQPDevice, "supports_state_vector", lambda self: False)
+    result = run(circuit, MPQPDevice.STATEVECTOR)
+    assert isinstance(result, Result) and isinstance(expected, Result)
+    assert np.allclose(result.expectation_values, expected.expectation_values)
+    assert np.allclose(result.expectation_values, [1, 0])
+
+
+def test_mixed_exact_and_sampled_expectation_measures():
+    circuit = QCircuit(
+        [
+            H(0),
+            ExpectationMeasure(Observable(Pauli_X), [0]),
+            ExpectationMeasure(Observable(Pauli_Z), [0], 100),
+        ]
+    )
+    with pytest.raises(ValueError):
+        run(circuit, MPQPDevice.STATEVECTOR)
+
+
+def test_light_cone_reduction():
+    gates = []
+    for layer in range(2):
+        gates += [Ry(0.1 * (q + 1) + layer, q) for q in range(30)]
+        gates += [CNOT(q, q + 1) for q in range(layer % 2, 29, 2)]
+    wide = QCircuit(gates)
+    measure = ExpectationMeasure(Observable(Pauli_Z @ Pauli_X), [15, 14])
+    job = generate_job(wide + QCircuit([measure]), MPQPDevice.STATEVECTOR)
+    assert job.circuit.nb_qubits < 10 and job.pruned_from is not None
+    assert job.pruned_from.circuit.nb_qubits == 30
+    reduced = run(wide + QCircuit([measure]), MPQPDevice.STATEVECTOR)
+    assert isinstance(reduced, Result) and reduced.job.circuit.nb_qubits == 30
+    sampled_measure = ExpectationMeasure(
+        Observable(Pauli_Z @ Pauli_X), [15, 14], 100, grouping="qubitwise"
+    )
+    sampled = run(wide + QCircuit([sampled_measure]), MPQPDevice.STATEVECTOR)
+    assert isinstance(sampled, Result) and sampled.job.circuit.nb_qubits == 30
+
+    narrow = QCircuit(
+        [gate for gate in wide.gates if max(gate.connections()) < 20],
+        nb_qubits=20,
+    )
+    reference = run(narrow + QCircuit([measure]), MPQPDevice.STATEVECTOR)
+    assert isinstance(reduced, Result) and isinstance(reference, Result)
+    assert np.isclose(reduced.expectation_value, reference.expectation_value)
+
+
+def test_light_cone_reduction_skipped_with_noise():
+    circuit = QCircuit(
+        [H(0), CNOT(0, 1), X(2), ExpectationMeasure(Observable(Pauli_Z), [0])]
+    )
+    circuit.add(Depolarizing(0.1))
+    assert (
+        generate_job(circuit, AWSDevice.BRAKET_LOCAL_SIMULATOR).circuit.nb_qubits == 3
+    )
+
+
+@pytest.mark.parametrize("device", [MPQPDevice.STATEVECTOR, IBMDevice.AER_SIMULATOR])
+def test_pruned_sample_job(device: MPQPDevice | IBMDevice):
+    circuit = QCircuit(
+        [
+            X(0),
+            CNOT(0, 1),
+            H(2),
+            CNOT(2, 4),
+            X(3),
+            BasisMeasure([3, 1], shots=100, prune=True),
+        ]
+    )
+    job = generate_job(circuit, device)
+    assert job.circuit.nb_qubits == 3 and job.pruned_from is not None
+    assert job.pruned_from.circuit.nb_qubits == 5
+
+    result = run(circuit, device)
+    assert isinstance(result, Result)
+    assert result.job.circuit.nb_qubits == 5
+    assert result.counts == [0, 0, 0, 100]
+
+
+def test_unsupported_grouping():
+    with pytest.raises(ValueError):
+        ExpectationMeasure(Observable(np.eye(2)), [0], 100, grouping="general")
@@ -25,6 +25,7 @@ from mpqp.execution import (
     AZUREDevice,
     GOOGLEDevice,
     IBMDevice,
+    MPQPDevice,
     run,
 )
 from mpqp.execution.result import BatchResult, Result
@@ -56,6 +57,7 @@ state_vector_devices = [
     ATOSDevice.MYQLM_CLINALG,
     ATOSDevice.MYQLM_PYLINALG,
     AWSDevice.BRAKET_LOCAL_SIMULATOR,
+    MPQPDevice.STATEVECTOR,
 ]
 
 sampling_devices = [
@@ -64,6 +66,7 @@ sampling_devices = [
     ATOSDevice.MYQLM_CLINALG,
     ATOSDevice.MYQLM_PYLINALG,
     AWSDevice.BRAKET_LOCAL_SIMULATOR,
+    MPQPDevice.STATEVECTOR,
 ]
 
 
@@ -127,8 +130,7 @@ def hae_3_qubit_circuit(
 def test_state_vector_result_HEA_ansatz(
     parameters: list[float], expected_vector: npt.NDArray[np.complex64]
 ):
-    with pytest.warns(UnsupportedBraketFeaturesWarning):
-        batch = run(hae_3_qubit_circuit(*parameters), state_vector_devices)
+    batch = run(hae_3_qubit_circuit(*parameters), state_vector_devices)
     assert isinstance(batch, BatchResult)
     for result in batch:
         assert matrix_eq(result.amplitudes, expected_vector)
@@ -197,8 +199,7 @@ def test_state_vector_result_HEA_ansatz(
     ],
 )
 def test_state_vector_various_native_gates(gates: list[Gate], expected_vector: Matrix):
-    with pytest.warns(UnsupportedBraketFeaturesWarning):
-        batch = run(QCircuit(gates), state_vector_devices)
+    batch = run(QCircuit(gates), state_vector_devices)
     assert isinstance(batch, BatchResult)
     for result in batch:
         if isinstance(result.device, GOOGLEDevice):
@@ -246,8 +247,7 @@ def test_state_vector_various_native_gates(gates: list[Gate], expected_vector: M
 def test_sample_basis_state_in_samples(gates: list[Gate], basis_states: list[str]):
     c = QCircuit(gates)
     c.add(BasisMeasure(list(range(c.nb_qubits)), shots=10000))
-    with pytest.warns(UnsupportedBraketFeaturesWarning):
-        batch = run(c, sampling_devices)
+    batch = run(c, sampling_devices)
     assert isinstance(batch, BatchResult)
     nb_states = len(basis_states)
     for result in batch:
@@ -271,7 +271,11 @@ def test_sample_counts_in_trust_interval(instructions: list[Gate]):
     assert isinstance(res, Result)
     expected_counts = [int(count) for count in np.round(shots * res.probabilities)]
     c.add(BasisMeasure(list(range(c.nb_qubits)), shots=shots))
-    with pytest.warns(UnsupportedBraketFeaturesWarning):
+    with (
+        pytest.warns(UnsupportedBraketFeaturesWarning)
+        if any(isinstance(gate, CustomGate) for gate in instructions)
+        else contextlib.suppress()
+    ):
         batch = run(c, sampling_devices)
     assert isinstance(batch, BatchResult)
     for result in batch:
@@ -320,8 +324,7 @@ def test_observable_ideal_case(
     expected_value = (
         expected_vector.transpose().conjugate().dot(observable.dot(expected_vector))
     )
-    with pytest.warns(UnsupportedBraketFeaturesWarning):
-        batch = run(c, sampling_devices)
+    batch = run(c, sampling_devices)
     assert isinstance(batch, BatchResult)
     for result in batch:
         assert abs(result.expectation_value - expected_value) < (
@@ -357,7 +360,8 @@ def circuits_type():
     + list(ATOSDevice)
     + list(AWSDevice)
     + list(GOOGLEDevice)
-    + list(AZUREDevice),
+    + list(AZUREDevice)
+    + list(MPQPDevice),
 )
 def test_validity_run_job_type(device: AvailableDevice, circuits_type: list[QCircuit]):
     circuit_state_vector = circuits_type[0]
@@ -367,23 +371,13 @@ def test_validity_run_job_type(device: AvailableDevice, circuits_type: list[QCir
 
     if not device.is_remote():
         if device.supports_samples():
-            with (
-                pytest.warns(UnsupportedBraketFeaturesWarning)
-                if isinstance(device, AWSDevice)
-                else contextlib.suppress()
-            ):
-                assert run(circuit_samples, device) is not None
+            assert run(circuit_samples, device) is not None
         else:
             with pytest.raises(NotImplementedError):
                 run(circuit_samples, device)
 
         if device.supports_state_vector():
-            with (
-                pytest.warns(UnsupportedBraketFeaturesWarning)
-                if isinstance(device, AWSDevice)
-                else contextlib.suppress()
-            ):
-                assert run(circuit_state_vector, device) is not None
+            assert run(circuit_state_vector, device) is not None
         else:
             if isinstance(device, IBMDevice) and not device.supports_state_vector():
                 with pytest.raises(DeviceJobIncompatibleError):
@@ -399,12 +393,7 @@ def test_validity_run_job_type(device: AvailableDevice, circuits_type: list[QCir
                 circuit_observable.measurements[0].shots = 10
                 assert run(circuit_observable, device) is not None
             else:
-                with (
-                    pytest.warns(UnsupportedBraketFeaturesWarning)
-                    if isinstance(device, AWSDevice)
-                    else contextlib.suppress()
-                ):
-                    assert run(circuit_observable, device) is not None
+                assert run(circuit_observable, device) is not None
 
         else:
             if isinstance(device, IBMDevice):
@@ -421,12 +410,7 @@ def test_validity_run_job_type(device: AvailableDevice, circuits_type: list[QCir
                 circuit_observable_ideal.measurements[0].shots = 10
                 assert run(circuit_observable_ideal, device) is not None
             else:
-                with (
-                    pytest.warns(UnsupportedBraketFeaturesWarning)
-                    if isinstance(device, AWSDevice)
-                    else contextlib.suppress()
-                ):
-                    assert run(circuit_observable_ideal, device) is not None
+                assert run(circuit_observable_ideal, device) is not None
         else:
             if isinstance(device, IBMDevice):
                 with pytest.raises(DeviceJobIncompatibleError):
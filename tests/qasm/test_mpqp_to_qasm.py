@@ -2,9 +2,10 @@ import pytest
 
 from mpqp.all import *
 from mpqp.tools.circuit import random_circuit
-from mpqp.qasm.mpqp_to_qasm import mpqp_to_qasm2
-from mpqp.qasm.open_qasm_2_and_3 import remove_user_gates
+from mpqp.qasm.mpqp_to_qasm import mpqp_to_qasm2, mpqp_to_qasm3
+from mpqp.qasm.open_qasm_2_and_3 import open_qasm_2_to_3, remove_user_gates
 from mpqp.tools.display import format_element
+from mpqp.tools.errors import OpenQASMTranslationWarning
 
 
 @pytest.mark.parametrize(
@@ -523,3 +524,42 @@ def test_random_mpqp_to_qasm():
         assert isinstance(mpqp_qasm, str)
         mpqp_qasm = normalize_string(mpqp_qasm)
         assert qiskit_qasm == mpqp_qasm
+
+
+def test_random_mpqp_to_qasm3():
+    for _ in range(15):
+        qcircuit = random_circuit(nb_qubits=4, nb_gates=20)
+        qcircuit.add(
+            [
+                CustomGate(UnitaryMatrix(np.kron(X(0).to_matrix(), np.eye(2))), [1, 2]),
+                Barrier(),
+                BasisMeasure([0, 3], c_targets=[1, 0]),
+            ]
+        )
+        qasm2_code, gphase = mpqp_to_qasm2(qcircuit)
+        qasm3_code, qasm3_gphase = mpqp_to_qasm3(qcircuit, translation_warning=False)
+        assert qasm3_gphase == gphase
+        assert normalize_string(qasm3_code) == normalize_string(
+            open_qasm_2_to_3(qasm2_code, translation_warning=False)
+        )
+
+
+def test_mpqp_to_qasm3_symbolic():
+    theta, k = symbols("θ k")
+    qcircuit = QCircuit([Rx(theta, 0), U(theta, 2 * theta, 0, 1), CRk(k, 0, 1)])
+    qasm3_code, _ = mpqp_to_qasm3(qcircuit, translation_warning=False)
+    assert (
+        qasm3_code
+        == """OPENQASM 3.0;
+include "stdgates.inc";
+input float θ;
+input float k;
+
+qubit[2] q;
+rx(θ) q[0];
+u3(θ,2*θ,0) q[1];
+cp(2**(1 - k)*pi) q[0],q[1];
+"""
+    )
+    with pytest.warns(OpenQASMTranslationWarning):
+        mpqp_to_qasm3(qcircuit)
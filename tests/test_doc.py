@@ -16,6 +16,7 @@ from numpy.random import default_rng
 from mpqp.all import *
 from mpqp.core.instruction.measurement import pauli_string
 from mpqp.core.instruction.measurement.pauli_string import PauliString
+from mpqp.core.instruction.measurement.pauli_string_array import PauliStringArray
 from mpqp.execution import BatchResult
 from mpqp.execution.connection.env_manager import (
     MPQP_CONFIG_PATH,
@@ -24,7 +25,13 @@ from mpqp.execution.connection.env_manager import (
     load_env_variables,
     save_env_variable,
 )
-from mpqp.execution.providers.aws import estimate_cost_single_job
+from mpqp.execution.providers.atos import mpqp_to_myqlm_Circuit
+from mpqp.execution.providers.aws import (
+    estimate_cost_single_job,
+    mpqp_to_braket_Circuit,
+)
+from mpqp.execution.providers.google import mpqp_to_cirq_Circuit
+from mpqp.execution.providers.native import simulate_state_vector
 from mpqp.execution.runner import generate_job
 from mpqp.noise.noise_model import _plural_marker  # pyright: ignore[reportPrivateUsage]
 from mpqp.qasm import (
@@ -33,7 +40,7 @@ from mpqp.qasm import (
     qasm2_to_Qiskit_Circuit,
     qasm3_to_braket_Program,
 )
-from mpqp.qasm.mpqp_to_qasm import mpqp_to_qasm2
+from mpqp.qasm.mpqp_to_qasm import mpqp_to_qasm2, mpqp_to_qasm3
 from mpqp.qasm.open_qasm_2_and_3 import (
     convert_instruction_3_to_2,
     open_qasm_2_to_3,
@@ -52,8 +59,10 @@ from mpqp.tools.errors import (
     OpenQASMTranslationWarning,
     UnsupportedBraketFeaturesWarning,
 )
-from mpqp.tools.generics import find, find_index, flatten
+from mpqp.tools.generics import find, find_index, flatten, structural_key
 from mpqp.tools.maths import *
+from mpqp.tools.optimization import *
+from mpqp.core.conversion_cache import CONVERSION_CACHE, ConversionCache
 from mpqp.tools.maths import (
     is_hermitian,
     is_power_of_two,
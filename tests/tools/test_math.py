@@ -3,7 +3,14 @@ import pytest
 from sympy import symbols
 
 from mpqp.tools.generics import Matrix
-from mpqp.tools.maths import is_hermitian, rand_hermitian_matrix
+from mpqp.gates import CNOT, H, X
+from mpqp.tools.maths import (
+    block_matrix,
+    group_gates,
+    is_hermitian,
+    matrix_eq,
+    rand_hermitian_matrix,
+)
 
 x = symbols("x", real=True)
 
@@ -25,3 +32,19 @@ def test_is_hermitian(matrix: Matrix, isHermitian: bool):
 
 def test_rand_hermitian():
     assert is_hermitian(rand_hermitian_matrix(3))
+
+
+@pytest.mark.parametrize(
+    "contiguous, expected_qubits",
+    [(False, [[0, 2], [1, 3]]), (True, [[0, 1, 2], [1, 2, 3]])],
+)
+def test_group_gates(contiguous: bool, expected_qubits: list[list[int]]):
+    gates = [H(0), CNOT(2, 0), X(1), CNOT(1, 3)]
+    groups = group_gates(gates, 3 if contiguous else 2, contiguous)
+    assert [qubits for _, qubits in groups] == expected_qubits
+    assert [gate for group, _ in groups for gate in group] == gates
+
+
+def test_block_matrix():
+    expected = CNOT(1, 0).to_matrix() @ np.kron(np.eye(2), H(0).to_matrix())
+    assert matrix_eq(block_matrix([H(1), CNOT(1, 0)], [0, 1]), expected)